@@ -316,6 +316,9 @@ class QwiicIcm20948(object):
 		# Did the user specify an I2C address?
 		self.address = address if address != None else self.available_addresses[0]
 
+		# Bank currently selected in REG_BANK_SEL, None if unknown
+		self._bank = None
+
 		# load the I2C driver if one isn't provided
 
 		if i2c_driver == None:
@@ -347,16 +350,26 @@ class QwiicIcm20948(object):
 	# Sets the bank register of the ICM20948 module
 	def setBank(self, bank):
 		"""!
-		Sets the bank register of the ICM20948 module
+		Sets the bank register of the ICM20948 module. The register is only
+		written when the bank changes.
 
 		@return **bool** Returns true if the bank was a valid value and it was set, otherwise False.
 		"""
 		if bank > 3:	# Only 4 possible banks
 			print("Invalid Bank value: %d" % bank)
-			return False			   
-		bank = ((bank << 4) & 0x30) # bits 5:4 of REG_BANK_SEL
+			return False
+		if bank == self._bank:
+			return True
+		bankBits = ((bank << 4) & 0x30) # bits 5:4 of REG_BANK_SEL
 		#return ICM_20948_execute_w(pdev, REG_BANK_SEL, &bank, 1)
-		return self._i2c.writeByte(self.address, self.REG_BANK_SEL, bank)
+		try:
+			result = self._i2c.writeByte(self.address, self.REG_BANK_SEL, bankBits)
+		except:
+			# Don't know whether the write made it
+			self._bank = None
+			raise
+		self._bank = bank
+		return result
 
 	# ----------------------------------
 	# swReset()
@@ -377,7 +390,11 @@ class QwiicIcm20948(object):
 
 		# Write register
 		self.setBank(0)
-		return self._i2c.writeByte(self.address, self.AGB0_REG_PWR_MGMT_1, register)		
+		result = self._i2c.writeByte(self.address, self.AGB0_REG_PWR_MGMT_1, register)
+
+		# The reset selects bank 0 again, but select it explicitly next time
+		self._bank = None
+		return result
 
 	# ----------------------------------
 	# sleep()
@@ -980,7 +997,8 @@ class QwiicIcm20948(object):
 
 		@return **bool** Returns true of the initializtion was successful, otherwise False.
 		"""
-		# are we who we need to be?
+		# are we who we need to be? The bank may have been changed by someone else.
+		self._bank = None
 		self.setBank(0)
 		chipID = self._i2c.readByte(self.address, self.AGB0_REG_WHO_AM_I)
 		if not chipID in _validChipIDs:
@@ -232,11 +232,15 @@ class QwiicAlphanumeric(object):
     colon_on_off = 0    # Tracks the on/off state of the colon segment
     blink_rate = ALPHA_BLINK_RATE_NOBLINK   # Tracks the current blinking status
 
-    display_RAM = [0] * 16 * 4
     display_content = [' '] * (4 * 4 + 1)
 
     def __init__(self, address=None, i2c_driver=None):
 
+        # RAM contents of every display, 16 bytes each
+        self.display_RAM = bytearray(16 * 4)
+        # Writes of display_RAM to the displays, built by update_display()
+        self._display_batch = None
+
         # Did the user specify an I2C address?
         if address in self.available_addresses:
             self.address = address
@@ -286,6 +290,9 @@ class QwiicAlphanumeric(object):
         else:
             self.number_of_displays = 1
 
+        # The display writes are rebuilt for the new addresses
+        self._display_batch = None
+
         for i in range(1, self.number_of_displays + 1):
             if self.is_connected(i) == False:
                 return False
@@ -984,14 +991,19 @@ class QwiicAlphanumeric(object):
 
         @return **bool** true if displays are updated successfully, false otherwise.
         """
-        status = True
-
-        for i in range(1, self.number_of_displays + 1):
-            
-            if self.write_RAM(self.look_up_display_address(i), 0, self.display_RAM[(i-1)*16:(i*16)-1]) == False:
-                status = False
+        batch = self._display_batch
+        if batch is None:
+            # Queued once with a view of each display's RAM, so executing it
+            # sends whatever is in display_RAM
+            batch = self._i2c.batch()
+            ram = memoryview(self.display_RAM)
+            for i in range(1, self.number_of_displays + 1):
+                batch.write(self.look_up_display_address(i), 0, ram[(i-1)*16:(i*16)-1])
+            self._display_batch = batch
+
+        batch.execute()
         
-        return status
+        return True
     
     # ---------------------------------------------------------------------------------
     # shift_right(shift_amt)
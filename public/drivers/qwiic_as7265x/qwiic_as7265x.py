@@ -343,6 +343,21 @@ class QwiicAS7265x(object):
         
         # Readings can now be accessed via getCalibratedA(), getJ(), etc.
 
+    async def take_measurements_async(self):
+        """!
+        Same as take_measurements(), but lets other asyncio tasks run while
+        polling for the data ready flag
+        """
+        # Set mode to all 6-channels, one-shot
+        self.set_measurement_mode(self.kMeasurementMode6ChanOneShot)
+
+        timeWaited = 0
+        while self.data_available() == False:
+            if timeWaited > self._maxWaitTime:
+                return
+            await qwiic_i2c.asyncSleepMs(self.kPollingDelay)
+            timeWaited += self.kPollingDelay
+
     def take_measurements_with_bulb(self):
         """!
         Turns on all bulbs, takes measurements of all channels, turns off all bulbs
@@ -357,6 +372,21 @@ class QwiicAS7265x(object):
         self.disable_bulb(self.kLedIr)
         self.disable_bulb(self.kLedUv)
 
+    async def take_measurements_with_bulb_async(self):
+        """!
+        Same as take_measurements_with_bulb(), but lets other asyncio tasks run
+        while the measurements are taken
+        """
+        self.enable_bulb(self.kLedWhite)
+        self.enable_bulb(self.kLedIr)
+        self.enable_bulb(self.kLedUv)
+
+        await self.take_measurements_async()
+
+        self.disable_bulb(self.kLedWhite)
+        self.disable_bulb(self.kLedIr)
+        self.disable_bulb(self.kLedUv)
+
     def enable_indicator(self):
         """!
         Enable the onboard indicator LED
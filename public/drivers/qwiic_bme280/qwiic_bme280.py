@@ -514,6 +514,31 @@ class QwiicBme280(object):
         stat = self._i2c.readByte(self.address, self.BME280_STAT_REG)
         return  True if stat & (1<<3) else False # If the measuring bit (3) is set, return true
 
+    #----------------------------------------------------------------
+    # Take a forced mode measurement without blocking other asyncio tasks
+    async def measure_forced_async(self, timeoutMillis = 150, pollMillis = 2):
+        """!
+        Takes a single measurement in forced mode, letting other asyncio tasks
+        run during the conversion. The sensor goes back to sleep mode when it's
+        done, and the values can be read with the usual methods.
+
+        @param timeoutMillis: How long to wait for the measurement, in milliseconds.
+                    The default covers 16x oversampling of all three sensors.
+        @param pollMillis: How often to check whether the measurement is done, in milliseconds
+
+        @return **bool** True if the measurement completed, False on timeout
+        """
+        self.set_mode(self.MODE_FORCED)
+
+        timeWaited = 0
+        while self.get_mode() == self.MODE_FORCED or self.is_measuring():
+            if timeWaited >= timeoutMillis:
+                return False
+            await qwiic_i2c.asyncSleepMs(pollMillis)
+            timeWaited += pollMillis
+
+        return True
+
 
     # Strictly resets.  Run .begin() afterwards
     def reset( self ):
@@ -137,7 +137,7 @@ class QwiicGPIO(object):
 
         @return **bool** True if the device is connected, otherwise False.
         """
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     # ----------------------------------
     # begin()
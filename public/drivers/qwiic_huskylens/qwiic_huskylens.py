@@ -148,6 +148,9 @@ class QwiicHuskylens(object):
         self.nLearned = 0 # The number of objects/IDs already learned
         self.idToName = {} # A dictionary of IDs to names for learned objects
 
+        # Reusable receive buffer: 5 header bytes, up to 255 data bytes and the checksum
+        self._rxBuffer = bytearray(261)
+
     def _checksum(self, pkt):
         """!
         Calculate the checksum for a packet to be sent to the Huskylens
@@ -201,19 +204,21 @@ class QwiicHuskylens(object):
         @return _Response: The response from the Huskylens
         """
         # Sometimes we receive some invalid bytes before the address so we want to read until we get the first header byte
-        readBytes = [0]
+        readBytes = self._rxBuffer
+        readBytes[0] = 0
         while readBytes[0] != 0x55:
             readBytes[0] = self._i2c.read_byte(self.address)
 
         # First read the header, address, data length and command bytes
         # so we know how much data we expect.
-        readBytes.extend(list(self._i2c.read_block(self.address, None, 4)))
+        self._i2c.read_block_into(self.address, None, readBytes, 1, 4)
 
         # Read the rest of the data
         leftToRead = readBytes[3] + 1 # Data length + 1 byte for checksum
-        readBytes.extend(list(self._i2c.read_block(self.address, None, leftToRead)))
+        self._i2c.read_block_into(self.address, None, readBytes, 5, leftToRead)
 
-        return self._Response(readBytes)
+        # The response only views the receive buffer, so it must be handled before the next read
+        return self._Response(memoryview(readBytes)[:5 + leftToRead])
 
     def request_knock(self):
         """!
@@ -64,28 +64,92 @@ New to qwiic? Take a look at the entire [SparkFun qwiic ecosystem](https://www.s
 #-----------------------------------------------------------------------------
 # Drivers and driver baseclass
 from .i2c_driver import I2CDriver
+from .device_registry import kStandardMode, kFastMode, kFastModePlus, registerDevice, register_device, \
+	driverNames, driver_names, negotiateFreq, negotiate_freq
+
+import sys
+
+# Optional facilities and the submodules they're in. They're imported the first
+# time they're used, so a program that only needs the bus doesn't load them. They
+# can also be imported from the submodule, e.g. from qwiic_i2c.scheduler import Scheduler
+_optional_names = {
+	"Transaction": "transaction",
+	"stats": "i2c_stats",
+	"resetStats": "i2c_stats",
+	"reset_stats": "i2c_stats",
+	"enableStats": "i2c_stats",
+	"enable_stats": "i2c_stats",
+	"disableStats": "i2c_stats",
+	"disable_stats": "i2c_stats",
+	"asyncSleepMs": "async_sleep",
+	"async_sleep_ms": "async_sleep",
+	"Scheduler": "scheduler",
+	"dataReadyCheck": "scheduler",
+	"data_ready_check": "scheduler",
+	"ShadowRegisters": "shadow_registers"
+}
+
+def __getattr__(name):
+	module_name = _optional_names.get(name)
+	if module_name is None:
+		raise AttributeError("module 'qwiic_i2c' has no attribute '%s'" % name)
+
+	sub_module = __import__("qwiic_i2c." + module_name, None, None, [None])
+	return getattr(sub_module, name)
 
 # All supported platform module and class names
 _supported_platforms = {
 	"linux_i2c": "LinuxI2C",
 	"circuitpython_i2c": "CircuitPythonI2C",
-	"micropython_i2c": "MicroPythonI2C"
+	"micropython_i2c": "MicroPythonI2C",
+	"simulated_i2c": "SimulatedI2C"
 }
 
-# List of platform drivers found on this system
-_drivers = []
+# Driver class for this platform, looked up the first time a driver is needed.
+# Kept in a list so the module never rebinds a global, which also works when the
+# package is frozen into the firmware.
+_driver_class = []
+
+def _platformModules():
+	# The platform modules that can work here, most likely first. Only these are
+	# imported, so a board doesn't pay for failed imports of the others.
+	name = getattr(getattr(sys, "implementation", None), "name", None)
+
+	if name == "micropython":
+		return ("micropython_i2c",)
+
+	if name == "circuitpython":
+		return ("circuitpython_i2c",)
+
+	# CPython, the simulated bus is only picked when asked for
+	modules = ("simulated_i2c",)
+	if sys.platform.startswith("linux"):
+		modules += ("linux_i2c",)
+	return modules
+
+def _getDriverClass():
+	if not _driver_class:
+		driverClass = None
+		for module_name in _platformModules():
+			try:
+				sub_module = __import__("qwiic_i2c." + module_name, None, None, [None])
+			except ImportError:
+				continue
 
-# Loop through all supported platform drivers, see if they're included, and
-# append them to the driver list if so
-for module_name, class_name in _supported_platforms.items():
-	try:
-		sub_module = __import__("qwiic_i2c." + module_name, None, None, [None])
-		_drivers.append(getattr(sub_module, class_name))
-	except:
-		pass
+			candidate = getattr(sub_module, _supported_platforms[module_name])
+			if candidate.isPlatform():
+				driverClass = candidate
+				break
+
+		_driver_class.append(driverClass)
+
+	return _driver_class[0]
 
 _default_driver = None
 
+# Bus clock set with setDefaultFreq(), None to pick it from the attached devices
+_freq_override = None
+
 #-------------------------------------------------
 # Exported method to get the I2C driver for the execution plaform. 
 #
@@ -96,6 +160,11 @@ def getI2CDriver(*args, **argk):
 
 		Returns the qwiic I2C driver object for current platform.
 
+		The default driver (no parameters) has its bus clock set once, when it's
+		created, to the one set with setDefaultFreq(), or else to the fastest one
+		every device found on the bus supports (see negotiateFreq()). If the bus has
+		an unknown device, or none, the platform's default clock is kept.
+
 		:return: A qwiic I2C driver object for the current platform.
 		:rtype: object
 
@@ -111,21 +180,22 @@ def getI2CDriver(*args, **argk):
 	if len(argk) == 0 and _default_driver != None:
 		return _default_driver
 	
-	# Loop through all the drivers to find the one for this platform
-	for driverClass in _drivers:
-		if driverClass.isPlatform():
-			# Found it!
-			driver = driverClass(*args, **argk)
-
-			# If no parameters are provided, set this as the default driver
-			if len(argk) == 0:
-				_default_driver = driver
-			
-			# And return it
-			return driver
-	
-	# If we get here, we didn't find a driver for this platform
-	return None
+	# Find the driver for this platform
+	driverClass = _getDriverClass()
+	if driverClass is None:
+		# We didn't find a driver for this platform
+		return None
+
+	driver = driverClass(*args, **argk)
+
+	# If no parameters are provided, set this as the default driver. Its clock is
+	# picked once, here; drivers made with parameters are left as configured.
+	if len(argk) == 0:
+		_setBusFreq(driver)
+		_default_driver = driver
+
+	# And return it
+	return driver
 
 def get_i2c_driver(*args, **argk):
 	"""
@@ -144,6 +214,124 @@ def get_i2c_driver(*args, **argk):
 	"""
 	return getI2CDriver(*args, **argk)
 
+#-------------------------------------------------
+# Bus clock selection
+
+def _setBusFreq(driver):
+	freq = _freq_override
+	if freq is None:
+		# The driver starts at the platform's default clock
+		try:
+			addresses = driver.scan()
+		except:
+			addresses = None
+		if addresses is None:
+			return
+		freq = negotiateFreq(addresses)
+		if freq is None:
+			# Nothing to go by, keep the default clock
+			return
+
+	if driver.getFreq() != freq:
+		driver.setFreq(freq)
+
+def setDefaultFreq(freq):
+	"""
+	.. function:: setDefaultFreq()
+
+		Overrides the bus clock picked from the attached devices. Applies to the default
+		driver, now if it already exists, otherwise when it is created.
+
+		:param freq: The bus clock in Hz, or None to go back to picking it from the
+			attached devices
+
+		:return: None
+
+		:example:
+
+		>>> import qwiic_i2c
+		>>> qwiic_i2c.setDefaultFreq(qwiic_i2c.kFastMode)
+	"""
+	global _freq_override
+	_freq_override = freq
+
+	if _default_driver != None:
+		_setBusFreq(_default_driver)
+
+def set_default_freq(freq):
+	"""
+	.. function:: set_default_freq()
+
+		Overrides the bus clock picked from the attached devices. Applies to the default
+		driver, now if it already exists, otherwise when it is created.
+
+		:param freq: The bus clock in Hz, or None to go back to picking it from the
+			attached devices
+
+		:return: None
+	"""
+	return setDefaultFreq(freq)
+
+#-------------------------------------------------
+# Devices found on the bus
+
+def devices(*args, **argk):
+	"""
+	.. function:: devices()
+
+		Returns the devices found on the bus. The bus is scanned again only if the
+		last scan is older than the scan cache's time to live.
+
+		:return: For each address, the time it was last seen (ms) and the names of the
+			drivers for devices that can be at it
+		:rtype: dict
+
+		:example:
+
+		>>> import qwiic_i2c
+		>>> qwiic_i2c.devices()
+		{23: {'last_seen': 1520, 'drivers': ['QwiicOTOS']}}
+	"""
+	i2c = getI2CDriver(*args, **argk)
+
+	if not i2c:
+		print("Unable to load the I2C driver for this device")
+		return {}
+
+	if not i2c.scanCache.isScanFresh():
+		i2c.scan()
+
+	return i2c.scanCache.devices()
+
+def invalidateScan(address = None):
+	"""
+	.. function:: invalidateScan()
+
+		Forgets the cached scan results of the default driver, so the next check
+		probes the bus. Needed after a device changes address or is unplugged.
+
+		:param address: The address to forget, or None to forget everything
+
+		:return: None
+	"""
+	i2c = getI2CDriver()
+
+	if i2c:
+		i2c.invalidateScan(address)
+
+def invalidate_scan(address = None):
+	"""
+	.. function:: invalidate_scan()
+
+		Forgets the cached scan results of the default driver, so the next check
+		probes the bus. Needed after a device changes address or is unplugged.
+
+		:param address: The address to forget, or None to forget everything
+
+		:return: None
+	"""
+	return invalidateScan(address)
+
 #-------------------------------------------------
 # Method to determine if a particular device (at the provided address)
 # is connected to the bus.
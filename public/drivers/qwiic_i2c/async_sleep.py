@@ -0,0 +1,87 @@
+#-----------------------------------------------------------------------------
+# async_sleep.py
+#
+# Awaitable delays for the async variants of the qwiic drivers.
+#
+# Drivers for sensors with slow conversions offer `_async` methods, which wait
+# with these instead of time.sleep() so other tasks keep running. MicroPython
+# provides asyncio (or uasyncio on older firmware) with a millisecond sleep,
+# CPython only has asyncio.sleep() in seconds. asyncio is only imported the
+# first time a delay is awaited, so programs that don't use it don't pay for it.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+async_sleep
+============
+Awaitable millisecond delays that work with MicroPython and CPython asyncio.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> async def blink(led):
+	...     led.on()
+	...     await qwiic_i2c.asyncSleepMs(100)
+	...     led.off()
+
+"""
+
+# The sleep function, looked up on first use
+_sleep = []
+
+def _getSleep():
+	if not _sleep:
+		try:
+			import asyncio
+		except ImportError:
+			import uasyncio as asyncio
+
+		sleepMs = getattr(asyncio, "sleep_ms", None)
+		if sleepMs is None:
+			# CPython
+			sleep = asyncio.sleep
+			def sleepMs(ms):
+				return sleep(ms / 1000)
+
+		_sleep.append(sleepMs)
+
+	return _sleep[0]
+
+async def asyncSleepMs(ms):
+	"""
+		Waits for a number of milliseconds, letting other asyncio tasks run.
+
+		:param ms: How long to wait, in milliseconds
+
+		:return: None
+	"""
+	await _getSleep()(ms)
+
+async def async_sleep_ms(ms):
+	await _getSleep()(ms)
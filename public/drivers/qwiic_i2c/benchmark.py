@@ -0,0 +1,370 @@
+#-----------------------------------------------------------------------------
+# benchmark.py
+#
+# Throughput benchmarks for the hot paths of the qwiic drivers.
+#
+# Each benchmark runs a driver call against device models on the simulated I2C
+# bus and reports, per call: transactions, bytes on the wire, simulated bus
+# time, host Python time and memory allocated. Results are written as JSON so
+# they can be compared between driver versions; pass a previous result file
+# with --baseline to fail on regressions.
+#
+# This runs on a host with CPython, from the drivers directory:
+#
+#	python -m qwiic_i2c.benchmark -o results.json
+#	python -m qwiic_i2c.benchmark --baseline results.json
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+benchmark
+============
+Driver throughput benchmarks over the simulated I2C bus.
+
+:example:
+
+	>>> from qwiic_i2c import benchmark
+	>>> results = benchmark.run(iterations = 100, freq = 400000)
+	>>> results["benchmarks"]["otos.getPosVelAcc"]["transactions_per_call"]
+	1.0
+
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .simulated_i2c import SimulatedI2C, SimulatedDevice
+from .simulated_devices import SimulatedOTOS, SimulatedVL53L5CX, SimulatedMAX3010x, SimulatedTitanGps
+
+# Format version of the JSON results
+_RESULTS_VERSION = 1
+
+# The drivers directory, this package's parent
+_DRIVERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Metrics that only depend on the driver code, not on the host. Any increase in
+# these is a regression.
+_EXACT_METRICS = ("transactions_per_call", "bytes_written_per_call", "bytes_read_per_call", "bus_time_us_per_call")
+
+# Metrics that depend on the host, compared with a tolerance
+_TIMED_METRICS = ("python_time_us_per_call", "alloc_bytes_per_call")
+
+#-----------------------------------------------------------------------------
+# Loading drivers
+#
+# Drivers are loaded under the module name they are installed as on the robot,
+# since some of them import each other by that name.
+
+def _loadDriver(name, path):
+	"""
+		Imports a driver module or package from the drivers directory.
+
+		:param name: The module name the driver is installed as
+		:param path: The driver file or package directory, relative to the drivers directory
+
+		:return: The driver module
+	"""
+	if name in sys.modules:
+		return sys.modules[name]
+
+	path = os.path.join(_DRIVERS_DIR, path)
+	if os.path.isdir(path):
+		spec = importlib.util.spec_from_file_location(name, os.path.join(path, "__init__.py"),
+			submodule_search_locations = [path])
+	else:
+		spec = importlib.util.spec_from_file_location(name, path)
+
+	module = importlib.util.module_from_spec(spec)
+	sys.modules[name] = module
+	try:
+		spec.loader.exec_module(module)
+	except:
+		del sys.modules[name]
+		raise
+	return module
+
+def _driverVersion(path):
+	# The version of the driver package, from its package.json
+	packageDir = path.split("/")[0]
+	try:
+		with open(os.path.join(_DRIVERS_DIR, packageDir, "package.json")) as f:
+			return json.load(f).get("version")
+	except (OSError, ValueError):
+		return None
+
+#-----------------------------------------------------------------------------
+# Benchmarks
+#
+# Each setup function attaches the device models to the bus and returns the
+# call to benchmark, plus an optional function run before every call (outside
+# of the measurements) to make new data available.
+
+# Three seconds of NMEA output from a Titan X1 with a fix
+_NMEA_BURST = (
+	"$GNGGA,172814.000,4003.2384,N,10516.3021,W,1,12,0.82,1612.3,M,-21.5,M,,*5C\r\n"
+	"$GNGSA,A,3,10,32,27,08,14,21,01,22,,,,,1.37,0.82,1.10*1B\r\n"
+	"$GNRMC,172814.000,A,4003.2384,N,10516.3021,W,0.02,41.11,170326,,,A*68\r\n"
+	"$GNVTG,41.11,T,,M,0.02,N,0.04,K,A*1F\r\n"
+)
+
+def _setupOtos(bus):
+	qwiic_otos = _loadDriver("qwiic_otos", "qwiic_otos/qwiic_otos.py")
+	model = bus.addDevice(0x17, SimulatedOTOS())
+	model.setPosition(1234, -2345, 3456)
+	model.setVelocity(100, -200, 300)
+	model.setAcceleration(10, -20, 30)
+
+	otos = qwiic_otos.QwiicOTOS(i2c_driver = bus)
+	return otos.getPosVelAcc, None
+
+def _setupIcm20948(bus):
+	qwiic_icm20948 = _loadDriver("qwiic_icm20948", "qwiic_9dof/qwiic_icm20948.py")
+	model = bus.addDevice(0x69, SimulatedDevice())
+	# Accel, gyro, temperature and the magnetometer data from the I2C master
+	model.setBlock(0x2D, bytes(range(1, 24)))
+
+	imu = qwiic_icm20948.QwiicIcm20948(i2c_driver = bus)
+	return imu.getAgmt, None
+
+def _setupVl53l5cx(bus):
+	qwiic_vl53l5cx = _loadDriver("qwiic_vl53l5cx", "qwiic_vl53l5cx")
+	model = bus.addDevice(0x29, SimulatedVL53L5CX())
+
+	# The model is already ranging, set up the driver as start_ranging() would
+	tof = qwiic_vl53l5cx.QwiicVL53L5CX(i2c_driver = bus)
+	tof.data_read_size = model.kFrameSize
+	tof.stream_count = 255
+
+	return tof.get_ranging_data, None
+
+def _setupOledDisplay(bus):
+	qwiic_oled = _loadDriver("qwiic_oled", "qwiic_oled_base")
+	bus.addDevice(0x3D, SimulatedDevice())
+
+	oled = qwiic_oled.QwiicOledBase(i2c_driver = bus)
+	return oled.display, None
+
+def _setupMax3010x(bus):
+	qwiic_max3010x = _loadDriver("qwiic_max3010x", "qwiic_max3010x")
+	model = bus.addDevice(0x57, SimulatedMAX3010x())
+
+	sensor = qwiic_max3010x.QwiicMax3010x(i2c_driver = bus)
+	sensor.setup()
+
+	# 4 samples is a 100 Hz loop at the default 400 Hz sample rate
+	def prepare():
+		model.fillFifo(4)
+
+	return sensor.check, prepare
+
+def _setupTitanGps(bus):
+	qwiic_titan_gps = _loadDriver("qwiic_titan_gps", "qwiic_titan_gps")
+	model = bus.addDevice(0x10, SimulatedTitanGps())
+
+	gps = qwiic_titan_gps.QwiicTitanGps(i2c_driver = bus)
+
+	def prepare():
+		model.feed(_NMEA_BURST)
+
+	return gps.get_nmea_data, prepare
+
+# Benchmark name, driver path (for the version) and setup function
+_benchmarks = [
+	("otos.getPosVelAcc", "qwiic_otos", _setupOtos),
+	("icm20948.getAgmt", "qwiic_9dof", _setupIcm20948),
+	("vl53l5cx.get_ranging_data", "qwiic_vl53l5cx", _setupVl53l5cx),
+	("oled_base.display", "qwiic_oled_base", _setupOledDisplay),
+	("max3010x.check", "qwiic_max3010x", _setupMax3010x),
+	("titan_gps.get_nmea_data", "qwiic_titan_gps", _setupTitanGps),
+]
+
+def names():
+	"""
+		Returns the names of the available benchmarks.
+
+		:rtype: list
+	"""
+	return [name for name, path, setup in _benchmarks]
+
+#-----------------------------------------------------------------------------
+# Running benchmarks
+
+def _measure(call, prepare, bus, iterations):
+	# Run once first so one-time work (imports, caches) isn't measured
+	if prepare is not None:
+		prepare()
+	call()
+
+	# Bus traffic and Python time
+	bus.resetCounters()
+	pythonTime = 0
+	for i in range(iterations):
+		if prepare is not None:
+			prepare()
+		start = time.perf_counter_ns()
+		call()
+		pythonTime += time.perf_counter_ns() - start
+
+	result = {
+		"transactions_per_call": bus.transactions / iterations,
+		"bytes_written_per_call": bus.bytesWritten / iterations,
+		"bytes_read_per_call": bus.bytesRead / iterations,
+		"bus_time_us_per_call": round(bus.busTime * 1e6 / iterations, 3),
+		"python_time_us_per_call": round(pythonTime / 1e3 / iterations, 3),
+	}
+
+	# Allocations, in a separate pass since tracing slows everything down. This is
+	# the peak memory allocated during the call, including memory freed again
+	# before it returns.
+	allocated = 0
+	tracemalloc.start()
+	try:
+		for i in range(iterations):
+			if prepare is not None:
+				prepare()
+			before = tracemalloc.get_traced_memory()[0]
+			tracemalloc.reset_peak()
+			call()
+			allocated += tracemalloc.get_traced_memory()[1] - before
+	finally:
+		tracemalloc.stop()
+
+	result["alloc_bytes_per_call"] = round(allocated / iterations, 1)
+
+	return result
+
+def run(iterations = 200, freq = 400000, only = None):
+	"""
+		Runs the benchmarks.
+
+		:param iterations: The number of calls to measure for each benchmark
+		:param freq: The simulated I2C bus clock in Hz
+		:param only: A list of benchmark names to run, or None to run them all
+
+		:return: The results, as a dictionary that can be written as JSON
+		:rtype: dict
+	"""
+	results = {}
+	for name, path, setup in _benchmarks:
+		if only is not None and name not in only:
+			continue
+
+		bus = SimulatedI2C(freq = freq)
+		call, prepare = setup(bus)
+
+		result = _measure(call, prepare, bus, iterations)
+		result["driver_version"] = _driverVersion(path)
+		results[name] = result
+
+	return {
+		"version": _RESULTS_VERSION,
+		"python": sys.version.split()[0],
+		"freq": freq,
+		"iterations": iterations,
+		"benchmarks": results,
+	}
+
+def compare(results, baseline, tolerance = 0.25):
+	"""
+		Compares benchmark results with a baseline.
+
+		Bus traffic is deterministic, so any increase in transactions, bytes or bus time
+		is reported. Python time and allocations vary with the host, and are only
+		reported when they grow by more than `tolerance`.
+
+		:param results: The new results, from run()
+		:param baseline: The baseline results
+		:param tolerance: The allowed relative increase of the host dependent metrics
+
+		:return: A list of regressions, as strings. Empty if there are none.
+		:rtype: list
+	"""
+	regressions = []
+	for name, result in results["benchmarks"].items():
+		old = baseline.get("benchmarks", {}).get(name)
+		if old is None:
+			continue
+
+		for metric in _EXACT_METRICS + _TIMED_METRICS:
+			if metric not in old:
+				continue
+			limit = old[metric]
+			if metric in _TIMED_METRICS:
+				limit *= 1 + tolerance
+			# Allow for rounding in the stored results
+			if result[metric] > limit + 1e-3:
+				regressions.append("%s: %s %s -> %s" % (name, metric, old[metric], result[metric]))
+
+	return regressions
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description = "Benchmark the qwiic drivers over a simulated I2C bus.")
+	parser.add_argument("-n", "--iterations", type = int, default = 200,
+		help = "calls to measure per benchmark (default: %(default)s)")
+	parser.add_argument("-f", "--freq", type = int, default = 400000,
+		help = "simulated I2C clock in Hz (default: %(default)s)")
+	parser.add_argument("-o", "--output", help = "write the JSON results to this file instead of stdout")
+	parser.add_argument("-b", "--baseline", help = "JSON results to compare with, exits with 1 on a regression")
+	parser.add_argument("-t", "--tolerance", type = float, default = 0.25,
+		help = "allowed relative increase in Python time and allocations (default: %(default)s)")
+	parser.add_argument("benchmarks", nargs = "*", metavar = "name",
+		help = "benchmarks to run, out of: " + ", ".join(names()))
+	args = parser.parse_args(argv)
+
+	for name in args.benchmarks:
+		if name not in names():
+			parser.error("unknown benchmark: " + name)
+
+	results = run(args.iterations, args.freq, args.benchmarks or None)
+
+	text = json.dumps(results, indent = 2, sort_keys = True)
+	if args.output:
+		with open(args.output, "w") as f:
+			f.write(text + "\n")
+	else:
+		print(text)
+
+	if args.baseline:
+		with open(args.baseline) as f:
+			baseline = json.load(f)
+		regressions = compare(results, baseline, args.tolerance)
+		for regression in regressions:
+			print("Regression: " + regression, file = sys.stderr)
+		if regressions:
+			return 1
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
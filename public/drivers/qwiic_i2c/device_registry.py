@@ -0,0 +1,197 @@
+#-----------------------------------------------------------------------------
+# device_registry.py
+#
+# Registry of the qwiic devices the drivers support, by I2C address.
+#
+# Each entry names a driver class, the addresses its device can use and the
+# fastest I2C clock the device supports. The registry lives here rather than on
+# the driver classes, because the bus is set up by the first driver created,
+# before the other driver modules have been imported.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+device_registry
+============
+Maps I2C addresses to the drivers that can be at them and the fastest clock
+those devices support. Used to pick the bus clock from a scan.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> qwiic_i2c.negotiateFreq([0x17, 0x3D, 0x6B])
+	400000
+	>>> qwiic_i2c.registerDevice("MyDevice", [0x55], qwiic_i2c.kFastModePlus)
+
+"""
+
+# I2C bus modes
+kStandardMode = 100000
+kFastMode = 400000
+kFastModePlus = 1000000
+
+# Driver class name, addresses and max clock of every device with a driver.
+# Addresses are shared by several devices; the slowest one is assumed.
+_kDevices = (
+	("QwiicADS1015", (0x48, 0x49, 0x4A, 0x4B), kFastMode),
+	("QwiicAlphanumeric", (0x70, 0x71, 0x72, 0x73), kFastMode),
+	("QwiicAS7265x", (0x49,), kStandardMode),
+	("QwiicAS726x", (0x49,), kStandardMode),
+	("QwiicAS7343", (0x39,), kFastMode),
+	("QwiicBme280", (0x77, 0x76), kFastMode),
+	("QwiicBMP581", (0x47, 0x46), kFastMode),
+	("QwiicButton", (0x6F,), kStandardMode),
+	("QwiicCAP1203", (0x28,), kFastMode),
+	("QwiicENS160", (0x53, 0x52), kFastMode),
+	("QwiicFS3000", (0x28,), kStandardMode),
+	("QwiicGPIO", (0x27, 0x26, 0x25, 0x24, 0x23, 0x22, 0x21, 0x20), kFastMode),
+	("QwiicHuskylens", (0x32,), kStandardMode),
+	("QwiicIcm20948", (0x69, 0x68), kFastMode),
+	("QwiicISM330DHCX", (0x6B, 0x6A), kFastMode),
+	("QwiicKeypad", (0x4B,), kStandardMode),
+	("QwiicKX132", (0x1F, 0x1E), kFastMode),
+	("QwiicKX134", (0x1F, 0x1E), kFastMode),
+	("QwiicLEDStick", (0x23,), kStandardMode),
+	("QwiicLSM6DSO", (0x6B, 0x6A), kFastModePlus),
+	("QwiicMAX1704X", (0x36,), kFastMode),
+	("QwiicMax3010x", (0x57,), kFastMode),
+	("QwiicMCP4725", (0x60, 0x61), kFastMode),
+	("QwiicMCP9600", (0x60,), kStandardMode),
+	("QwiicMicroPressure", (0x18,), kFastMode),
+	("QwiicMMC5983MA", (0x30,), kFastMode),
+	("QwiicNAU7802", (0x2A,), kFastMode),
+	("QwiicOledBase", (0x3D, 0x3C), kFastMode),
+	("QwiicOTOS", (0x17,), kFastMode),
+	# Only the default address, the jumpers cover most of the address space
+	("QwiicPCA9685", (0x40,), kFastModePlus),
+	("PiServoHat", (0x40,), kFastModePlus),
+	("QwiicRelay", (0x18, 0x19, 0x6D, 0x6C, 0x0A, 0x0B, 0x08, 0x09), kStandardMode),
+	("QwiicRFID", (0x13, 0x14), kStandardMode),
+	("QwiicRV8803", (0x32,), kFastMode),
+	("QwiicSCD4x", (0x62,), kStandardMode),
+	("QwiicScmd", (0x5D, 0x58, 0x59, 0x5A, 0x5C), kStandardMode),
+	("QwiicSerlcd", (0x72,), kStandardMode),
+	("QwiicSGP40", (0x59,), kFastMode),
+	("QwiicSoilMoistureSensor", (0x28,), kStandardMode),
+	("QwiicTCA9548A", tuple(range(0x70, 0x77 + 1)), kFastMode),
+	("QwiicTitanGps", (0x10,), kStandardMode),
+	("QwiicTmp102Sensor", (0x48, 0x49, 0x4A, 0x4B), kFastMode),
+	("QwiicTwist", (0x3F,), kStandardMode),
+	("QwiicUltrasonic", (0x2F,), kStandardMode),
+	("QwiicVEML6030", (0x48, 0x10), kFastMode),
+	("QwiicVL53L1X", (0x29,), kFastModePlus),
+	("QwiicVL53L5CX", (0x29,), kFastModePlus),
+)
+
+# address -> list of [driver name, max clock]
+_registry = {}
+
+def registerDevice(name, addresses, maxFreq):
+	"""
+		Adds a device to the registry, or updates the max clock of one already in it.
+
+		:param name: The name of the driver class
+		:param addresses: The I2C addresses the device can use
+		:param maxFreq: The fastest I2C clock the device supports, in Hz
+
+		:return: None
+	"""
+	for address in addresses:
+		entries = _registry.setdefault(address, [])
+		for entry in entries:
+			if entry[0] == name:
+				entry[1] = maxFreq
+				break
+		else:
+			entries.append([name, maxFreq])
+
+def register_device(name, addresses, maxFreq):
+	return registerDevice(name, addresses, maxFreq)
+
+for _name, _addresses, _maxFreq in _kDevices:
+	registerDevice(_name, _addresses, _maxFreq)
+
+def driverNames(address):
+	"""
+		Returns the names of the drivers for devices that can be at an address.
+
+		:param address: The I2C address
+
+		:return: The driver class names, empty if the address is unknown
+		:rtype: list
+	"""
+	return [entry[0] for entry in _registry.get(address, ())]
+
+def driver_names(address):
+	return driverNames(address)
+
+def maxFreq(address):
+	"""
+		Returns the fastest I2C clock supported by every device that can be at an address.
+
+		:param address: The I2C address
+
+		:return: The clock in Hz, or None if the address is unknown
+		:rtype: int
+	"""
+	entries = _registry.get(address)
+	if not entries:
+		return None
+	return min(entry[1] for entry in entries)
+
+def max_freq(address):
+	return maxFreq(address)
+
+def negotiateFreq(addresses, limit = kFastModePlus):
+	"""
+		Picks the fastest I2C clock supported by all devices at the given addresses.
+		If the bus is empty, or a device isn't in the registry, there's nothing to
+		go by and None is returned, so the bus stays at the platform's default clock.
+
+		:param addresses: The addresses found on the bus, e.g. from scan()
+		:param limit: The fastest clock to pick, for the bus wiring or the host
+
+		:return: The clock in Hz, or None to keep the current clock
+		:rtype: int
+	"""
+	if not addresses:
+		return None
+
+	freq = limit
+	for address in addresses:
+		deviceFreq = maxFreq(address)
+		if deviceFreq is None:
+			return None
+		if deviceFreq < freq:
+			freq = deviceFreq
+
+	return freq
+
+def negotiate_freq(addresses, limit = kFastModePlus):
+	return negotiateFreq(addresses, limit)
@@ -59,6 +59,8 @@ New to qwiic? Take a look at the entire [SparkFun qwiic ecosystem](https://www.s
 
 """
 
+from .scan_cache import ScanCache
+
 #-----------------------------------------------------------------------------
 # Platform
 #
@@ -78,8 +80,14 @@ class I2CDriver(object):
 	# stubs
 	name = 'qwiic I2C abstract base class'
 
+	# Largest write, in bytes including the register, the platform sends in one
+	# transaction, or None if there's no limit. Drivers streaming large blocks,
+	# like firmware uploads, split them at this size.
+	maxWriteSize = 32
+
 	def __init__(self, *args, **argk):
-		pass
+		# Devices seen on the bus, consulted by isDeviceConnected()
+		self.scanCache = ScanCache()
 
 
 	# A class method is used to determine if the system is executing on the desired platform
@@ -117,6 +125,55 @@ class I2CDriver(object):
 	def __exit__(self, type, value, traceback):
 		pass
 
+	#-------------------------------------------------------------------------
+	# Bus clock
+
+	def getFreq(self):
+		"""
+			Returns the clock frequency of the I2C bus.
+
+			:return: The bus clock in Hz, or None if the platform doesn't support it
+			:rtype: int
+
+		"""
+		return None
+
+	def get_freq(self):
+		return self.getFreq()
+
+	def setFreq(self, freq):
+		"""
+			Changes the clock frequency of the I2C bus.
+
+			:param freq: The bus clock in Hz
+
+			:return: None
+
+		"""
+		pass
+
+	def set_freq(self, freq):
+		return self.setFreq(freq)
+
+	#-------------------------------------------------------------------------
+	# Batched operations
+
+	def batch(self, bufferSize = 32):
+		""" 
+			Returns a Transaction bound to this driver. Queue reads and writes on it and
+			run them all with one execute() call, or use it in a with statement to execute
+			on exit.
+
+			:param bufferSize: Initial size of the result buffer, in bytes
+
+			:return: A new transaction for this driver
+			:rtype: Transaction
+
+		"""
+		# Imported here, so only programs that batch load it
+		from .transaction import Transaction
+		return Transaction(self, bufferSize)
+
 
 	#-------------------------------------------------------------------------		
 	# read Data Command
@@ -200,6 +257,121 @@ class I2CDriver(object):
 
 		"""
 		return None
+
+	def readBlockInto(self, address, commandCode, buf, offset = 0, nBytes = None):
+		""" 
+			Called to read a block of bytes from a specific device directly into a
+			caller provided buffer, avoiding a new allocation for every read.
+
+			Platforms that can't read into a buffer natively fall back to readBlock()
+			and copy the result.
+
+			:param address: The I2C address of the device to read from
+			:param commandCode: The "command" or register to read from, or `None` for no command
+			:param buf: A writable buffer (bytearray, memoryview) to read into
+			:param offset: The position in buf to start writing the read data at
+			:param nBytes: The number of bytes to read, or `None` to fill buf from offset to the end
+
+			:return: The number of bytes read
+			:rtype: integer
+
+		"""
+		if nBytes is None:
+			nBytes = len(buf) - offset
+
+		data = self.readBlock(address, commandCode, nBytes)
+		for i in range(nBytes):
+			buf[offset + i] = data[i]
+
+		return nBytes
+
+	def read_block_into(self, address, commandCode, buf, offset = 0, nBytes = None):
+		""" 
+			Called to read a block of bytes from a specific device directly into a
+			caller provided buffer, avoiding a new allocation for every read.
+
+			:param address: The I2C address of the device to read from
+			:param commandCode: The "command" or register to read from, or `None` for no command
+			:param buf: A writable buffer (bytearray, memoryview) to read into
+			:param offset: The position in buf to start writing the read data at
+			:param nBytes: The number of bytes to read, or `None` to fill buf from offset to the end
+
+			:return: The number of bytes read
+			:rtype: integer
+
+		"""
+		return self.readBlockInto(address, commandCode, buf, offset, nBytes)
+
+	def readReg16(self, address, register, nBytes):
+		""" 
+			Called to read a block of bytes from a device that uses 16-bit register
+			addresses. The register is sent MSB first, followed by a repeated start and
+			the read, so the whole access is one bus transaction.
+
+			:param address: The I2C address of the device to read from
+			:param register: The 16-bit register to read from
+			:param nBytes: The number of bytes to read from the device
+
+			:return: Returns the read data
+			:rtype: bytes or list
+
+		"""
+		return self.writeReadBlock(address, [(register >> 8) & 0xFF, register & 0xFF], nBytes)
+
+	def read_reg16(self, address, register, nBytes):
+		""" 
+			Called to read a block of bytes from a device that uses 16-bit register
+			addresses. The register is sent MSB first, followed by a repeated start and
+			the read, so the whole access is one bus transaction.
+
+			:param address: The I2C address of the device to read from
+			:param register: The 16-bit register to read from
+			:param nBytes: The number of bytes to read from the device
+
+			:return: Returns the read data
+			:rtype: bytes or list
+
+		"""
+		return self.readReg16(address, register, nBytes)
+
+	def readReg16Into(self, address, register, buf, offset = 0, nBytes = None):
+		""" 
+			Same as readReg16(), but reads into a caller provided buffer.
+
+			:param address: The I2C address of the device to read from
+			:param register: The 16-bit register to read from
+			:param buf: A writable buffer (bytearray, memoryview) to read into
+			:param offset: The position in buf to start writing the read data at
+			:param nBytes: The number of bytes to read, or `None` to fill buf from offset to the end
+
+			:return: The number of bytes read
+			:rtype: integer
+
+		"""
+		if nBytes is None:
+			nBytes = len(buf) - offset
+
+		data = self.readReg16(address, register, nBytes)
+		for i in range(nBytes):
+			buf[offset + i] = data[i]
+
+		return nBytes
+
+	def read_reg16_into(self, address, register, buf, offset = 0, nBytes = None):
+		""" 
+			Same as read_reg16(), but reads into a caller provided buffer.
+
+			:param address: The I2C address of the device to read from
+			:param register: The 16-bit register to read from
+			:param buf: A writable buffer (bytearray, memoryview) to read into
+			:param offset: The position in buf to start writing the read data at
+			:param nBytes: The number of bytes to read, or `None` to fill buf from offset to the end
+
+			:return: The number of bytes read
+			:rtype: integer
+
+		"""
+		return self.readReg16Into(address, register, buf, offset, nBytes)
 	
 	#--------------------------------------------------------------------------	
 	# write Data Commands 
@@ -312,6 +484,79 @@ class I2CDriver(object):
 
 		"""
 		return None
+
+	def writeBlockFrom(self, address, commandCode, buf):
+		""" 
+			Called to write a block of bytes to a device straight from a buffer
+			(bytes, bytearray, memoryview), without converting it to a list first.
+
+			Platforms that can't write from a buffer natively fall back to writeBlock().
+			There, an empty buffer with no command only probes the address, and raises
+			OSError if no device answers.
+
+			:param address: The I2C address of the device to write to
+			:param commandCode: The "command" or register to write to, or `None` for no command
+			:param buf: The buffer holding the bytes to write on the I2C bus.
+
+			:return: None
+
+		"""
+		if commandCode is None:
+			if not len(buf):
+				# Nothing to write, so this only probes the address. Asked of the
+				# bus rather than the scan cache, the device behind it may have
+				# changed, e.g. with a mux channel.
+				self.scanCache.invalidate(address)
+				if not self.isDeviceConnected(address):
+					raise OSError("No device at address 0x%02X" % address)
+				return
+
+			# No register, so the first byte of the buffer takes its place
+			return self.writeBlock(address, buf[0], list(buf[1:]))
+
+		return self.writeBlock(address, commandCode, list(buf))
+
+	def write_block_from(self, address, commandCode, buf):
+		""" 
+			Called to write a block of bytes to a device straight from a buffer
+			(bytes, bytearray, memoryview), without converting it to a list first.
+
+			:param address: The I2C address of the device to write to
+			:param commandCode: The "command" or register to write to, or `None` for no command
+			:param buf: The buffer holding the bytes to write on the I2C bus.
+
+			:return: None
+
+		"""
+		return self.writeBlockFrom(address, commandCode, buf)
+
+	def writeReg16(self, address, register, data):
+		""" 
+			Called to write a block of bytes to a device that uses 16-bit register
+			addresses. The register is sent MSB first.
+
+			:param address: The I2C address of the device to write to
+			:param register: The 16-bit register to write to
+			:param data: The bytes to write (list, bytes, bytearray or memoryview)
+
+			:return: None
+
+		"""
+		return self.writeBlock(address, (register >> 8) & 0xFF, [register & 0xFF] + list(data))
+
+	def write_reg16(self, address, register, data):
+		""" 
+			Called to write a block of bytes to a device that uses 16-bit register
+			addresses. The register is sent MSB first.
+
+			:param address: The I2C address of the device to write to
+			:param register: The 16-bit register to write to
+			:param data: The bytes to write (list, bytes, bytearray or memoryview)
+
+			:return: None
+
+		"""
+		return self.writeReg16(address, register, data)
 	
 	def writeReadBlock(self, address, writeBytes, readNBytes):
 		""" 
@@ -345,7 +590,8 @@ class I2CDriver(object):
 	def isDeviceConnected(self, devAddress):
 		"""
 			Determines if a particular device (at the provided address)
-			is connected to the bus.
+			is connected to the bus. Platform drivers answer from `scanCache` when it
+			has a recent result, and only probe the bus otherwise.
 
 			:param devAddress: The I2C address of the device to check
 
@@ -381,9 +627,25 @@ class I2CDriver(object):
 		"""
 		return None
 
+	def invalidateScan(self, address = None):
+		"""
+			Forgets the cached scan and probe results, so the next isDeviceConnected()
+			probes the bus.
+
+			:param address: The address to forget, or None to forget all of them
+
+			:return: None
+
+		"""
+		self.scanCache.invalidate(address)
+
+	def invalidate_scan(self, address = None):
+		return self.invalidateScan(address)
+
 	def scan(self):
 		"""
 			Used to scan the I2C bus, returning a list of I2C address attached to the computer.
+			Platform drivers store the result in `scanCache`.
 
 			:return: A list of I2C addresses. If no devices are attached, an empty list is returned.
 			:rtype: list
@@ -0,0 +1,330 @@
+#-----------------------------------------------------------------------------
+# i2c_stats.py
+#
+# Opt-in bus statistics for the qwiic I2C drivers.
+#
+# When enabled on a driver, every transaction is counted per device address
+# and per register: the number of transactions, bytes read and written,
+# errors (including NACKs) and the latency of each call. Instrumenting works
+# by shadowing the driver's methods on the instance, so a driver that isn't
+# instrumented runs exactly the code it always has.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+i2c_stats
+============
+Per device and per register I2C bus statistics.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> qwiic_i2c.enableStats()
+	>>> # ... run the robot loop ...
+	>>> s = qwiic_i2c.stats()
+	>>> s[0x17]["transactions"], s[0x17]["max_us"]
+	>>> s[0x17]["registers"][0x20]["bytes_read"]
+	>>> qwiic_i2c.resetStats()
+
+"""
+
+try:
+	from time import ticks_us, ticks_diff
+except ImportError:
+	# Not MicroPython
+	from time import perf_counter_ns
+
+	def ticks_us():
+		return perf_counter_ns() // 1000
+
+	def ticks_diff(end, start):
+		return end - start
+
+# Upper bounds, in microseconds, of the latency histogram buckets. The last
+# bucket counts everything slower.
+kLatencyBucketsUs = (50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# Positions of the counters in a statistics record
+_kTransactions = 0
+_kBytesRead = 1
+_kBytesWritten = 2
+_kErrors = 3
+_kTotalUs = 4
+_kMaxUs = 5
+_kHistogram = 6
+_kRecordSize = _kHistogram + len(kLatencyBucketsUs) + 1
+
+# Records per address, each address maps to [address record, {register: record}]
+_stats = {}
+
+# Drivers that are currently instrumented
+_drivers = []
+
+def _record(address, register, nRead, nWrite, error, elapsed):
+	entry = _stats.get(address)
+	if entry is None:
+		entry = [[0] * _kRecordSize, {}]
+		_stats[address] = entry
+
+	registerRecord = entry[1].get(register)
+	if registerRecord is None:
+		registerRecord = [0] * _kRecordSize
+		entry[1][register] = registerRecord
+
+	bucket = _kHistogram
+	for bound in kLatencyBucketsUs:
+		if elapsed <= bound:
+			break
+		bucket += 1
+
+	for record in (entry[0], registerRecord):
+		record[_kTransactions] += 1
+		record[_kBytesRead] += nRead
+		record[_kBytesWritten] += nWrite
+		record[_kErrors] += error
+		record[_kTotalUs] += elapsed
+		if elapsed > record[_kMaxUs]:
+			record[_kMaxUs] = elapsed
+		record[bucket] += 1
+
+#-----------------------------------------------------------------------------
+# Method wrappers
+#
+# Each driver method is described by a function that works out the register,
+# bytes read and bytes written of a call from its arguments and result.
+
+def _commandWrite(commandCode):
+	return 0 if commandCode is None else 1
+
+def _readWord(args, result):
+	return args[1], 2, _commandWrite(args[1])
+
+def _readByte(args, result):
+	commandCode = args[1] if len(args) > 1 else None
+	return commandCode, 1, _commandWrite(commandCode)
+
+def _readBlock(args, result):
+	return args[1], args[2], _commandWrite(args[1])
+
+def _readBlockInto(args, result):
+	return args[1], result, _commandWrite(args[1])
+
+def _readReg16(args, result):
+	return args[1], args[2], 2
+
+def _readReg16Into(args, result):
+	return args[1], result, 2
+
+def _writeCommand(args, result):
+	return args[1], 0, 1
+
+def _writeWord(args, result):
+	return args[1], 0, 3
+
+def _writeByte(args, result):
+	return args[1], 0, 2
+
+def _writeBlock(args, result):
+	return args[1], 0, 1 + len(args[2])
+
+def _writeBlockFrom(args, result):
+	commandCode = args[1]
+	if commandCode is None:
+		# The command is the first byte of the buffer
+		buf = args[2]
+		return (buf[0] if len(buf) else None), 0, len(buf)
+	return commandCode, 0, 1 + len(args[2])
+
+def _writeReg16(args, result):
+	return args[1], 0, 2 + len(args[2])
+
+def _writeReadBlock(args, result):
+	writeBytes = args[1]
+	return (writeBytes[0] if len(writeBytes) else None), args[2], len(writeBytes)
+
+_kMethods = (
+	("readWord", _readWord),
+	("readByte", _readByte),
+	("readBlock", _readBlock),
+	("readBlockInto", _readBlockInto),
+	("readReg16", _readReg16),
+	("readReg16Into", _readReg16Into),
+	("writeCommand", _writeCommand),
+	("writeWord", _writeWord),
+	("writeByte", _writeByte),
+	("writeBlock", _writeBlock),
+	("writeBlockFrom", _writeBlockFrom),
+	("writeReg16", _writeReg16),
+	("writeReadBlock", _writeReadBlock),
+)
+
+# Set while a wrapped call is running. Fallback implementations in I2CDriver
+# call other driver methods, which must not be counted a second time.
+_inCall = [False]
+
+def _wrap(method, describe):
+	def wrapper(*args, **argk):
+		if _inCall[0]:
+			return method(*args, **argk)
+
+		_inCall[0] = True
+		start = ticks_us()
+		try:
+			result = method(*args, **argk)
+		except:
+			elapsed = ticks_diff(ticks_us(), start)
+			register, nRead, nWrite = describe(args, None)
+			# Nothing was transferred as far as the caller is concerned
+			_record(args[0], register, 0, 0, 1, elapsed)
+			raise
+		finally:
+			_inCall[0] = False
+
+		elapsed = ticks_diff(ticks_us(), start)
+		register, nRead, nWrite = describe(args, result)
+		_record(args[0], register, nRead, nWrite, 0, elapsed)
+		return result
+	return wrapper
+
+def _wrapIsDeviceConnected(method):
+	def wrapper(devAddress):
+		if _inCall[0]:
+			return method(devAddress)
+
+		_inCall[0] = True
+		start = ticks_us()
+		try:
+			connected = method(devAddress)
+		finally:
+			_inCall[0] = False
+
+		# No ACK from the device counts as an error
+		_record(devAddress, None, 0, 0, 0 if connected else 1, ticks_diff(ticks_us(), start))
+		return connected
+	return wrapper
+
+#-----------------------------------------------------------------------------
+# Public interface
+
+def enableStats(i2cDriver = None):
+	"""
+		Starts collecting statistics for the transactions on a driver.
+
+		The driver's methods are replaced on the instance, so every device driver
+		sharing it is included. The snake_case methods call the camelCase ones, so
+		they're counted too.
+
+		:param i2cDriver: The I2CDriver to instrument. If not provided, the default
+			driver for the platform is used.
+
+		:return: The instrumented driver
+		:rtype: Object
+	"""
+	if i2cDriver is None:
+		# Imported here, to avoid a circular import with the package
+		from . import getI2CDriver
+		i2cDriver = getI2CDriver()
+
+	if i2cDriver is None or i2cDriver in _drivers:
+		return i2cDriver
+
+	for name, describe in _kMethods:
+		setattr(i2cDriver, name, _wrap(getattr(i2cDriver, name), describe))
+	i2cDriver.isDeviceConnected = _wrapIsDeviceConnected(i2cDriver.isDeviceConnected)
+
+	_drivers.append(i2cDriver)
+	return i2cDriver
+
+def enable_stats(i2cDriver = None):
+	return enableStats(i2cDriver)
+
+def disableStats(i2cDriver = None):
+	"""
+		Stops collecting statistics, restoring the driver's own methods. The collected
+		statistics are kept until resetStats() is called.
+
+		:param i2cDriver: The I2CDriver to stop instrumenting. If not provided, all
+			instrumented drivers are restored.
+
+		:return: None
+	"""
+	for driver in list(_drivers):
+		if i2cDriver is not None and driver is not i2cDriver:
+			continue
+
+		for name, describe in _kMethods:
+			delattr(driver, name)
+		del driver.isDeviceConnected
+
+		_drivers.remove(driver)
+
+def disable_stats(i2cDriver = None):
+	return disableStats(i2cDriver)
+
+def resetStats():
+	"""
+		Clears all collected statistics.
+
+		:return: None
+	"""
+	_stats.clear()
+
+def reset_stats():
+	return resetStats()
+
+def _recordDict(record):
+	return {
+		"transactions": record[_kTransactions],
+		"bytes_read": record[_kBytesRead],
+		"bytes_written": record[_kBytesWritten],
+		"errors": record[_kErrors],
+		"total_us": record[_kTotalUs],
+		"max_us": record[_kMaxUs],
+		"histogram": record[_kHistogram:],
+	}
+
+def stats():
+	"""
+		Returns the statistics collected since the last reset, keyed by device address.
+
+		Each address has the counters `transactions`, `bytes_read`, `bytes_written`,
+		`errors`, `total_us` and `max_us`, a latency `histogram` with one count per bucket
+		of kLatencyBucketsUs plus one for slower calls, and the same counters per register
+		in `registers`. Calls without a register are counted under None.
+
+		:return: The statistics
+		:rtype: dict
+	"""
+	result = {}
+	for address, entry in _stats.items():
+		addressDict = _recordDict(entry[0])
+		addressDict["registers"] = {register: _recordDict(record) for register, record in entry[1].items()}
+		result[address] = addressDict
+
+	return result
@@ -40,9 +40,14 @@ import sys
 _PLATFORM_NAME = "MicroPython"
 
 # used internally in this file to get i2c class object 
-def _connectToI2CBus(sda=None, scl=None, freq=100000, *args, **argk):
+# Clock used when pins are given without one. Without pins, the bus is left at
+# the platform's own default.
+_kPinsDefaultFreq = 100000
+
+def _connectToI2CBus(sda=None, scl=None, freq=None, *args, **argk):
 	try:
 		from machine import I2C, Pin
+		pinsFreq = _kPinsDefaultFreq if freq is None else freq
 		if sys.platform == 'rp2':
 			if sda is not None and scl is not None:
 				# I2C busses follow every other pair of pins
@@ -51,16 +56,20 @@ def _connectToI2CBus(sda=None, scl=None, freq=100000, *args, **argk):
 				# Check if both pins are on the same bus
 				if scl_id != sda_id:
 					raise Exception("I2C SCL and SDA pins must be on same ports")
-				return I2C(id=scl_id, scl=Pin(scl), sda=Pin(sda), freq=freq)
-			else:
+				return I2C(id=scl_id, scl=Pin(scl), sda=Pin(sda), freq=pinsFreq)
+			elif freq is None:
 				return I2C()
+			else:
+				return I2C(freq=freq)
 		elif 'xbee' in sys.platform:
-			return I2C(id=1, freq=freq)
+			return I2C(id=1, freq=pinsFreq)
 		elif 'esp32' in sys.platform:
 			if sda is not None and scl is not None:
-				return I2C(scl=Pin(scl), sda=Pin(sda), freq=freq)
-			else:
+				return I2C(scl=Pin(scl), sda=Pin(sda), freq=pinsFreq)
+			elif freq is None:
 				return I2C()
+			else:
+				return I2C(freq=freq)
 		else:
 			raise Exception("Unknown MicroPython platform: " + sys.platform)
 	except Exception as e:
@@ -77,7 +86,10 @@ class MicroPythonI2C(I2CDriver):
 	name = _PLATFORM_NAME
 	_i2cbus = None
 
-	def __init__(self, sda=None, scl=None, freq=100000, *args, **argk):
+	# writeto_mem() takes a buffer of any length
+	maxWriteSize = None
+
+	def __init__(self, sda=None, scl=None, freq=None, *args, **argk):
 		I2CDriver.__init__(self) # init super
 
 		self._sda = sda
@@ -86,6 +98,21 @@ class MicroPythonI2C(I2CDriver):
 
 		self._i2cbus = _connectToI2CBus(sda=self._sda, scl=self._scl, freq=self._freq)
 
+	def getFreq(self):
+		# None while the bus is at the platform's default clock
+		return self._freq
+
+	def get_freq(self):
+		return self.getFreq()
+
+	def setFreq(self, freq):
+		# Creating the bus object again re-initializes the peripheral at the new clock
+		self._freq = freq
+		self._i2cbus = _connectToI2CBus(sda=self._sda, scl=self._scl, freq=self._freq)
+
+	def set_freq(self, freq):
+		return self.setFreq(freq)
+
 	@classmethod
 	def isPlatform(cls):
 		try:
@@ -153,6 +180,44 @@ class MicroPythonI2C(I2CDriver):
 	def read_block(self, address, commandCode, nBytes):
 		return self.readBlock(address, commandCode, nBytes)
 
+	def readBlockInto(self, address, commandCode, buf, offset = 0, nBytes = None):
+		if nBytes is None:
+			nBytes = len(buf) - offset
+
+		# Only slice when we have to, a memoryview slice is still an allocation
+		if offset != 0 or nBytes != len(buf):
+			buf = memoryview(buf)[offset:offset + nBytes]
+
+		if (commandCode == None):
+			self._i2cbus.readfrom_into(address, buf)
+		else:
+			self._i2cbus.readfrom_mem_into(address, commandCode, buf)
+
+		return nBytes
+
+	def read_block_into(self, address, commandCode, buf, offset = 0, nBytes = None):
+		return self.readBlockInto(address, commandCode, buf, offset, nBytes)
+
+	def readReg16(self, address, register, nBytes):
+		return self._i2cbus.readfrom_mem(address, register, nBytes, addrsize=16)
+
+	def read_reg16(self, address, register, nBytes):
+		return self.readReg16(address, register, nBytes)
+
+	def readReg16Into(self, address, register, buf, offset = 0, nBytes = None):
+		if nBytes is None:
+			nBytes = len(buf) - offset
+
+		if offset != 0 or nBytes != len(buf):
+			buf = memoryview(buf)[offset:offset + nBytes]
+
+		self._i2cbus.readfrom_mem_into(address, register, buf, addrsize=16)
+
+		return nBytes
+
+	def read_reg16_into(self, address, register, buf, offset = 0, nBytes = None):
+		return self.readReg16Into(address, register, buf, offset, nBytes)
+
 	# write commands----------------------------------------------------------
 	def writeCommand(self, address, commandCode):
 		self._i2cbus.writeto(address, commandCode.to_bytes(1, 'little'))
@@ -178,6 +243,24 @@ class MicroPythonI2C(I2CDriver):
 	def write_block(self, address, commandCode, value):
 		return self.writeBlock(address, commandCode, value)
 
+	def writeBlockFrom(self, address, commandCode, buf):
+		# Anything supporting the buffer protocol goes straight to the bus, no copy
+		if (commandCode == None):
+			self._i2cbus.writeto(address, buf)
+		else:
+			self._i2cbus.writeto_mem(address, commandCode, buf)
+
+	def write_block_from(self, address, commandCode, buf):
+		return self.writeBlockFrom(address, commandCode, buf)
+
+	def writeReg16(self, address, register, data):
+		if isinstance(data, list):
+			data = bytes(data)
+		self._i2cbus.writeto_mem(address, register, data, addrsize=16)
+
+	def write_reg16(self, address, register, data):
+		return self.writeReg16(address, register, data)
+
 	def writeReadBlock(self, address, writeBytes, readNBytes):
 		# micropython I2C doesn't have a corresponding "i2c_rdwr" function like smbus2, so we will make our own by passing stop=False to not send stop bits between repeated transfers
 		self._i2cbus.writeto(address, bytes(writeBytes), False)
@@ -187,6 +270,10 @@ class MicroPythonI2C(I2CDriver):
 		return self.writeReadBlock(address, writeBytes, readNBytes)
 
 	def isDeviceConnected(self, devAddress):
+		isConnected = self.scanCache.lookup(devAddress)
+		if isConnected is not None:
+			return isConnected
+
 		isConnected = False
 		try:
 			# Try to write nothing to the device
@@ -196,6 +283,7 @@ class MicroPythonI2C(I2CDriver):
 		except:
 			pass
 		
+		self.scanCache.record(devAddress, isConnected)
 		return isConnected
 
 	def is_device_connected(self, devAddress):
@@ -207,4 +295,6 @@ class MicroPythonI2C(I2CDriver):
 	# scan -------------------------------------------------------------------
 	def scan(self):
 		""" Returns a list of addresses for the devices connected to the I2C bus."""
-		return self._i2cbus.scan()
+		addresses = self._i2cbus.scan()
+		self.scanCache.recordScan(addresses)
+		return addresses
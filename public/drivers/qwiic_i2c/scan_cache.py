@@ -0,0 +1,182 @@
+#-----------------------------------------------------------------------------
+# scan_cache.py
+#
+# Cache of the devices seen on an I2C bus.
+#
+# Every driver's is_connected() probes the bus with a zero length write, and
+# a robot starting up runs dozens of these one after the other. The cache
+# remembers which addresses answered a probe or a scan, and when, so probes
+# within the time to live are answered without touching the bus.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+scan_cache
+============
+Remembers the devices found on the bus for a limited time.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> qwiic_i2c.devices()
+	{23: {'last_seen': 1520, 'drivers': ['QwiicOTOS']}, ...}
+	>>> qwiic_i2c.invalidateScan()
+
+"""
+
+from .device_registry import driverNames
+
+try:
+	from time import ticks_ms, ticks_diff
+except ImportError:
+	# Not MicroPython
+	from time import monotonic
+
+	def ticks_ms():
+		return int(monotonic() * 1000)
+
+	def ticks_diff(end, start):
+		return end - start
+
+# How long a result stays valid by default, in milliseconds
+kDefaultTtlMs = 1000
+
+#-----------------------------------------------------------------------------
+# ScanCache
+#
+class ScanCache(object):
+	"""
+	ScanCache
+
+		Addresses seen on a bus, with the time they were last seen.
+
+		An address seen within the time to live is reported as connected. Anything else
+		is probed again: a device that just changed address, or was just plugged in,
+		must not be reported missing because of an earlier scan.
+
+		:param ttl: How long results stay valid, in milliseconds. 0 disables the cache.
+
+		:return: The scan cache
+		:rtype: Object
+	"""
+
+	def __init__(self, ttl = kDefaultTtlMs):
+		self.ttl = ttl
+
+		# address -> time last seen, in ms
+		self._seen = {}
+		self._scanTime = None
+
+	def _fresh(self, timestamp, now):
+		return timestamp is not None and ticks_diff(now, timestamp) < self.ttl
+
+	def lookup(self, address):
+		"""
+			Returns what the cache knows about an address.
+
+			:param address: The I2C address
+
+			:return: True if the device was seen recently, None if it needs to be probed
+			:rtype: bool
+		"""
+		if self.ttl > 0 and self._fresh(self._seen.get(address), ticks_ms()):
+			return True
+		return None
+
+	def record(self, address, connected):
+		"""
+			Stores the result of probing a single address.
+
+			:param address: The I2C address
+			:param connected: True if the device answered
+
+			:return: None
+		"""
+		if connected:
+			self._seen[address] = ticks_ms()
+		else:
+			self._seen.pop(address, None)
+
+	def recordScan(self, addresses):
+		"""
+			Stores the result of a full bus scan.
+
+			:param addresses: The addresses that answered
+
+			:return: None
+		"""
+		now = ticks_ms()
+		self._seen = {}
+		for address in addresses:
+			self._seen[address] = now
+		self._scanTime = now
+
+	def record_scan(self, addresses):
+		return self.recordScan(addresses)
+
+	def invalidate(self, address = None):
+		"""
+			Forgets cached results, e.g. after a device changes address or is unplugged.
+
+			:param address: The address to forget, or None to forget everything
+
+			:return: None
+		"""
+		if address is None:
+			self._seen = {}
+		else:
+			self._seen.pop(address, None)
+		# The scan is no longer a complete picture of the bus
+		self._scanTime = None
+
+	def isScanFresh(self):
+		"""
+			Returns True if a full scan was made within the time to live.
+
+			:rtype: bool
+		"""
+		return self.ttl > 0 and self._fresh(self._scanTime, ticks_ms())
+
+	def is_scan_fresh(self):
+		return self.isScanFresh()
+
+	def devices(self):
+		"""
+			Returns the devices seen within the time to live.
+
+			:return: For each address, the time it was last seen (ms) and the names of the
+				drivers for devices that can be at it
+			:rtype: dict
+		"""
+		now = ticks_ms()
+		result = {}
+		for address, timestamp in self._seen.items():
+			if self._fresh(timestamp, now):
+				result[address] = {"last_seen": timestamp, "drivers": driverNames(address)}
+		return result
@@ -0,0 +1,389 @@
+#-----------------------------------------------------------------------------
+# scheduler.py
+#
+# Cooperative multi-rate scheduler for reading qwiic sensors.
+#
+# Each sensor is read at its own period: odometry at 100 Hz, a distance sensor
+# at its timing budget, an environmental sensor once a second. A task can have
+# a data-ready check, so the sensor is only read when it has new data. Due
+# tasks run earliest deadline first, and each task records its deadline misses
+# and how late it started (jitter).
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+scheduler
+============
+Reads many sensors at their own rates from one loop.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> sched = qwiic_i2c.Scheduler()
+	>>> pose = sched.addTask(otos.getPosition, 10)
+	>>> tof = sched.addTask(tof.get_distance, 50, qwiic_i2c.dataReadyCheck(tof))
+	>>> sched.addTask(bme.get_temperature_celsius, 1000)
+	>>> while True:
+	...     sched.runPending()
+	...     drive(pose.value, tof.value)
+	>>> sched.stats()["get_distance"]["misses"]
+
+"""
+
+from time import sleep
+
+try:
+	from time import ticks_us, ticks_diff, ticks_add
+except ImportError:
+	# Not MicroPython
+	from time import perf_counter_ns
+
+	def ticks_us():
+		return perf_counter_ns() // 1000
+
+	def ticks_diff(end, start):
+		return end - start
+
+	def ticks_add(ticks, delta):
+		return ticks + delta
+
+from .async_sleep import asyncSleepMs
+
+# Names of the methods drivers use to report new data, in the order they're looked for
+kDataReadyMethods = ("check_for_data_ready", "check_data_ready", "data_available", "get_data_ready_status", "data_ready")
+
+def dataReadyCheck(driver):
+	"""
+		Returns the data-ready method of a driver, to pass to Scheduler.addTask().
+
+		:param driver: The sensor driver
+
+		:return: The driver's data-ready method, or None if it doesn't have one
+		:rtype: callable
+	"""
+	for name in kDataReadyMethods:
+		check = getattr(driver, name, None)
+		if check is not None:
+			return check
+	return None
+
+def data_ready_check(driver):
+	return dataReadyCheck(driver)
+
+#-----------------------------------------------------------------------------
+# SchedulerTask
+#
+class SchedulerTask(object):
+	"""
+	SchedulerTask
+
+		A periodic read, created by Scheduler.addTask(). The result of the last
+		read is in `value`, and `updated` is set each time it changes.
+
+		:return: The task
+		:rtype: Object
+	"""
+
+	def __init__(self, name, read, periodMs, ready, pollMs, now):
+		self.name = name
+		self.read = read
+		self.ready = ready
+
+		self.period = periodMs * 1000
+		# How long to wait before checking again when the data isn't ready
+		self.poll = max(1000, (pollMs if pollMs is not None else periodMs // 10) * 1000)
+
+		# Result of the last read, and whether it's new since updated was cleared
+		self.value = None
+		self.updated = False
+		self.error = None
+
+		# Start of the current period, and when to check next
+		self._release = now
+		self._due = now
+
+		self.resetStats()
+
+	def resetStats(self):
+		"""
+			Clears the counters of the task.
+
+			:return: None
+		"""
+		self.runs = 0
+		self.notReady = 0
+		self.misses = 0
+		self.errors = 0
+		self.maxJitter = 0
+		self.totalJitter = 0
+		self.maxRun = 0
+
+	def reset_stats(self):
+		return self.resetStats()
+
+	def _deadline(self):
+		return ticks_add(self._release, self.period)
+
+	def _run(self, now):
+		if self.ready is not None:
+			try:
+				isReady = self.ready()
+			except Exception as e:
+				isReady = False
+				self.errors += 1
+				self.error = e
+
+			if not isReady:
+				self.notReady += 1
+				# Check again soon, unless that's past the end of the period
+				self._due = ticks_add(now, self.poll)
+				if ticks_diff(self._due, self._deadline()) > 0:
+					self._nextPeriod(now)
+				return
+
+		start = ticks_us()
+		try:
+			self.value = self.read()
+			self.updated = True
+		except Exception as e:
+			self.errors += 1
+			self.error = e
+		end = ticks_us()
+
+		jitter = ticks_diff(start, self._release)
+		self.runs += 1
+		self.totalJitter += jitter
+		if jitter > self.maxJitter:
+			self.maxJitter = jitter
+		elapsed = ticks_diff(end, start)
+		if elapsed > self.maxRun:
+			self.maxRun = elapsed
+
+		if ticks_diff(end, self._deadline()) > 0:
+			self.misses += 1
+
+		self._nextPeriod(end)
+
+	def _nextPeriod(self, now):
+		self._release = self._deadline()
+		# Periods that have gone by entirely were missed
+		while ticks_diff(now, self._deadline()) >= 0:
+			self._release = self._deadline()
+			self.misses += 1
+		self._due = self._release
+
+	def stats(self):
+		"""
+			Returns the counters of the task.
+
+			:return: `runs`, `not_ready` (checks that found no new data), `misses`
+				(periods that ended before the read did), `errors`, and the jitter
+				(how late a read started in its period) and run time in microseconds
+			:rtype: dict
+		"""
+		return {
+			"runs": self.runs,
+			"not_ready": self.notReady,
+			"misses": self.misses,
+			"errors": self.errors,
+			"max_jitter_us": self.maxJitter,
+			"mean_jitter_us": self.totalJitter // self.runs if self.runs else 0,
+			"max_run_us": self.maxRun,
+		}
+
+#-----------------------------------------------------------------------------
+# Scheduler
+#
+class Scheduler(object):
+	"""
+	Scheduler
+
+		Runs periodic sensor reads. Each task's deadline is the end of its period.
+		When several tasks are due, the one with the earliest deadline runs first.
+
+		A read or data-ready check that raises doesn't stop the other tasks. The
+		exception is counted and kept in the task's `error`.
+
+		:return: The scheduler
+		:rtype: Object
+	"""
+
+	def __init__(self):
+		self._tasks = []
+
+	def addTask(self, read, periodMs, ready = None, name = None, pollMs = None):
+		"""
+			Adds a periodic read. The first read is due straight away.
+
+			:param read: Called with no arguments to read the sensor, its result is
+				stored in the task's `value`
+			:param periodMs: How often to read, in milliseconds
+			:param ready: Called with no arguments, returns true when the sensor has
+				new data. If provided, the read only happens once this is true. See
+				dataReadyCheck().
+			:param name: Name of the task in stats(). Defaults to the name of `read`.
+			:param pollMs: How often to call `ready` until it's true, in milliseconds.
+				Defaults to a tenth of the period.
+
+			:return: The task
+			:rtype: SchedulerTask
+		"""
+		if name is None:
+			name = getattr(read, "__name__", "task")
+		# Names must be unique for stats()
+		names = [task.name for task in self._tasks]
+		baseName = name
+		count = 1
+		while name in names:
+			count += 1
+			name = "%s#%d" % (baseName, count)
+
+		task = SchedulerTask(name, read, periodMs, ready, pollMs, ticks_us())
+		self._tasks.append(task)
+		return task
+
+	def add_task(self, read, periodMs, ready = None, name = None, pollMs = None):
+		return self.addTask(read, periodMs, ready, name, pollMs)
+
+	def removeTask(self, task):
+		"""
+			Stops running a task.
+
+			:param task: The task returned by addTask()
+
+			:return: None
+		"""
+		if task in self._tasks:
+			self._tasks.remove(task)
+
+	def remove_task(self, task):
+		return self.removeTask(task)
+
+	def tasks(self):
+		"""
+			Returns the scheduled tasks.
+
+			:rtype: list
+		"""
+		return list(self._tasks)
+
+	def runPending(self):
+		"""
+			Runs every task that is due, earliest deadline first.
+
+			:return: Microseconds until the next task is due, or None if there are no tasks
+			:rtype: int
+		"""
+		while True:
+			now = ticks_us()
+			nextTask = None
+			wait = None
+			for task in self._tasks:
+				untilDue = ticks_diff(task._due, now)
+				if untilDue <= 0:
+					if nextTask is None or ticks_diff(task._deadline(), nextTask._deadline()) < 0:
+						nextTask = task
+				elif wait is None or untilDue < wait:
+					wait = untilDue
+
+			if nextTask is None:
+				return wait
+
+			nextTask._run(now)
+
+	def run_pending(self):
+		return self.runPending()
+
+	def run(self, durationMs = None):
+		"""
+			Runs the tasks, sleeping until the next one is due.
+
+			:param durationMs: How long to run for, in milliseconds. Runs forever if not
+				provided.
+
+			:return: None
+		"""
+		start = ticks_us()
+		while True:
+			wait = self.runPending()
+			if durationMs is not None:
+				left = durationMs * 1000 - ticks_diff(ticks_us(), start)
+				if left <= 0:
+					return
+				if wait is None or wait > left:
+					wait = left
+			if wait is None:
+				return
+			sleep(wait / 1000000)
+
+	async def runAsync(self, durationMs = None):
+		"""
+			Same as run(), but waits with asyncio so other tasks, like motor control,
+			run in between the sensor reads.
+
+			:param durationMs: How long to run for, in milliseconds. Runs forever if not
+				provided.
+
+			:return: None
+		"""
+		start = ticks_us()
+		while True:
+			wait = self.runPending()
+			if durationMs is not None:
+				left = durationMs * 1000 - ticks_diff(ticks_us(), start)
+				if left <= 0:
+					return
+				if wait is None or wait > left:
+					wait = left
+			if wait is None:
+				return
+			await asyncSleepMs(wait // 1000)
+
+	async def run_async(self, durationMs = None):
+		await self.runAsync(durationMs)
+
+	def stats(self):
+		"""
+			Returns the counters of every task, keyed by task name. See SchedulerTask.stats().
+
+			:rtype: dict
+		"""
+		return {task.name: task.stats() for task in self._tasks}
+
+	def resetStats(self):
+		"""
+			Clears the counters of every task.
+
+			:return: None
+		"""
+		for task in self._tasks:
+			task.resetStats()
+
+	def reset_stats(self):
+		return self.resetStats()
@@ -0,0 +1,181 @@
+#-----------------------------------------------------------------------------
+# shadow_registers.py
+#
+# Write-through cache of device configuration registers.
+#
+# Drivers often read back configuration registers that only the host ever
+# writes: the gain to scale a reading, a mode bit before a read-modify-write.
+# Each of those reads is a bus transaction. A driver marks such registers as
+# host owned, and the shadow answers reads of them from the last value read
+# or written. Registers the device changes on its own must not be owned.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+shadow_registers
+============
+Keeps the last value of host owned device registers, so they aren't read back.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> shadow = qwiic_i2c.ShadowRegisters((0x00, 0x03))
+	>>> value = shadow.read(0x00, readFn)
+	>>> shadow.write(0x00, value | 0x01, writeFn)
+	>>> shadow.invalidate()
+
+"""
+
+#-----------------------------------------------------------------------------
+# ShadowRegisters
+#
+class ShadowRegisters(object):
+	"""
+	ShadowRegisters
+
+		Last known values of the registers a driver owns.
+
+		Reads of an owned register go to the device once, after that they're served
+		from the shadow. Writes always go to the device and then update the shadow.
+		Registers that aren't owned are passed straight through. After anything that
+		changes the registers behind the driver's back, like a reset, the driver must
+		call invalidate().
+
+		:param registers: The host owned registers
+
+		:return: The shadow registers
+		:rtype: Object
+	"""
+
+	def __init__(self, registers = ()):
+		# Owned registers, with their value or None when it isn't known
+		self._values = {}
+		self.own(registers)
+
+	def own(self, registers):
+		"""
+			Marks registers as host owned.
+
+			:param registers: The registers, their values are read when first needed
+
+			:return: None
+		"""
+		for register in registers:
+			self._values.setdefault(register, None)
+
+	def isOwned(self, register):
+		"""
+			Returns True if a register is host owned.
+
+			:param register: The register
+
+			:rtype: bool
+		"""
+		return register in self._values
+
+	def is_owned(self, register):
+		return self.isOwned(register)
+
+	def get(self, register):
+		"""
+			Returns the shadowed value of a register, without touching the bus.
+
+			:param register: The register
+
+			:return: The value, or None if it isn't known
+			:rtype: int
+		"""
+		return self._values.get(register)
+
+	def read(self, register, readFn):
+		"""
+			Reads a register, from the shadow if its value is known.
+
+			:param register: The register
+			:param readFn: Function reading the register from the device, called with
+				the register when the value isn't known
+
+			:return: The register value
+			:rtype: int
+		"""
+		value = self._values.get(register)
+		if value is None:
+			value = readFn(register)
+			if register in self._values:
+				self._values[register] = value
+		return value
+
+	def write(self, register, value, writeFn):
+		"""
+			Writes a register on the device and updates the shadow.
+
+			:param register: The register
+			:param value: The value to write
+			:param writeFn: Function writing the register on the device, called with
+				the register and the value
+
+			:return: The result of writeFn
+		"""
+		try:
+			result = writeFn(register, value)
+		except:
+			# The write may or may not have happened
+			self.invalidate(register)
+			raise
+
+		self.record(register, value)
+		return result
+
+	def record(self, register, value):
+		"""
+			Updates the shadow with a value the driver wrote or read some other way,
+			e.g. as part of a block write.
+
+			:param register: The register
+			:param value: Its value on the device
+
+			:return: None
+		"""
+		if register in self._values:
+			self._values[register] = value
+
+	def invalidate(self, register = None):
+		"""
+			Forgets shadowed values, so they're read from the device again. Call it after
+			a reset, or anything else that changes the registers.
+
+			:param register: The register to forget, or None to forget all of them
+
+			:return: None
+		"""
+		if register is None:
+			for key in self._values:
+				self._values[key] = None
+		elif register in self._values:
+			self._values[register] = None
@@ -0,0 +1,846 @@
+#-----------------------------------------------------------------------------
+# simulated_devices.py
+#
+# Register map models of common qwiic devices for the simulated I2C bus.
+#
+# The models implement enough of each device's behaviour for its driver to
+# initialize and return data: ID registers, resets, data ready flags and
+# measurement registers. Values are set in raw device units.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+simulated_devices
+============
+Device models for the simulated I2C bus.
+
+:example:
+
+	>>> from qwiic_i2c.simulated_i2c import SimulatedI2C
+	>>> from qwiic_i2c.simulated_devices import SimulatedVL53L1X
+	>>> bus = SimulatedI2C()
+	>>> tof_model = bus.addDevice(0x29, SimulatedVL53L1X())
+	>>> tof_model.setRange(distance = 250)
+	>>> tof = qwiic_vl53l1x.QwiicVL53L1X(i2c_driver = bus)
+	>>> tof.sensor_init()
+	>>> tof.start_ranging()
+	>>> tof.get_distance()
+	250
+
+"""
+
+from .simulated_i2c import SimulatedDevice
+
+#-----------------------------------------------------------------------------
+# SimulatedOTOS
+#
+class SimulatedOTOS(SimulatedDevice):
+	"""
+	SimulatedOTOS
+
+		Model of the SparkFun Optical Tracking Odometry Sensor. Position, velocity and
+		acceleration are set in raw int16 counts with setPosition(), setVelocity() and
+		setAcceleration().
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kProductId = 0x5F
+	kHwVersion = 0x10
+	kFwVersion = 0x10
+
+	kRegProductId = 0x00
+	kRegHwVersion = 0x01
+	kRegFwVersion = 0x02
+	kRegScalarLinear = 0x04
+	kRegScalarAngular = 0x05
+	kRegImuCalib = 0x06
+	kRegReset = 0x07
+	kRegSelfTest = 0x0F
+	kRegPosXL = 0x20
+	kRegVelXL = 0x26
+	kRegAccXL = 0x2C
+	kRegPosStdXL = 0x32
+
+	# Self test result bits
+	kSelfTestPass = 0x04
+
+	def __init__(self):
+		SimulatedDevice.__init__(self, 256, 1)
+
+		self.reset()
+
+		self.onWrite(self.kRegImuCalib, self._imuCalib)
+		self.onWrite(self.kRegReset, self._resetTracking)
+		self.onWrite(self.kRegSelfTest, self._selfTest)
+
+	def reset(self):
+		"""
+			Puts the model back to its power on state.
+
+			:return: None
+		"""
+		self.registers[:] = bytes(len(self.registers))
+		self.registers[self.kRegProductId] = self.kProductId
+		self.registers[self.kRegHwVersion] = self.kHwVersion
+		self.registers[self.kRegFwVersion] = self.kFwVersion
+
+	def _imuCalib(self, device, register, value):
+		# Calibration completes instantly, the sample counter reads back as 0
+		self.registers[register] = 0
+
+	def _resetTracking(self, device, register, value):
+		self.registers[register] = 0
+		self.registers[self.kRegPosXL:self.kRegPosStdXL + 18] = bytes(self.kRegPosStdXL + 18 - self.kRegPosXL)
+
+	def _selfTest(self, device, register, value):
+		if value & 0x01:
+			self.registers[register] = self.kSelfTestPass
+
+	def setPosition(self, x, y, h):
+		self.setWords(self.kRegPosXL, (x, y, h))
+
+	def set_position(self, x, y, h):
+		return self.setPosition(x, y, h)
+
+	def setVelocity(self, x, y, h):
+		self.setWords(self.kRegVelXL, (x, y, h))
+
+	def set_velocity(self, x, y, h):
+		return self.setVelocity(x, y, h)
+
+	def setAcceleration(self, x, y, h):
+		self.setWords(self.kRegAccXL, (x, y, h))
+
+	def set_acceleration(self, x, y, h):
+		return self.setAcceleration(x, y, h)
+
+#-----------------------------------------------------------------------------
+# SimulatedVL53L1X
+#
+class SimulatedVL53L1X(SimulatedDevice):
+	"""
+	SimulatedVL53L1X
+
+		Model of the ST VL53L1X time of flight sensor. While ranging is started, a new
+		result is ready every `conversionTime` seconds of bus time, and stays latched
+		until the interrupt is cleared. The result reported is set with setRange().
+
+		:param conversionTime: Time between results, in seconds. 0 makes a result
+			ready as soon as the interrupt is cleared.
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kModelId = 0xEEAC
+
+	kRegSlaveDeviceAddress = 0x0001
+	kRegGpioHvMuxCtrl = 0x0030
+	kRegGpioTioHvStatus = 0x0031
+	kRegInterruptClear = 0x0086
+	kRegModeStart = 0x0087
+	kRegRangeStatus = 0x0089
+	kRegSpads = 0x008C
+	kRegAmbientRate = 0x0090
+	kRegRangeMm = 0x0096
+	kRegSignalRate = 0x0098
+	kRegFirmwareSystemStatus = 0x00E5
+	kRegModelId = 0x010F
+
+	# Raw range status for a valid measurement
+	kRangeValid = 9
+
+	def __init__(self, conversionTime = 0.0):
+		SimulatedDevice.__init__(self, 0x10000, 2)
+
+		self.conversionTime = conversionTime
+
+		self.distance = 0
+		self.rangeStatus = self.kRangeValid
+		self.signalRate = 0
+		self.ambientRate = 0
+		self.spads = 0
+
+		self.reset()
+
+		self.onRead(self.kRegGpioTioHvStatus, self._updateStatus)
+		self.onWrite(self.kRegInterruptClear, self._clearInterrupt)
+		self.onWrite(self.kRegModeStart, self._modeStart)
+		self.onWrite(self.kRegSlaveDeviceAddress, self._setAddress)
+
+	def reset(self):
+		"""
+			Puts the model back to its power on state.
+
+			:return: None
+		"""
+		self.registers[:] = bytes(len(self.registers))
+		self.setWord(self.kRegModelId, self.kModelId, True)
+		self.registers[self.kRegFirmwareSystemStatus] = 0x01
+
+		self.ranging = False
+		self.dataReady = False
+		self._nextResultTime = 0.0
+
+	def setRange(self, distance, rangeStatus = None, signalRate = None, ambientRate = None, spads = None):
+		"""
+			Sets the values reported by the next results.
+
+			:param distance: The distance in mm
+			:param rangeStatus: The raw range status, 9 for a valid range
+			:param signalRate: Raw signal rate register value
+			:param ambientRate: Raw ambient rate register value
+			:param spads: Raw effective SPAD count register value
+
+			:return: None
+		"""
+		self.distance = distance
+		if rangeStatus is not None:
+			self.rangeStatus = rangeStatus
+		if signalRate is not None:
+			self.signalRate = signalRate
+		if ambientRate is not None:
+			self.ambientRate = ambientRate
+		if spads is not None:
+			self.spads = spads
+
+	def set_range(self, distance, rangeStatus = None, signalRate = None, ambientRate = None, spads = None):
+		return self.setRange(distance, rangeStatus, signalRate, ambientRate, spads)
+
+	def _latchResult(self):
+		self.registers[self.kRegRangeStatus] = self.rangeStatus
+		self.setWord(self.kRegSpads, self.spads, True)
+		self.setWord(self.kRegAmbientRate, self.ambientRate, True)
+		self.setWord(self.kRegRangeMm, self.distance, True)
+		self.setWord(self.kRegSignalRate, self.signalRate, True)
+		self.dataReady = True
+
+	def _updateStatus(self, device, register):
+		if self.ranging and not self.dataReady and self.time() >= self._nextResultTime:
+			self._latchResult()
+
+		# The GPIO status bit matches the interrupt polarity when data is ready
+		activeHigh = not (self.registers[self.kRegGpioHvMuxCtrl] & 0x10)
+		self.registers[register] = 1 if self.dataReady == activeHigh else 0
+
+	def _clearInterrupt(self, device, register, value):
+		self.dataReady = False
+		self._nextResultTime = self.time() + self.conversionTime
+
+	def _modeStart(self, device, register, value):
+		self.ranging = (value & 0x40) != 0
+		self.dataReady = False
+		self._nextResultTime = self.time() + self.conversionTime
+
+	def _setAddress(self, device, register, value):
+		if self.bus is not None:
+			self.bus.moveDevice(self.address, value & 0x7F)
+
+#-----------------------------------------------------------------------------
+# SimulatedBME280
+#
+class SimulatedBME280(SimulatedDevice):
+	"""
+	SimulatedBME280
+
+		Model of the Bosch BME280 humidity, pressure and temperature sensor. The
+		calibration values are the typical values from the datasheet. Measurements are
+		set as raw ADC values with setRaw().
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kChipId = 0x60
+
+	kRegChipId = 0xD0
+	kRegReset = 0xE0
+	kRegCtrlHum = 0xF2
+	kRegCtrlMeas = 0xF4
+	kRegPressure = 0xF7
+	kRegTemperature = 0xFA
+	kRegHumidity = 0xFD
+
+	kResetValue = 0xB6
+
+	# Typical trimming values
+	kCalibrationTP = (27504, 26435, -1000,
+		36477, -10685, 3024, 2855, 140, -7, 15500, -14600, 6000)
+	kCalibrationH1 = 75
+	kCalibrationH2 = 362
+	kCalibrationH3 = 0
+	kCalibrationH4 = 324
+	kCalibrationH5 = 50
+	kCalibrationH6 = 30
+
+	def __init__(self):
+		SimulatedDevice.__init__(self, 256, 1)
+
+		# About 25 C, 1006 hPa and 46 %RH with the typical calibration
+		self.adcT = 519888
+		self.adcP = 415148
+		self.adcH = 27000
+
+		self.reset()
+
+		self.onWrite(self.kRegReset, self._reset)
+		self.onWrite(self.kRegCtrlMeas, self._ctrlMeas)
+
+	def reset(self):
+		"""
+			Puts the model back to its power on state.
+
+			:return: None
+		"""
+		self.registers[:] = bytes(len(self.registers))
+		self.registers[self.kRegChipId] = self.kChipId
+
+		self.setWords(0x88, self.kCalibrationTP)
+		self.registers[0xA1] = self.kCalibrationH1
+		self.setWord(0xE1, self.kCalibrationH2)
+		self.registers[0xE3] = self.kCalibrationH3
+		self.registers[0xE4] = (self.kCalibrationH4 >> 4) & 0xFF
+		self.registers[0xE5] = (self.kCalibrationH4 & 0x0F) | ((self.kCalibrationH5 & 0x0F) << 4)
+		self.registers[0xE6] = (self.kCalibrationH5 >> 4) & 0xFF
+		self.registers[0xE7] = self.kCalibrationH6 & 0xFF
+
+		self._updateData()
+
+	def _reset(self, device, register, value):
+		if value == self.kResetValue:
+			self.reset()
+		self.registers[register] = 0
+
+	def _ctrlMeas(self, device, register, value):
+		# A forced measurement completes straight away, back to sleep mode
+		if (value & 0x03) in (0x01, 0x02):
+			self.registers[register] = value & ~0x03
+
+	def _updateData(self):
+		for register, value in ((self.kRegPressure, self.adcP), (self.kRegTemperature, self.adcT)):
+			self.registers[register] = (value >> 12) & 0xFF
+			self.registers[register + 1] = (value >> 4) & 0xFF
+			self.registers[register + 2] = (value << 4) & 0xF0
+		self.setWord(self.kRegHumidity, self.adcH, True)
+
+	def setRaw(self, adcT = None, adcP = None, adcH = None):
+		"""
+			Sets the raw ADC values reported by the data registers.
+
+			:param adcT: The 20 bit raw temperature
+			:param adcP: The 20 bit raw pressure
+			:param adcH: The 16 bit raw humidity
+
+			:return: None
+		"""
+		if adcT is not None:
+			self.adcT = adcT
+		if adcP is not None:
+			self.adcP = adcP
+		if adcH is not None:
+			self.adcH = adcH
+		self._updateData()
+
+	def set_raw(self, adcT = None, adcP = None, adcH = None):
+		return self.setRaw(adcT, adcP, adcH)
+
+#-----------------------------------------------------------------------------
+# SimulatedLSM6DSO
+#
+class SimulatedLSM6DSO(SimulatedDevice):
+	"""
+	SimulatedLSM6DSO
+
+		Model of the ST LSM6DSO 6DoF IMU. The status register reports data ready for the
+		accelerometer and gyroscope while their output data rate is not 0. Outputs are
+		set in raw int16 counts with setAccel(), setGyro() and setTemperature().
+
+		The FIFO is filled with fillFifo(), which batches the current outputs at the
+		batch data rates in FIFO_CTRL3. FIFO mode stops when the FIFO is full, the
+		continuous modes overwrite the oldest words and latch the overrun flag.
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kWhoAmI = 0x6C
+
+	kRegFifoCtrl1 = 0x07
+	kRegFifoCtrl2 = 0x08
+	kRegFifoCtrl3 = 0x09
+	kRegFifoCtrl4 = 0x0A
+	kRegWhoAmI = 0x0F
+	kRegCtrl1Xl = 0x10
+	kRegCtrl2G = 0x11
+	kRegCtrl3C = 0x12
+	kRegCtrl10C = 0x19
+	kRegStatus = 0x1E
+	kRegOutTemp = 0x20
+	kRegOutGyro = 0x22
+	kRegOutAccel = 0x28
+	kRegFifoStatus1 = 0x3A
+	kRegFifoStatus2 = 0x3B
+	kRegFifoDataOutTag = 0x78
+	kRegFifoDataOutZH = 0x7E
+
+	kFifoTagGyro = 0x01
+	kFifoTagAccel = 0x02
+	kFifoModeFifo = 0x01
+	kFifoWords = 512
+
+	# Batch data rates in Hz, by FIFO_CTRL3 value. They only differ in the
+	# slowest one, 1.6 Hz for the accelerometer and 6.5 Hz for the gyroscope.
+	kAccelBatchRates = (0, 12.5, 26, 52, 104, 208, 416, 833, 1660, 3330, 6660, 1.6)
+	kGyroBatchRates = (0, 12.5, 26, 52, 104, 208, 416, 833, 1660, 3330, 6660, 6.5)
+
+	kCtrl3CSwReset = 0x01
+	# IF_INC is set after reset
+	kCtrl3CDefault = 0x04
+
+	def __init__(self):
+		SimulatedDevice.__init__(self, 128, 1)
+
+		self.reset()
+
+		self.onWrite(self.kRegCtrl3C, self._ctrl3C)
+		self.onWrite(self.kRegFifoCtrl4, self._fifoCtrl4)
+		self.onRead(self.kRegStatus, self._updateStatus)
+		self.onRead(self.kRegFifoStatus1, self._updateFifoStatus)
+		self.onRead(self.kRegFifoStatus2, self._updateFifoStatus)
+
+	def reset(self):
+		"""
+			Puts the model back to its power on state.
+
+			:return: None
+		"""
+		self.registers[:] = bytes(len(self.registers))
+		self.registers[self.kRegWhoAmI] = self.kWhoAmI
+		self.registers[self.kRegCtrl3C] = self.kCtrl3CDefault
+		self._clearFifo()
+
+	def _clearFifo(self):
+		self._fifo = []
+		self._fifoSlot = 0
+		self._fifoOverrun = False
+		self._fifoWord = b""
+
+	def _ctrl3C(self, device, register, value):
+		if value & self.kCtrl3CSwReset:
+			# Control registers go back to their defaults, the bit clears itself
+			for ctrl in range(self.kRegFifoCtrl1, self.kRegFifoCtrl4 + 1):
+				self.registers[ctrl] = 0
+			for ctrl in range(self.kRegCtrl1Xl, self.kRegCtrl10C + 1):
+				self.registers[ctrl] = 0
+			self.registers[register] = self.kCtrl3CDefault
+			self._clearFifo()
+
+	def _fifoCtrl4(self, device, register, value):
+		if value & 0x07 == 0:
+			# Bypass mode empties the FIFO
+			self._clearFifo()
+
+	def _updateFifoStatus(self, device, register):
+		count = len(self._fifo)
+		watermark = self.registers[self.kRegFifoCtrl1] | ((self.registers[self.kRegFifoCtrl2] & 0x01) << 8)
+
+		status2 = (count >> 8) & 0x03
+		if watermark and count >= watermark:
+			status2 |= 0x80
+		if self._fifoOverrun:
+			status2 |= 0x48
+		if count >= self.kFifoWords:
+			status2 |= 0x20
+
+		self.registers[self.kRegFifoStatus1] = count & 0xFF
+		self.registers[self.kRegFifoStatus2] = status2
+
+		if register == self.kRegFifoStatus2:
+			# Reading FIFO_STATUS2 clears the latched overrun
+			self._fifoOverrun = False
+
+	def _pushFifo(self, tag, outRegister):
+		if len(self._fifo) >= self.kFifoWords:
+			if self.registers[self.kRegFifoCtrl4] & 0x07 == self.kFifoModeFifo:
+				return
+			self._fifo.pop(0)
+			self._fifoOverrun = True
+
+		tagByte = (tag << 3) | ((self._fifoSlot & 0x03) << 1)
+		self._fifo.append(bytes((tagByte,)) + self.getBlock(outRegister, 6))
+
+	def fillFifo(self, nSlots):
+		"""
+			Batches samples in the FIFO for a number of time slots of the fastest
+			batched sensor. The slower one is batched in the slots its rate falls on.
+			Nothing is batched in bypass mode.
+
+			:param nSlots: The number of time slots
+
+			:return: None
+		"""
+		if self.registers[self.kRegFifoCtrl4] & 0x07 == 0:
+			return
+
+		ctrl3 = self.registers[self.kRegFifoCtrl3]
+		accelRate = self.kAccelBatchRates[ctrl3 & 0x0F] if ctrl3 & 0x0F < len(self.kAccelBatchRates) else 0
+		gyroRate = self.kGyroBatchRates[ctrl3 >> 4] if ctrl3 >> 4 < len(self.kGyroBatchRates) else 0
+		fastest = max(accelRate, gyroRate)
+		if fastest == 0:
+			return
+
+		for i in range(nSlots):
+			self._fifoSlot += 1
+			if gyroRate and self._fifoSlot % round(fastest / gyroRate) == 0:
+				self._pushFifo(self.kFifoTagGyro, self.kRegOutGyro)
+			if accelRate and self._fifoSlot % round(fastest / accelRate) == 0:
+				self._pushFifo(self.kFifoTagAccel, self.kRegOutAccel)
+
+	def fill_fifo(self, nSlots):
+		return self.fillFifo(nSlots)
+
+	def readInto(self, buf, offset, nBytes):
+		if self.pointer < self.kRegFifoDataOutTag or self.pointer > self.kRegFifoDataOutZH:
+			return SimulatedDevice.readInto(self, buf, offset, nBytes)
+
+		for i in range(nBytes):
+			index = self.pointer - self.kRegFifoDataOutTag
+			if index == 0:
+				# Reading the tag moves on to the next word, an empty FIFO reads as zeros
+				self._fifoWord = self._fifo.pop(0) if self._fifo else bytes(7)
+			buf[offset + i] = self._fifoWord[index] if index < len(self._fifoWord) else 0
+
+			# The address rolls back to the tag after the last byte of a word
+			if self.pointer == self.kRegFifoDataOutZH:
+				self.pointer = self.kRegFifoDataOutTag
+			else:
+				self.pointer += 1
+
+	def _updateStatus(self, device, register):
+		status = 0
+		if self.registers[self.kRegCtrl1Xl] & 0xF0:
+			# Accelerometer and temperature data ready
+			status |= 0x05
+		if self.registers[self.kRegCtrl2G] & 0xF0:
+			status |= 0x06
+		self.registers[register] = status
+
+	def setAccel(self, x, y, z):
+		self.setWords(self.kRegOutAccel, (x, y, z))
+
+	def set_accel(self, x, y, z):
+		return self.setAccel(x, y, z)
+
+	def setGyro(self, x, y, z):
+		self.setWords(self.kRegOutGyro, (x, y, z))
+
+	def set_gyro(self, x, y, z):
+		return self.setGyro(x, y, z)
+
+	def setTemperature(self, value):
+		self.setWord(self.kRegOutTemp, value)
+
+	def set_temperature(self, value):
+		return self.setTemperature(value)
+
+#-----------------------------------------------------------------------------
+# SimulatedVL53L5CX
+#
+class SimulatedVL53L5CX(SimulatedDevice):
+	"""
+	SimulatedVL53L5CX
+
+		Model of the ST VL53L5CX multizone time of flight sensor, while ranging in 8x8
+		mode with every output enabled. The ranging frame is readable from register 0
+		and a new frame (with a new stream count) is ready every `framePeriod` seconds
+		of bus time. Zone values are set with setZones().
+
+		The model doesn't implement the firmware upload or the DCI commands, so drivers
+		should be set up to skip them (see kFrameSize).
+
+		:param framePeriod: Time between frames, in seconds. 0 makes a new frame ready
+			on every read of the frame.
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kZones = 64
+
+	# Size of a frame with every output enabled in 8x8 mode, the same as the
+	# driver's data_read_size after start_ranging()
+	kFrameSize = 1440
+
+	kStartBh = 0x0000000D
+	kCommonDataBh = 0x54C00040
+	kAmbientRateBh = 0x54D00104
+	kSpadCountBh = 0x55D00404
+	kNbTargetDetectedBh = 0xCF7C0401
+	kSignalRateBh = 0xCFBC0404
+	kRangeSigmaMmBh = 0xD2BC0402
+	kDistanceBh = 0xD33C0402
+	kReflectanceBh = 0xD43C0401
+	kTargetStatusBh = 0xD47C0401
+	kMotionDetectBh = 0xCC5008C0
+
+	def __init__(self, framePeriod = 0.0):
+		SimulatedDevice.__init__(self, 0x10000, 2)
+
+		self.framePeriod = framePeriod
+		self.streamCount = 0
+		self._nextFrameTime = 0.0
+
+		zones = self.kZones
+		self.distance = [1000 + 10 * i for i in range(zones)]
+		self.targetStatus = [5] * zones
+		self.nbTargetDetected = [1] * zones
+		self.ambientPerSpad = [2 * 2048] * zones
+		self.nbSpadsEnabled = [200] * zones
+		self.signalPerSpad = [1500 * 2048] * zones
+		self.rangeSigmaMm = [3 * 128] * zones
+		self.reflectance = [50] * zones
+
+		self._buildFrame()
+
+		self.onRead(0x0000, self._frameRead)
+
+	def setZones(self, distance = None, targetStatus = None, nbTargetDetected = None,
+			ambientPerSpad = None, nbSpadsEnabled = None, signalPerSpad = None,
+			rangeSigmaMm = None, reflectance = None):
+		"""
+			Sets the per zone values of the following frames. Each value is a list of 64
+			raw values, as sent by the sensor.
+
+			:return: None
+		"""
+		if distance is not None:
+			self.distance = list(distance)
+		if targetStatus is not None:
+			self.targetStatus = list(targetStatus)
+		if nbTargetDetected is not None:
+			self.nbTargetDetected = list(nbTargetDetected)
+		if ambientPerSpad is not None:
+			self.ambientPerSpad = list(ambientPerSpad)
+		if nbSpadsEnabled is not None:
+			self.nbSpadsEnabled = list(nbSpadsEnabled)
+		if signalPerSpad is not None:
+			self.signalPerSpad = list(signalPerSpad)
+		if rangeSigmaMm is not None:
+			self.rangeSigmaMm = list(rangeSigmaMm)
+		if reflectance is not None:
+			self.reflectance = list(reflectance)
+
+		self._buildFrame()
+
+	def set_zones(self, *args, **argk):
+		return self.setZones(*args, **argk)
+
+	def _blockHeader(self, bh):
+		# Per zone blocks have their size patched to the resolution, same as the driver
+		if 0x01 <= (bh & 0x0F) < 0x0D:
+			bh = (bh & ~0xFFF0) | (self.kZones << 4)
+		return bh
+
+	def _buildFrame(self):
+		# The frame is built in host byte order, then every 32 bit word is swapped
+		# into the order the sensor sends it in
+		frame = bytearray(self.kFrameSize)
+		blocks = (
+			(self.kCommonDataBh, 4, [0]),
+			(self.kAmbientRateBh, 4, self.ambientPerSpad),
+			(self.kSpadCountBh, 4, self.nbSpadsEnabled),
+			(self.kNbTargetDetectedBh, 1, self.nbTargetDetected),
+			(self.kSignalRateBh, 4, self.signalPerSpad),
+			(self.kRangeSigmaMmBh, 2, self.rangeSigmaMm),
+			(self.kDistanceBh, 2, self.distance),
+			(self.kReflectanceBh, 1, self.reflectance),
+			(self.kTargetStatusBh, 1, self.targetStatus),
+			(self.kMotionDetectBh, 4, [0] * 35),
+		)
+
+		pos = 16
+		for bh, width, values in blocks:
+			frame[pos:pos + 4] = self._blockHeader(bh).to_bytes(4, "little")
+			pos += 4
+			for value in values:
+				frame[pos:pos + width] = (value & ((1 << (8 * width)) - 1)).to_bytes(width, "little")
+				pos += width
+
+		for i in range(0, self.kFrameSize, 4):
+			self.registers[i:i + 4] = bytes(reversed(frame[i:i + 4]))
+
+		self._setHeader()
+
+	def _setHeader(self):
+		# Stream count, then the flags the driver checks for data ready
+		self.registers[0:4] = bytes((self.streamCount, 0x05, 0x05, 0x10))
+
+	def _frameRead(self, device, register):
+		if self.time() >= self._nextFrameTime:
+			# The stream count wraps before 255, which means "not ranging"
+			self.streamCount = (self.streamCount + 1) % 255
+			self._nextFrameTime = self.time() + self.framePeriod
+			self._setHeader()
+
+#-----------------------------------------------------------------------------
+# SimulatedMAX3010x
+#
+class SimulatedMAX3010x(SimulatedDevice):
+	"""
+	SimulatedMAX3010x
+
+		Model of the MAX3010x particle sensor FIFO. Samples are added with fillFifo()
+		and read back from the FIFO data register, which doesn't auto-increment. The
+		number of channels per sample follows the LED mode in MODECONFIG.
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kPartId = 0x15
+
+	kRegFifoWritePtr = 0x04
+	kRegFifoReadPtr = 0x06
+	kRegFifoData = 0x07
+	kRegModeConfig = 0x09
+	kRegPartId = 0xFF
+
+	kFifoDepth = 32
+
+	def __init__(self):
+		SimulatedDevice.__init__(self, 256, 1)
+
+		self.sample = (0x01234, 0x02345, 0x03456)
+
+		self.reset()
+
+		self.onWrite(self.kRegModeConfig, self._modeConfig)
+
+	def reset(self):
+		"""
+			Puts the model back to its power on state.
+
+			:return: None
+		"""
+		self.registers[:] = bytes(len(self.registers))
+		self.registers[self.kRegPartId] = self.kPartId
+		self._byteIndex = 0
+
+	def _modeConfig(self, device, register, value):
+		if value & 0x40:
+			# Reset completes instantly, and the bit clears itself
+			self.reset()
+
+	def channels(self):
+		mode = self.registers[self.kRegModeConfig] & 0x07
+		if mode == 0x07:
+			return 3
+		if mode == 0x03:
+			return 2
+		return 1
+
+	def fillFifo(self, nSamples):
+		"""
+			Makes new samples available in the FIFO.
+
+			:param nSamples: The number of samples in the FIFO, less than 32
+
+			:return: None
+		"""
+		readPtr = self.registers[self.kRegFifoReadPtr]
+		self.registers[self.kRegFifoWritePtr] = (readPtr + nSamples) % self.kFifoDepth
+
+	def fill_fifo(self, nSamples):
+		return self.fillFifo(nSamples)
+
+	def readInto(self, buf, offset, nBytes):
+		if self.pointer != self.kRegFifoData:
+			return SimulatedDevice.readInto(self, buf, offset, nBytes)
+
+		sampleSize = 3 * self.channels()
+		for i in range(nBytes):
+			index = self._byteIndex
+			value = self.sample[(index // 3) % len(self.sample)]
+			buf[offset + i] = (value >> (8 * (2 - index % 3))) & 0xFF
+
+			index += 1
+			if index == sampleSize:
+				# A whole sample has been read, move the FIFO read pointer on
+				index = 0
+				readPtr = self.registers[self.kRegFifoReadPtr]
+				self.registers[self.kRegFifoReadPtr] = (readPtr + 1) % self.kFifoDepth
+			self._byteIndex = index
+
+#-----------------------------------------------------------------------------
+# SimulatedTitanGps
+#
+class SimulatedTitanGps(SimulatedDevice):
+	"""
+	SimulatedTitanGps
+
+		Model of the Titan X1 GPS I2C interface. NMEA text added with feed() is read
+		back as a byte stream; once it runs out the module returns newlines.
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	kIdle = 0x0A
+
+	def __init__(self):
+		SimulatedDevice.__init__(self, 256, 1)
+
+		self._stream = b""
+		self._streamIndex = 0
+
+	def feed(self, text):
+		"""
+			Queues NMEA text to be read by the host.
+
+			:param text: The sentences to queue, as a str or bytes
+
+			:return: None
+		"""
+		if isinstance(text, str):
+			text = text.encode()
+		self._stream = self._stream[self._streamIndex:] + text
+		self._streamIndex = 0
+
+	def readInto(self, buf, offset, nBytes):
+		stream = self._stream
+		index = self._streamIndex
+		for i in range(nBytes):
+			if index < len(stream):
+				buf[offset + i] = stream[index]
+				index += 1
+			else:
+				buf[offset + i] = self.kIdle
+		self._streamIndex = index
@@ -0,0 +1,578 @@
+#-----------------------------------------------------------------------------
+# simulated_i2c.py
+#
+# Simulated I2C bus for running the qwiic drivers on a host without hardware.
+#
+# Devices are modeled as register maps (see SimulatedDevice) and attached to
+# the bus by address. The bus keeps count of transactions and bytes on the
+# wire and works out how long each transaction would take at the configured
+# bus clock, so driver throughput can be measured and regression tested in CI.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+simulated_i2c
+============
+A simulated I2C bus. Attach device models by address and pass the bus to any
+qwiic driver as its `i2c_driver`.
+
+The simulated platform is never picked automatically unless the
+`QWIIC_I2C_SIMULATED` environment variable is set, in which case
+getI2CDriver() returns a SimulatedI2C on hosts without a real bus.
+
+:example:
+
+	>>> from qwiic_i2c.simulated_i2c import SimulatedI2C
+	>>> from qwiic_i2c.simulated_devices import SimulatedOTOS
+	>>> bus = SimulatedI2C(freq=400000)
+	>>> otos_model = bus.addDevice(0x17, SimulatedOTOS())
+	>>> otos = qwiic_otos.QwiicOTOS(i2c_driver=bus)
+	>>> otos.begin()
+	True
+	>>> bus.transactions, bus.busTime
+
+"""
+
+from .i2c_driver import I2CDriver
+
+import sys
+import time
+
+_PLATFORM_NAME = "Simulated"
+
+# Error number raised when no device acknowledges, matches MicroPython's EIO
+_EIO = 5
+
+# Every byte on the wire is 8 data bits and an ACK bit
+_BITS_PER_BYTE = 9
+
+#-----------------------------------------------------------------------------
+# SimulatedDevice
+#
+# Base class for device models. Holds the register map and the register
+# pointer, and implements the usual "write register address, then read or
+# write with auto-increment" protocol.
+#
+class SimulatedDevice(object):
+	"""
+	SimulatedDevice
+
+		A register map device model for the simulated I2C bus.
+
+		:param size: Number of registers in the map
+		:param addressSize: Size of the register address in bytes, 1 or 2
+
+		:return: The device model
+		:rtype: Object
+	"""
+
+	def __init__(self, size = 256, addressSize = 1):
+		self.registers = bytearray(size)
+		self.addressSize = addressSize
+		self.pointer = 0
+
+		# Set by the bus when the device is attached
+		self.bus = None
+		self.address = None
+
+		self._readCallbacks = {}
+		self._writeCallbacks = {}
+
+	#-------------------------------------------------------------------------
+	# Behaviour callbacks
+
+	def onRead(self, register, callback):
+		"""
+			Registers a callback run just before the byte at `register` is read by the host.
+			Use it to latch new measurements, clear status flags, etc.
+
+			:param register: The register to watch
+			:param callback: Called as callback(device, register)
+
+			:return: None
+		"""
+		self._readCallbacks[register] = callback
+
+	def on_read(self, register, callback):
+		return self.onRead(register, callback)
+
+	def onWrite(self, register, callback):
+		"""
+			Registers a callback run just after the host writes the byte at `register`.
+			Use it for command registers, resets, etc.
+
+			:param register: The register to watch
+			:param callback: Called as callback(device, register, value)
+
+			:return: None
+		"""
+		self._writeCallbacks[register] = callback
+
+	def on_write(self, register, callback):
+		return self.onWrite(register, callback)
+
+	def time(self):
+		"""
+			The current time of the bus the device is attached to, in seconds.
+
+			:rtype: float
+		"""
+		if self.bus is None:
+			return 0.0
+		return self.bus.time()
+
+	#-------------------------------------------------------------------------
+	# Bus side of the device. Models with a protocol other than a register map
+	# override these.
+
+	def write(self, data):
+		"""
+			Called by the bus with the bytes of a write transaction. The first
+			`addressSize` bytes set the register pointer, the rest are stored from there.
+
+			:param data: The bytes written by the host
+
+			:return: None
+		"""
+		n = len(data)
+		if n == 0:
+			# Address probe, nothing to do
+			return
+
+		pointer = 0
+		for i in range(min(n, self.addressSize)):
+			pointer = (pointer << 8) | data[i]
+
+		size = len(self.registers)
+		for i in range(self.addressSize, n):
+			self.registers[pointer] = data[i]
+			callback = self._writeCallbacks.get(pointer)
+			if callback is not None:
+				callback(self, pointer, data[i])
+			pointer = (pointer + 1) % size
+
+		self.pointer = pointer
+
+	def readInto(self, buf, offset, nBytes):
+		"""
+			Called by the bus for a read transaction. Reads from the register pointer
+			with auto-increment.
+
+			:param buf: The buffer to read into
+			:param offset: The position in buf to start at
+			:param nBytes: The number of bytes to read
+
+			:return: None
+		"""
+		pointer = self.pointer
+		size = len(self.registers)
+		for i in range(nBytes):
+			callback = self._readCallbacks.get(pointer)
+			if callback is not None:
+				callback(self, pointer)
+			buf[offset + i] = self.registers[pointer]
+			pointer = (pointer + 1) % size
+
+		self.pointer = pointer
+
+	#-------------------------------------------------------------------------
+	# Helpers for models to set and get register values without triggering
+	# the behaviour callbacks
+
+	def setBlock(self, register, data):
+		self.registers[register:register + len(data)] = bytes(data)
+
+	def getBlock(self, register, nBytes):
+		return bytes(self.registers[register:register + nBytes])
+
+	def setWord(self, register, value, bigEndian = False):
+		value &= 0xFFFF
+		if bigEndian:
+			self.registers[register] = value >> 8
+			self.registers[register + 1] = value & 0xFF
+		else:
+			self.registers[register] = value & 0xFF
+			self.registers[register + 1] = value >> 8
+
+	def getWord(self, register, bigEndian = False, signed = False):
+		if bigEndian:
+			value = (self.registers[register] << 8) | self.registers[register + 1]
+		else:
+			value = (self.registers[register + 1] << 8) | self.registers[register]
+		if signed and value > 32767:
+			value -= 65536
+		return value
+
+	def setWords(self, register, values, bigEndian = False):
+		for value in values:
+			self.setWord(register, value, bigEndian)
+			register += 2
+
+#-----------------------------------------------------------------------------
+# SimulatedI2C
+#
+class SimulatedI2C(I2CDriver):
+	"""
+	SimulatedI2C
+
+		I2C driver that talks to device models instead of hardware.
+
+		:param freq: The simulated bus clock in Hz
+		:param latency: Fixed overhead added to every transaction, in seconds. Models
+			the time the host spends setting up a transfer.
+		:param realtime: If True, every transaction sleeps for its simulated duration.
+			Otherwise the time is only added to `busTime`.
+
+		:return: The simulated I2C driver
+		:rtype: Object
+	"""
+
+	name = _PLATFORM_NAME
+
+	# Same as MicroPython, writes of any length
+	maxWriteSize = None
+
+	def __init__(self, freq = 100000, latency = 0.0, realtime = False, *args, **argk):
+		I2CDriver.__init__(self) # init super
+
+		self.freq = freq
+		self.latency = latency
+		self.realtime = realtime
+
+		self._devices = {}
+		self._timeOffset = 0.0
+
+		self.resetCounters()
+
+	def getFreq(self):
+		return self.freq
+
+	def get_freq(self):
+		return self.getFreq()
+
+	def setFreq(self, freq):
+		self.freq = freq
+
+	def set_freq(self, freq):
+		return self.setFreq(freq)
+
+	@classmethod
+	def isPlatform(cls):
+		# Only picked by getI2CDriver() when asked for, so it never hides a real bus
+		try:
+			import os
+			return bool(os.environ.get("QWIIC_I2C_SIMULATED"))
+		except:
+			return False
+
+	@classmethod
+	def is_platform(cls):
+		return cls.isPlatform()
+
+	#-------------------------------------------------------------------------
+	# Device management
+
+	def addDevice(self, address, device):
+		"""
+			Attaches a device model to the bus.
+
+			:param address: The I2C address of the device
+			:param device: The SimulatedDevice model
+
+			:return: The device model
+		"""
+		device.bus = self
+		device.address = address
+		self._devices[address] = device
+		self.scanCache.invalidate(address)
+		return device
+
+	def add_device(self, address, device):
+		return self.addDevice(address, device)
+
+	def removeDevice(self, address):
+		"""
+			Detaches the device model at the given address, if any.
+
+			:param address: The I2C address of the device
+
+			:return: The removed device model, or None
+		"""
+		device = self._devices.pop(address, None)
+		if device is not None:
+			device.bus = None
+		self.scanCache.invalidate(address)
+		return device
+
+	def remove_device(self, address):
+		return self.removeDevice(address)
+
+	def moveDevice(self, address, newAddress):
+		"""
+			Moves a device model to a new address, for devices with a programmable
+			I2C address.
+
+			:param address: The current I2C address of the device
+			:param newAddress: The new I2C address
+
+			:return: None
+		"""
+		device = self._devices.pop(address)
+		self.addDevice(newAddress, device)
+
+	def move_device(self, address, newAddress):
+		return self.moveDevice(address, newAddress)
+
+	def getDevice(self, address):
+		return self._devices.get(address)
+
+	def get_device(self, address):
+		return self.getDevice(address)
+
+	#-------------------------------------------------------------------------
+	# Timing and counters
+
+	def resetCounters(self):
+		"""
+			Clears the transaction, byte and bus time counters.
+
+			:return: None
+		"""
+		self.transactions = 0
+		self.bytesWritten = 0
+		self.bytesRead = 0
+		self.busTime = 0.0
+
+	def reset_counters(self):
+		return self.resetCounters()
+
+	def time(self):
+		"""
+			The bus time in seconds, used by device models for conversion times and
+			data ready flags. In realtime mode this is the host clock, otherwise it is the
+			simulated time spent on the bus plus any time passed with advance().
+
+			:rtype: float
+		"""
+		if self.realtime:
+			return time.monotonic()
+		return self.busTime + self._timeOffset
+
+	def advance(self, seconds):
+		"""
+			Moves the simulated time forward without any bus traffic, e.g. to stand in for
+			a sleep in the code under test.
+
+			:param seconds: The time to advance by
+
+			:return: None
+		"""
+		self._timeOffset += seconds
+
+	def transactionTime(self, nWrite, nRead, repeatedStart = False):
+		"""
+			The time one transaction takes on the wire at the current bus clock, plus
+			the per-transaction latency.
+
+			:param nWrite: Bytes written, not counting the address byte
+			:param nRead: Bytes read, not counting the address byte
+			:param repeatedStart: True for a write followed by a read with no stop between
+
+			:return: The transaction time in seconds
+			:rtype: float
+		"""
+		nBytes = 1 + nWrite + nRead
+		# Start and stop conditions take about a bit time each
+		nBits = 2
+		if repeatedStart:
+			# Repeated start and a second address byte
+			nBytes += 1
+			nBits += 1
+		nBits += nBytes * _BITS_PER_BYTE
+		return nBits / self.freq + self.latency
+
+	def transaction_time(self, nWrite, nRead, repeatedStart = False):
+		return self.transactionTime(nWrite, nRead, repeatedStart)
+
+	def _account(self, nWrite, nRead, repeatedStart = False):
+		seconds = self.transactionTime(nWrite, nRead, repeatedStart)
+		self.transactions += 1
+		self.bytesWritten += nWrite
+		self.bytesRead += nRead
+		self.busTime += seconds
+		if self.realtime:
+			time.sleep(seconds)
+
+	def _device(self, address):
+		device = self._devices.get(address)
+		if device is None:
+			# Nothing ACKs the address, the transaction still took bus time
+			self._account(0, 0)
+			raise OSError(_EIO, "EIO")
+		return device
+
+	#-------------------------------------------------------------------------
+	# Transfers, all commands go through these
+
+	def _writeRead(self, address, writeData, buf, offset, nBytes):
+		device = self._device(address)
+		nWrite = len(writeData) if writeData is not None else 0
+		if nWrite:
+			device.write(writeData)
+		if nBytes:
+			device.readInto(buf, offset, nBytes)
+		self._account(nWrite, nBytes, nWrite > 0 and nBytes > 0)
+
+	def _read(self, address, writeData, nBytes):
+		buf = bytearray(nBytes)
+		self._writeRead(address, writeData, buf, 0, nBytes)
+		return bytes(buf)
+
+	def _commandBytes(self, commandCode):
+		return None if commandCode is None else bytes((commandCode,))
+
+	# read commands ----------------------------------------------------------
+	def readWord(self, address, commandCode):
+		buffer = self._read(address, self._commandBytes(commandCode), 2)
+		return (buffer[1] << 8) | buffer[0]
+
+	def read_word(self, address, commandCode):
+		return self.readWord(address, commandCode)
+
+	def readByte(self, address, commandCode = None):
+		return self._read(address, self._commandBytes(commandCode), 1)[0]
+
+	def read_byte(self, address, commandCode = None):
+		return self.readByte(address, commandCode)
+
+	def readBlock(self, address, commandCode, nBytes):
+		return self._read(address, self._commandBytes(commandCode), nBytes)
+
+	def read_block(self, address, commandCode, nBytes):
+		return self.readBlock(address, commandCode, nBytes)
+
+	def readBlockInto(self, address, commandCode, buf, offset = 0, nBytes = None):
+		if nBytes is None:
+			nBytes = len(buf) - offset
+		self._writeRead(address, self._commandBytes(commandCode), buf, offset, nBytes)
+		return nBytes
+
+	def read_block_into(self, address, commandCode, buf, offset = 0, nBytes = None):
+		return self.readBlockInto(address, commandCode, buf, offset, nBytes)
+
+	def readReg16(self, address, register, nBytes):
+		return self._read(address, bytes(((register >> 8) & 0xFF, register & 0xFF)), nBytes)
+
+	def read_reg16(self, address, register, nBytes):
+		return self.readReg16(address, register, nBytes)
+
+	def readReg16Into(self, address, register, buf, offset = 0, nBytes = None):
+		if nBytes is None:
+			nBytes = len(buf) - offset
+		self._writeRead(address, bytes(((register >> 8) & 0xFF, register & 0xFF)), buf, offset, nBytes)
+		return nBytes
+
+	def read_reg16_into(self, address, register, buf, offset = 0, nBytes = None):
+		return self.readReg16Into(address, register, buf, offset, nBytes)
+
+	# write commands----------------------------------------------------------
+	def _write(self, address, data):
+		self._writeRead(address, data, None, 0, 0)
+
+	def writeCommand(self, address, commandCode):
+		self._write(address, bytes((commandCode,)))
+
+	def write_command(self, address, commandCode):
+		return self.writeCommand(address, commandCode)
+
+	def writeWord(self, address, commandCode, value):
+		self._write(address, bytes((commandCode, value & 0xFF, (value >> 8) & 0xFF)))
+
+	def write_word(self, address, commandCode, value):
+		return self.writeWord(address, commandCode, value)
+
+	def writeByte(self, address, commandCode, value):
+		self._write(address, bytes((commandCode, value & 0xFF)))
+
+	def write_byte(self, address, commandCode, value):
+		return self.writeByte(address, commandCode, value)
+
+	def writeBlock(self, address, commandCode, value):
+		self._write(address, bytes((commandCode,)) + bytes(value))
+
+	def write_block(self, address, commandCode, value):
+		return self.writeBlock(address, commandCode, value)
+
+	def writeBlockFrom(self, address, commandCode, buf):
+		if commandCode is None:
+			self._write(address, bytes(buf))
+		else:
+			self._write(address, bytes((commandCode,)) + bytes(buf))
+
+	def write_block_from(self, address, commandCode, buf):
+		return self.writeBlockFrom(address, commandCode, buf)
+
+	def writeReg16(self, address, register, data):
+		self._write(address, bytes(((register >> 8) & 0xFF, register & 0xFF)) + bytes(data))
+
+	def write_reg16(self, address, register, data):
+		return self.writeReg16(address, register, data)
+
+	def writeReadBlock(self, address, writeBytes, readNBytes):
+		return self._read(address, bytes(writeBytes), readNBytes)
+
+	def write_read_block(self, address, writeBytes, readNBytes):
+		return self.writeReadBlock(address, writeBytes, readNBytes)
+
+	def isDeviceConnected(self, devAddress):
+		isConnected = self.scanCache.lookup(devAddress)
+		if isConnected is not None:
+			return isConnected
+
+		# A zero length write, same as the hardware drivers
+		self._account(0, 0)
+		isConnected = devAddress in self._devices
+		self.scanCache.record(devAddress, isConnected)
+		return isConnected
+
+	def is_device_connected(self, devAddress):
+		return self.isDeviceConnected(devAddress)
+
+	def ping(self, devAddress):
+		return self.isDeviceConnected(devAddress)
+
+	# scan -------------------------------------------------------------------
+	def scan(self):
+		""" Returns a list of addresses for the devices connected to the I2C bus."""
+		# A scan probes every valid 7-bit address
+		for address in range(0x08, 0x78):
+			self._account(0, 0)
+		addresses = sorted(self._devices.keys())
+		self.scanCache.recordScan(addresses)
+		return addresses
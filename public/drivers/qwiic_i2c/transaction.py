@@ -0,0 +1,270 @@
+#-----------------------------------------------------------------------------
+# transaction.py
+#
+# Batched I2C transactions for the qwiic I2C drivers.
+#
+# A transaction collects a list of reads, writes and write-then-reads (for any
+# number of device addresses) and runs them in a single execute() call. All
+# read data lands in one preallocated buffer, so executing a transaction
+# repeatedly doesn't allocate.
+#
+#------------------------------------------------------------------------
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+"""
+transaction
+============
+A builder for batched I2C bus operations. Operations are queued with write(),
+read() and writeRead() and then run in order by execute(). Read results are
+placed back to back in a single buffer; each read call returns the offset of
+its data in that buffer.
+
+:example:
+
+	>>> import qwiic_i2c
+	>>> i2c = qwiic_i2c.getI2CDriver()
+	>>> with i2c.batch() as batch:
+	...     batch.writeByte(0x70, 0x00, 0x01)
+	...     accel = batch.read(0x6B, 0x28, 6)
+	...     gyro = batch.read(0x6B, 0x22, 6)
+	>>> batch.results[accel:accel + 6]
+
+"""
+
+#-----------------------------------------------------------------------------
+# Transaction
+#
+class Transaction(object):
+	"""
+	Transaction
+
+		Collects I2C operations and runs them in one execute() call.
+
+		:param i2cDriver: The I2CDriver to run the operations on. If not provided, the
+			default driver for the platform is used.
+		:param bufferSize: Initial size of the result buffer, in bytes. The buffer
+			grows as reads are queued.
+
+		:return: The Transaction object
+		:rtype: Object
+	"""
+
+	# Operation types
+	kOpWrite = 0
+	kOpRead = 1
+	kOpWriteRead = 2
+
+	def __init__(self, i2cDriver = None, bufferSize = 32):
+
+		if i2cDriver is None:
+			# Imported here, to avoid a circular import with the package
+			from . import getI2CDriver
+			i2cDriver = getI2CDriver()
+
+		self._i2c = i2cDriver
+
+		# Queued operations, kept in parallel lists
+		self._ops = []
+		self._addresses = []
+		self._commands = []
+		self._data = []
+		self._offsets = []
+
+		self._buffer = bytearray(bufferSize)
+		self._readSize = 0
+
+	#-------------------------------------------------------------------------
+	# Support Python with statements. The queued operations are executed when
+	# the block exits without an exception.
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, type, value, traceback):
+		if type is None:
+			self.execute()
+
+	def __len__(self):
+		return len(self._ops)
+
+	@property
+	def results(self):
+		"""
+			The buffer holding the data of all queued reads after execute(). Only the first
+			`readSize` bytes are valid.
+
+			:rtype: bytearray
+		"""
+		return self._buffer
+
+	@property
+	def readSize(self):
+		"""
+			The total number of bytes read by the queued operations.
+
+			:rtype: integer
+		"""
+		return self._readSize
+
+	read_size = readSize
+
+	def _queue(self, op, address, commandCode, data, nBytes):
+		offset = self._readSize
+
+		if nBytes > 0:
+			self._readSize += nBytes
+			# Grow the buffer now so execute() never has to
+			if self._readSize > len(self._buffer):
+				newBuffer = bytearray(self._readSize)
+				newBuffer[:offset] = self._buffer[:offset]
+				self._buffer = newBuffer
+
+		self._ops.append(op)
+		self._addresses.append(address)
+		self._commands.append(commandCode)
+		self._data.append(data if op == self.kOpWrite else (data, nBytes))
+		self._offsets.append(offset)
+
+		return offset
+
+	#-------------------------------------------------------------------------
+	# Queue operations
+
+	def write(self, address, commandCode, data):
+		"""
+			Queues a block write to a device.
+
+			:param address: The I2C address of the device to write to
+			:param commandCode: The "command" or register to write to, or `None` for no command
+			:param data: The bytes to write. A list is converted once here; a bytearray, or
+				a memoryview of one, is written as is, so it can be updated between calls
+				to execute().
+
+			:return: None
+		"""
+		if isinstance(data, list):
+			data = bytes(data)
+
+		self._queue(self.kOpWrite, address, commandCode, data, 0)
+
+	def writeByte(self, address, commandCode, value):
+		"""
+			Queues a byte (8 bits) write to a device.
+
+			:param address: The I2C address of the device to write to
+			:param commandCode: The "command" or register to write to
+			:param value: The byte to write
+
+			:return: None
+		"""
+		self.write(address, commandCode, bytes((value & 0xFF,)))
+
+	def write_byte(self, address, commandCode, value):
+		return self.writeByte(address, commandCode, value)
+
+	def read(self, address, commandCode, nBytes):
+		"""
+			Queues a block read from a device.
+
+			:param address: The I2C address of the device to read from
+			:param commandCode: The "command" or register to read from, or `None` for no command
+			:param nBytes: The number of bytes to read
+
+			:return: The offset of the read data in `results`
+			:rtype: integer
+		"""
+		return self._queue(self.kOpRead, address, commandCode, None, nBytes)
+
+	def writeRead(self, address, writeBytes, readNBytes):
+		"""
+			Queues a block write, with no stop bit, followed by a block read from a device.
+
+			:param address: The I2C address of the device
+			:param writeBytes: A list of bytes (ints) to write on the I2C bus
+			:param readNBytes: The number of bytes to read from the device
+
+			:return: The offset of the read data in `results`
+			:rtype: integer
+		"""
+		return self._queue(self.kOpWriteRead, address, None, writeBytes, readNBytes)
+
+	def write_read(self, address, writeBytes, readNBytes):
+		return self.writeRead(address, writeBytes, readNBytes)
+
+	def clear(self):
+		"""
+			Removes all queued operations. The result buffer is kept for reuse.
+
+			:return: None
+		"""
+		self._ops = []
+		self._addresses = []
+		self._commands = []
+		self._data = []
+		self._offsets = []
+		self._readSize = 0
+
+	#-------------------------------------------------------------------------
+	# Run the queued operations
+
+	def execute(self):
+		"""
+			Runs all queued operations in order. The queue is kept, so the same transaction
+			can be executed again.
+
+			:return: The result buffer
+			:rtype: bytearray
+		"""
+		# Look everything up once rather than per operation
+		i2c = self._i2c
+		readInto = i2c.readBlockInto
+		writeFrom = i2c.writeBlockFrom
+		writeRead = i2c.writeReadBlock
+		buffer = self._buffer
+		addresses = self._addresses
+		commands = self._commands
+		data = self._data
+		offsets = self._offsets
+		kOpWrite = self.kOpWrite
+		kOpRead = self.kOpRead
+
+		i = 0
+		for op in self._ops:
+			if op == kOpWrite:
+				writeFrom(addresses[i], commands[i], data[i])
+			elif op == kOpRead:
+				readInto(addresses[i], commands[i], buffer, offsets[i], data[i][1])
+			else:
+				writeBytes, nBytes = data[i]
+				readData = writeRead(addresses[i], writeBytes, nBytes)
+				offset = offsets[i]
+				for j in range(nBytes):
+					buffer[offset + j] = readData[j]
+			i += 1
+
+		return buffer
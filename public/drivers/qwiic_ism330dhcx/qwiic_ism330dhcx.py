@@ -45,6 +45,9 @@ New to Qwiic? Take a look at the entire [SparkFun Qwiic ecosystem](https://www.s
 # The Qwiic_I2C_Py platform driver is designed to work on almost any Python
 # platform, check it out here: https://github.com/sparkfun/Qwiic_I2C_Py
 import qwiic_i2c
+import struct
+import time
+from array import array
 
 # Define the device name and I2C addresses. These are set in the class defintion
 # as class variables, making them avilable without having to create a class
@@ -64,6 +67,45 @@ class IsmData:
         self.yData = 0
         self.zData = 0
 
+class IsmAccelGyroData:
+    # Accelerometer (mg) and gyroscope (mdps) data read together by get_accel_gyro()
+    def __init__(self):
+        self.accel = IsmData()
+        self.gyro = IsmData()
+
+class IsmNineDofData(IsmAccelGyroData):
+    # Accelerometer (mg), gyroscope (mdps) and magnetometer (gauss) data read by get_9dof()
+    def __init__(self):
+        IsmAccelGyroData.__init__(self)
+        self.mag = IsmData()
+
+class IsmFifoData:
+    # Preallocated buffers for the samples drained from the ISM330DHCX FIFO by
+    # read_fifo(). Accelerometer and gyroscope samples are stored as x, y, z
+    # triplets of raw values, sensor hub words as the 6 bytes read from the
+    # external sensor. Each sample has a timestamp in 25 us ticks.
+    def __init__(self, size = 64):
+        self.size = size
+
+        self.accel = array("h", [0] * (3 * size))
+        self.accelTime = array("L", [0] * size)
+        self.accelCount = 0
+
+        self.gyro = array("h", [0] * (3 * size))
+        self.gyroTime = array("L", [0] * size)
+        self.gyroCount = 0
+
+        self.hub = bytearray(6 * size)
+        self.hubSensor = bytearray(size)
+        self.hubTime = array("L", [0] * size)
+        self.hubCount = 0
+
+        # FIFO status read before the last drain
+        self.status = 0
+
+        # The raw FIFO words, 7 bytes each
+        self._raw = bytearray(7 * size)
+
 # Define the class that encapsulates the device being created. All information
 # associated with this device is encapsulated by this class. The device class
 # should be the only value exported from this module.
@@ -105,6 +147,11 @@ class QwiicISM330DHCX(object):
     kGyroFs2000dps = 12
     kGyroFs4000dps = 1
 
+    # Sensitivity for each full scale, in mg/LSB and mdps/LSB
+    kAccelSensitivity = {kXlFs2g: 0.061, kXlFs4g: 0.122, kXlFs8g: 0.244, kXlFs16g: 0.488}
+    kGyroSensitivity = {kGyroFs125dps: 4.375, kGyroFs250dps: 8.75, kGyroFs500dps: 17.50,
+                        kGyroFs1000dps: 35.0, kGyroFs2000dps: 70.0, kGyroFs4000dps: 140.0}
+
     # Temperature register
     kRegOutTempL = 0x20
     
@@ -330,6 +377,44 @@ class QwiicISM330DHCX(object):
     kStreamMode = 6
     kBypassToFifoMode = 7
 
+    # FIFO status registers, read together as a 16-bit value by get_fifo_status()
+    kRegFifoStatus1 = 0x3A
+    kFifoStatusShiftDiffFifo = 0
+    kFifoStatusMaskDiffFifo = 0x3FF << kFifoStatusShiftDiffFifo
+    kFifoStatusShiftOvrLatched = 11
+    kFifoStatusMaskOvrLatched = 0b1 << kFifoStatusShiftOvrLatched
+    kFifoStatusShiftCounterBdrIa = 12
+    kFifoStatusMaskCounterBdrIa = 0b1 << kFifoStatusShiftCounterBdrIa
+    kFifoStatusShiftFullIa = 13
+    kFifoStatusMaskFullIa = 0b1 << kFifoStatusShiftFullIa
+    kFifoStatusShiftOvrIa = 14
+    kFifoStatusMaskOvrIa = 0b1 << kFifoStatusShiftOvrIa
+    kFifoStatusShiftWtmIa = 15
+    kFifoStatusMaskWtmIa = 0b1 << kFifoStatusShiftWtmIa
+
+    # FIFO output. Reads roll over from the last data byte back to the tag, so
+    # any number of 7-byte words can be read in one burst.
+    kRegFifoDataOutTag = 0x78
+    kFifoDataOutTagShiftTagSensor = 3
+    kFifoDataOutTagMaskTagSensor = 0b11111 << kFifoDataOutTagShiftTagSensor
+    kFifoDataOutTagShiftTagCnt = 1
+    kFifoDataOutTagMaskTagCnt = 0b11 << kFifoDataOutTagShiftTagCnt
+
+    # FIFO tags
+    kFifoTagGyro = 0x01
+    kFifoTagAccel = 0x02
+    kFifoTagTemperature = 0x03
+    kFifoTagTimestamp = 0x04
+    kFifoTagCfgChange = 0x05
+    kFifoTagHubSlave0 = 0x0E
+    kFifoTagHubSlave3 = 0x11
+
+    # Batch data rates in tenths of Hz, by kXlBatchedAt* / kGyroBatchedAt* value.
+    # They only differ in the slowest rate, 1.6 Hz for the accelerometer and
+    # 6.5 Hz for the gyroscope.
+    kFifoBdrXlDeciHz = (0, 125, 260, 520, 1040, 2080, 4170, 8330, 16670, 33330, 66670, 16)
+    kFifoBdrGyDeciHz = (0, 125, 260, 520, 1040, 2080, 4170, 8330, 16670, 33330, 66670, 65)
+
     # Possible Accelerometer Batch Data Rates
     kXlNotBatched = 0
     kXlBatchedAt12Hz5 = 1
@@ -343,6 +428,8 @@ class QwiicISM330DHCX(object):
     kXlBatchedAt3333Hz = 9
     kXlBatchedAt6667Hz = 10
     kXlBatchedAt6Hz5 = 11
+    # Same value, its actual rate for the accelerometer
+    kXlBatchedAt1Hz6 = 11
 
     # Possible Gyroscope Batch Data Rates
     kGyroNotBatched = 0
@@ -599,6 +686,23 @@ class QwiicISM330DHCX(object):
     kHubWriteModeCycle = 0 # Write each cycle
     kHubWriteModeSingle = 1 # Write once
 
+    # MMC5983MA magnetometer on the sensor hub, see enable_9dof()
+    kMmcAddress = 0x30
+    kMmcRegXOut0 = 0x00
+    kMmcRegIntCtrl0 = 0x09
+    kMmcRegIntCtrl1 = 0x0A
+    kMmcRegIntCtrl2 = 0x0B
+    kMmcIntCtrl0AutoSrEn = 0b1 << 5
+    # Filter bandwidth, the default 100 Hz is too slow for 200 Hz continuous mode
+    kMmcIntCtrl1Bw200Hz = 0b01
+    kMmcIntCtrl2CmmEn = 0b1 << 3
+    kMmcOutputLen = 7
+    # Continuous mode frequency codes, by frequency in Hz
+    kMmcFrequencies = {1: 1, 10: 2, 20: 3, 50: 4, 100: 5, 200: 6}
+    # 18-bit output, zero field at mid scale, 16384 counts per gauss
+    kMmcNullField = 131072
+    kMmcCountsPerGauss = 16384.0
+
     kSelfTestDisable = 0
     kSelfTestPositive = 1
     kSelfTestNegative = 2
@@ -648,6 +752,23 @@ class QwiicISM330DHCX(object):
         self._fullScaleAccel = 0 # powered down by default
         self._fullScaleGyro = 0  # powered down by default
 
+        # Sensitivity of the full scales above, updated when they're set
+        self._accelSensitivity = self.kAccelSensitivity[self._fullScaleAccel]
+        self._gyroSensitivity = self.kGyroSensitivity[self._fullScaleGyro]
+
+        self._accelGyroBuf = bytearray(12)
+        self._hubBuf = bytearray(self.kMmcOutputLen)
+
+        self._fifoStatusBuf = bytearray(2)
+
+        # Fastest batch data rate, read from the device when first needed
+        self._fifoBdr = None
+
+        # Last FIFO timestamp, and the time slots since it
+        self._fifoTime = 0
+        self._fifoSlots = 0
+        self._fifoTagCnt = 0
+
     def is_connected(self):
         """!
         Determines if this device is connected
@@ -704,6 +825,7 @@ class QwiicISM330DHCX(object):
         self._i2c.writeByte(self.address, self.kRegCtrl1XL, regVal)
 
         self._fullScaleAccel = val
+        self._accelSensitivity = self.kAccelSensitivity.get(val)
     
     def set_gyro_full_scale(self, val):
         """!
@@ -722,6 +844,7 @@ class QwiicISM330DHCX(object):
         self._i2c.writeByte(self.address, self.kRegCtrl2G, regVal)
 
         self._fullScaleGyro = val
+        self._gyroSensitivity = self.kGyroSensitivity.get(val)
 
     def get_accel_full_scale(self):
         """!
@@ -864,6 +987,42 @@ class QwiicISM330DHCX(object):
 
         return self._convert_data(data, self._fullScaleGyro, fullScaleConversions)
 
+    def get_accel_gyro(self, out = None):
+        """!
+        Reads the gyroscope and accelerometer output registers in one transaction
+        and converts them according to the full scale settings
+
+        @param IsmAccelGyroData, optional out: The object to fill in. If not
+            provided, a new one is created.
+
+        @return **IsmAccelGyroData** The accelerometer data in mg and the gyroscope
+            data in mdps, or None if a full scale is unknown
+        """
+        accelSensitivity = self._accelSensitivity
+        gyroSensitivity = self._gyroSensitivity
+        if accelSensitivity is None or gyroSensitivity is None:
+            return None
+
+        # The gyroscope registers come first, right before the accelerometer's
+        buf = self._accelGyroBuf
+        self._i2c.readBlockInto(self.address, self.kRegOutXLG, buf)
+        gx, gy, gz, ax, ay, az = struct.unpack_from("<6h", buf)
+
+        if out is None:
+            out = IsmAccelGyroData()
+
+        gyro = out.gyro
+        gyro.xData = gx * gyroSensitivity
+        gyro.yData = gy * gyroSensitivity
+        gyro.zData = gz * gyroSensitivity
+
+        accel = out.accel
+        accel.xData = ax * accelSensitivity
+        accel.yData = ay * accelSensitivity
+        accel.zData = az * accelSensitivity
+
+        return out
+
     # Conversion functions
     def convert_2g_to_mg(self, lsb):
         return lsb * 0.061
@@ -1417,6 +1576,7 @@ class QwiicISM330DHCX(object):
         regVal |= (val << self.kFifoCtrl3ShiftBdrXl)
         
         self._i2c.writeByte(self.address, self.kRegFifoCtrl3, regVal)
+        self._fifoBdr = None
 
 
     def set_gyro_fifo_batch_set(self, val):
@@ -1432,10 +1592,11 @@ class QwiicISM330DHCX(object):
 
         regVal = self._i2c.readByte(self.address, self.kRegFifoCtrl3)
 
-        regVal &= ~self.kFifoCtrl3MaskBdrG
-        regVal |= (val << self.kFifoCtrl3ShiftBdrG)
+        regVal &= ~self.kFifoCtrl3MaskBdrGy
+        regVal |= (val << self.kFifoCtrl3ShiftBdrGy)
         
         self._i2c.writeByte(self.address, self.kRegFifoCtrl3, regVal)
+        self._fifoBdr = None
     
     def set_fifo_timestamp_dec(self, val):
         """!
@@ -1459,6 +1620,139 @@ class QwiicISM330DHCX(object):
 
         self._i2c.writeByte(self.address, self.kRegFifoCtrl4, regVal)
 
+    def get_fifo_status(self):
+        """!
+        Reads both FIFO status registers in one transaction
+
+        @return **int** FIFO_STATUS1 in the low byte and FIFO_STATUS2 in the high byte.
+            Use kFifoStatusMaskDiffFifo for the number of unread words, and the other
+            kFifoStatusMask* values for the watermark, overrun and full flags.
+        """
+        buf = self._fifoStatusBuf
+        self._i2c.readBlockInto(self.address, self.kRegFifoStatus1, buf)
+
+        return buf[0] | (buf[1] << 8)
+
+    def get_fifo_count(self):
+        """!
+        Gets the number of unread words in the FIFO
+
+        @return **int** The number of 7-byte words in the FIFO
+        """
+        return self.get_fifo_status() & self.kFifoStatusMaskDiffFifo
+
+    def _fifo_slot_rate(self):
+        """!
+        Gets the batch data rate of the fastest sensor in the FIFO, which sets the
+        time between FIFO time slots
+
+        @return **int** The rate in tenths of Hz, 0 if nothing is batched
+        """
+        if self._fifoBdr is None:
+            regVal = self._i2c.readByte(self.address, self.kRegFifoCtrl3)
+            xl = (regVal & self.kFifoCtrl3MaskBdrXl) >> self.kFifoCtrl3ShiftBdrXl
+            gy = (regVal & self.kFifoCtrl3MaskBdrGy) >> self.kFifoCtrl3ShiftBdrGy
+            xlRates = self.kFifoBdrXlDeciHz
+            gyRates = self.kFifoBdrGyDeciHz
+            self._fifoBdr = max(xlRates[xl] if xl < len(xlRates) else 0, gyRates[gy] if gy < len(gyRates) else 0)
+
+        return self._fifoBdr
+
+    def read_fifo(self, data, maxWords = None):
+        """!
+        Drains the FIFO into preallocated buffers. The words are read in a single
+        burst after the status read, and decoded by tag.
+
+        Sample timestamps are reconstructed from the last timestamp word and the
+        time slot counter in each tag, so enable_timestamp() and
+        set_fifo_timestamp_dec() should be used to batch timestamps. Without them,
+        the timestamps only count time slots since the first drain. Compressed
+        words are not decoded, leave FIFO compression off.
+
+        @param IsmFifoData data: The buffers to fill. Their previous contents are replaced.
+        @param int, optional maxWords: The most words to read. By default, as many
+            as are in the FIFO and fit in data.
+
+        @return **int** The number of words read from the FIFO
+        """
+        data.accelCount = 0
+        data.gyroCount = 0
+        data.hubCount = 0
+
+        status = self.get_fifo_status()
+        data.status = status
+
+        count = status & self.kFifoStatusMaskDiffFifo
+        if maxWords is not None and maxWords < count:
+            count = maxWords
+        if count > data.size:
+            count = data.size
+        if count <= 0:
+            return 0
+
+        raw = data._raw
+        self._i2c.readBlockInto(self.address, self.kRegFifoDataOutTag, raw, 0, 7 * count)
+        rawView = memoryview(raw)
+
+        # Timestamps are in 25 us ticks, so a slot lasts 400000 / rate ticks with
+        # the rate in tenths of Hz
+        rate = self._fifo_slot_rate()
+
+        fifoTime = self._fifoTime
+        slots = self._fifoSlots
+        lastCnt = self._fifoTagCnt
+        sampleTime = fifoTime
+        if rate:
+            sampleTime = (fifoTime + slots * 400000 // rate) & 0xFFFFFFFF
+
+        accel = data.accel
+        gyro = data.gyro
+        nAccel = 0
+        nGyro = 0
+        nHub = 0
+
+        for p in range(0, 7 * count, 7):
+            tagByte = raw[p]
+            tag = tagByte >> self.kFifoDataOutTagShiftTagSensor
+            cnt = (tagByte & self.kFifoDataOutTagMaskTagCnt) >> self.kFifoDataOutTagShiftTagCnt
+
+            if tag == self.kFifoTagTimestamp:
+                fifoTime = struct.unpack_from("<I", raw, p + 1)[0]
+                slots = 0
+                lastCnt = cnt
+                sampleTime = fifoTime
+                continue
+
+            if cnt != lastCnt:
+                slots += (cnt - lastCnt) & 0x03
+                lastCnt = cnt
+                if rate:
+                    sampleTime = (fifoTime + slots * 400000 // rate) & 0xFFFFFFFF
+
+            if tag == self.kFifoTagAccel:
+                accel[3 * nAccel], accel[3 * nAccel + 1], accel[3 * nAccel + 2] = struct.unpack_from("<hhh", raw, p + 1)
+                data.accelTime[nAccel] = sampleTime
+                nAccel += 1
+            elif tag == self.kFifoTagGyro:
+                gyro[3 * nGyro], gyro[3 * nGyro + 1], gyro[3 * nGyro + 2] = struct.unpack_from("<hhh", raw, p + 1)
+                data.gyroTime[nGyro] = sampleTime
+                nGyro += 1
+            elif self.kFifoTagHubSlave0 <= tag <= self.kFifoTagHubSlave3:
+                data.hub[6 * nHub:6 * nHub + 6] = rawView[p + 1:p + 7]
+                data.hubSensor[nHub] = tag - self.kFifoTagHubSlave0
+                data.hubTime[nHub] = sampleTime
+                nHub += 1
+
+        self._fifoTime = fifoTime
+        self._fifoSlots = slots
+        self._fifoTagCnt = lastCnt
+
+        data.accelCount = nAccel
+        data.gyroCount = nGyro
+        data.hubCount = nHub
+
+        return count
+
     # Interrupt and pin mode settings
     def set_pin_mode(self, activeLow):
         """!
@@ -2121,6 +2415,138 @@ class QwiicISM330DHCX(object):
 
         self._mem_bank_set(self.kUserBank)
 
+    def _hub_write_once(self, address, subAddress, data, timeout_ms):
+        """!
+        Writes a byte to an external sensor with a single sensor hub cycle. Not to be used
+        outside this module
+
+        @return **bool** `True` if the write was done before the timeout
+        """
+        self.set_hub_sensor_write(address, subAddress, data)
+        self.set_hub_write_mode(self.kHubWriteModeSingle)
+        self.enable_sensor_i2c(True)
+
+        done = False
+        for i in range(timeout_ms):
+            if self._sh_status_get() & self.kStatusMasterMaskWrOnceDone:
+                done = True
+                break
+            time.sleep(0.001)
+
+        self.enable_sensor_i2c(False)
+
+        return done
+
+    def enable_9dof(self, frequency = 100, hubOdr = None, fifo = False, timeout_ms = 100):
+        """!
+        Sets up the sensor hub to read an MMC5983MA magnetometer on the auxiliary I2C bus,
+        after starting it in continuous mode. The sensor hub cycle is triggered by the
+        accelerometer, so set its data rate first.
+
+        Once enabled, get_9dof() reads the accelerometer, gyroscope and magnetometer, and
+        with fifo set, magnetometer words are batched in the FIFO with the IMU samples.
+
+        @param int, optional frequency: The magnetometer continuous mode frequency in Hz,
+            1, 10, 20, 50, 100 or 200
+        @param int, optional hubOdr: The sensor hub data rate, one of kShOdr*. By default,
+            the fastest rate at or below the magnetometer's.
+        @param bool, optional fifo: Batch the magnetometer data in the FIFO
+        @param int, optional timeout_ms: How long to wait for each write to the magnetometer
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        if frequency not in self.kMmcFrequencies:
+            return False
+
+        # No sensor hub cycles without the accelerometer running
+        if not (self._i2c.readByte(self.address, self.kRegCtrl1XL) & self.kCtrl1XlMaskOdr):
+            return False
+
+        if hubOdr is None:
+            hubOdr = self.kShOdr13Hz
+            for rate, odr in ((104, self.kShOdr104Hz), (52, self.kShOdr52Hz), (26, self.kShOdr26Hz)):
+                if rate <= frequency:
+                    hubOdr = odr
+                    break
+
+        # The sensor hub functions take the 8-bit address
+        address = self.kMmcAddress << 1
+
+        self.set_number_hub_sensors(0)
+
+        if not self._hub_write_once(address, self.kMmcRegIntCtrl0, self.kMmcIntCtrl0AutoSrEn, timeout_ms):
+            return False
+        if frequency == 200:
+            if not self._hub_write_once(address, self.kMmcRegIntCtrl1, self.kMmcIntCtrl1Bw200Hz, timeout_ms):
+                return False
+        if not self._hub_write_once(address, self.kMmcRegIntCtrl2,
+                                    self.kMmcIntCtrl2CmmEn | self.kMmcFrequencies[frequency], timeout_ms):
+            return False
+
+        self.set_hub_sensor_read(0, address, self.kMmcRegXOut0, self.kMmcOutputLen)
+        self.set_hub_odr(hubOdr)
+        self.set_hub_fifo_batching(fifo)
+        self.enable_sensor_i2c(True)
+
+        return True
+
+    def decode_mmc(self, buf, offset = 0, out = None, lowBits = True):
+        """!
+        Converts MMC5983MA output registers read by the sensor hub to gauss
+
+        @param buf: The bytes read from the magnetometer, starting at its X_OUT_0 register
+        @param int, optional offset: The position of the first byte in buf
+        @param IsmData, optional out: The object to fill in. If not provided, a new one is created.
+        @param bool, optional lowBits: Whether the 7th byte, with the 2 least significant
+            bits of each axis, is in buf. FIFO words only have the first 6 bytes.
+
+        @return **IsmData** The magnetic field in gauss
+        """
+        x = (buf[offset] << 10) | (buf[offset + 1] << 2)
+        y = (buf[offset + 2] << 10) | (buf[offset + 3] << 2)
+        z = (buf[offset + 4] << 10) | (buf[offset + 5] << 2)
+        if lowBits:
+            xyz2 = buf[offset + 6]
+            x |= xyz2 >> 6
+            y |= (xyz2 >> 4) & 0x03
+            z |= (xyz2 >> 2) & 0x03
+
+        if out is None:
+            out = IsmData()
+
+        out.xData = (x - self.kMmcNullField) / self.kMmcCountsPerGauss
+        out.yData = (y - self.kMmcNullField) / self.kMmcCountsPerGauss
+        out.zData = (z - self.kMmcNullField) / self.kMmcCountsPerGauss
+
+        return out
+
+    def get_9dof(self, out = None):
+        """!
+        Reads the accelerometer, gyroscope and the magnetometer set up by enable_9dof().
+        The magnetometer data is the last the sensor hub read, on an accelerometer sample.
+
+        @param IsmNineDofData, optional out: The object to fill in. If not provided, a new
+            one is created.
+
+        @return **IsmNineDofData** The accelerometer data in mg, the gyroscope data in mdps
+            and the magnetometer data in gauss, or None if a full scale is unknown
+        """
+        if out is None:
+            out = IsmNineDofData()
+
+        if self.get_accel_gyro(out) is None:
+            return None
+
+        # The bank register has no other settings, so it can be written without reading it first
+        buf = self._hubBuf
+        self._i2c.writeByte(self.address, self.kRegFuncCfgAccess, self.kSensorHubBank << self.kFuncCfgAccessShiftRegAccess)
+        self._i2c.readBlockInto(self.address, self.kRegSensorHub1, buf)
+        self._i2c.writeByte(self.address, self.kRegFuncCfgAccess, self.kUserBank << self.kFuncCfgAccessShiftRegAccess)
+
+        self.decode_mmc(buf, 0, out.mag)
+
+        return out
+
 
     # Self Test Functions
     def setAccelSelfTest(self, val):
@@ -242,6 +242,11 @@ class QwiicKX13XCore(object):
         # Did the user specify an I2C address?
         self.address = self.available_addresses[0] if address is None else address
 
+        # Configuration registers only the host changes. They're served from RAM
+        # once known, e.g. the range for every conversion.
+        self._shadow = qwiic_i2c.ShadowRegisters((self.KX13X_CNTL1, self.KX13X_ODCNTL,
+                                                  self.KX13X_INC1, self.KX13X_BUF_CNTL2))
+
         # load the I2C driver if one isn't provided
 
         if i2c_driver is None:
@@ -265,7 +270,7 @@ class QwiicKX13XCore(object):
 
         @return **bool** True if the device is connected, otherwise False.
         """
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
@@ -279,6 +284,9 @@ class QwiicKX13XCore(object):
 
         @return **bool** Returns true of the initializtion was successful, otherwise False.
         """
+        # The device may have been power cycled since the registers were shadowed
+        self._shadow.invalidate()
+
         # are we who we need to be?
         chipID = self._i2c.readByte(self.address, self.KX13X_WHO_AM_I)
         if chipID not in _WHO_AM_I:
@@ -301,18 +309,18 @@ class QwiicKX13XCore(object):
         self.enable_accel(False)
 
         if settings == self.DEFAULT_SETTINGS:
-            self._i2c.writeByte(self.address, self.KX13X_CNTL1, self.DEFAULT_SETTINGS)
+            self._write_register(self.KX13X_CNTL1, self.DEFAULT_SETTINGS)
         elif settings == self.INT_SETTINGS:
             self.set_interrupt_pin(True, 1)
             self.route_hardware_interrupt(self.HI_DATA_READY)
-            self._i2c.writeByte(self.address, self.KX13X_CNTL1, self.INT_SETTINGS)
+            self._write_register(self.KX13X_CNTL1, self.INT_SETTINGS)
         elif settings == self.SOFT_INT_SETTINGS:
-            self._i2c.writeByte(self.address, self.KX13X_CNTL1, self.INT_SETTINGS)
+            self._write_register(self.KX13X_CNTL1, self.INT_SETTINGS)
         elif settings == self.BUFFER_SETTINGS:
             self.set_interrupt_pin(True, 1)
             self.route_hardware_interrupt(self.HI_BUFFER_FULL)
             self.set_buffer_operation(self.BUFFER_MODE_FIFO, self.BUFFER_16BIT_SAMPLES)
-            self._i2c.writeByte(self.address, self.KX13X_CNTL1, self.INT_SETTINGS)
+            self._write_register(self.KX13X_CNTL1, self.INT_SETTINGS)
         # Space fore more default settings
 
     def run_command_test(self):
@@ -345,10 +353,10 @@ class QwiicKX13XCore(object):
         if enable != True and enable != False:
             return False
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+        reg_val = self._read_register(self.KX13X_CNTL1)
         reg_val &= 0x7F
         reg_val |= (enable << 7)
-        self._i2c.writeByte(self.address, self.KX13X_CNTL1 , reg_val)
+        self._write_register(self.KX13X_CNTL1, reg_val)
 
     def accel_control(self, enable=True):
         """!
@@ -362,7 +370,7 @@ class QwiicKX13XCore(object):
 
         @return **int** Returns bit indicating the accelerometers power state.
         """
-        reg_val = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+        reg_val = self._read_register(self.KX13X_CNTL1)
         return (reg_val & 0x80) >> 7
 
     def set_range(self, kx13x_range):
@@ -387,10 +395,10 @@ class QwiicKX13XCore(object):
         if kx13x_range < 0 or kx13x_range > 3:
             return False
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+        reg_val = self._read_register(self.KX13X_CNTL1)
         reg_val &= 0xE7
         reg_val |= (kx13x_range << 3)
-        self._i2c.writeByte(self.address, self.KX13X_CNTL1 , reg_val)
+        self._write_register(self.KX13X_CNTL1, reg_val)
 
 
     def set_output_data_rate(self, rate):
@@ -408,10 +416,10 @@ class QwiicKX13XCore(object):
         accel_state = self.get_accel_state()
         self.enable_accel(False)
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_ODCNTL)
+        reg_val = self._read_register(self.KX13X_ODCNTL)
         reg_val &= 0x40
         reg_val |= rate
-        self._i2c.writeByte(self.address, self.KX13X_ODCNTL , reg_val)
+        self._write_register(self.KX13X_ODCNTL, reg_val)
         self.enable_accel(accel_state)
 
 
@@ -422,7 +430,7 @@ class QwiicKX13XCore(object):
         @return **float** Accelerometer's data rate in hertz.
         """
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_ODCNTL)
+        reg_val = self._read_register(self.KX13X_ODCNTL)
         reg_val &= 0x40
         return (0.78 * (2 * reg_val))
 
@@ -457,10 +465,10 @@ class QwiicKX13XCore(object):
 
         combined_arguments = (pulse_width << 6) | (enable << 5) | (polarity << 4) | (latch_control << 3)
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_INC1)
+        reg_val = self._read_register(self.KX13X_INC1)
         reg_val &= 0x07
         reg_val |= combined_arguments
-        self._i2c.writeByte(self.address, self.KX13X_INC1 , reg_val)
+        self._write_register(self.KX13X_INC1, reg_val)
 
     def route_hardware_interrupt(self, rdr, pin = 1):
         """!
@@ -508,13 +516,13 @@ class QwiicKX13XCore(object):
         kIenReadyBitMask = 0b1 << 5
             
         if pin == 1:
-            reg_val = self._i2c.readByte(self.address, self.KX13X_INC1)
+            reg_val = self._read_register(self.KX13X_INC1)
             
             reg_val &= ~kIenReadyBitMask
             if (enable):
                 reg_val |= kIenReadyBitMask
 
-            self._i2c.writeByte(self.address, self.KX13X_INC1, reg_val)
+            self._write_register(self.KX13X_INC1, reg_val)
     
         if pin == 2:
             reg_val = self._i2c.readByte(self.address, self.KX13X_INC5)
@@ -566,7 +574,7 @@ class QwiicKX13XCore(object):
         if threshold < 2 or threshold > 171:
             return False
 
-        resolution = self._i2c.readByte(self.address, self.KX13X_BUF_CNTL2)
+        resolution = self._read_register(self.KX13X_BUF_CNTL2)
         resolution &= 0x40
         resolution = resolution >> 6
 
@@ -596,10 +604,10 @@ class QwiicKX13XCore(object):
 
         combined_arguments = (resolution << 6) | operation_mode
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_BUF_CNTL2)
+        reg_val = self._read_register(self.KX13X_BUF_CNTL2)
         reg_val &= 0xBC
         reg_val |= combined_arguments
-        self._i2c.writeByte(self.address, self.KX13X_BUF_CNTL2 , reg_val)
+        self._write_register(self.KX13X_BUF_CNTL2, reg_val)
     
     def set_buffer_operation(self, operation_mode, resolution):
         """!
@@ -626,10 +634,10 @@ class QwiicKX13XCore(object):
 
         combined_arguments = (enable << 7) | (enable_interrupt << 5)
 
-        reg_val = self._i2c.readByte(self.address, self.KX13X_BUF_CNTL2)
+        reg_val = self._read_register(self.KX13X_BUF_CNTL2)
         reg_val &= 0x5F
         reg_val |= combined_arguments
-        self._i2c.writeByte(self.address, self.KX13X_BUF_CNTL2 , reg_val)
+        self._write_register(self.KX13X_BUF_CNTL2, reg_val)
 
     def get_raw_accel_data(self):
         """!
@@ -677,7 +685,7 @@ class QwiicKX13XCore(object):
         
         if sixteenBit == -1:
             # Need to manually check the resolution
-            reg_val = self._i2c.readByte(self.address, self.KX13X_BUF_CNTL2)
+            reg_val = self._read_register(self.KX13X_BUF_CNTL2)
 
             kBresMask = 1 << 6
             if reg_val & kBresMask:
@@ -744,6 +752,9 @@ class QwiicKX13XCore(object):
         self._i2c.writeByte(self.address, self.KX13X_CNTL2, 0x00)
         self._i2c.writeByte(self.address, self.KX13X_CNTL2, 0x80)
 
+        # The registers are back to their power-up values
+        self._shadow.invalidate()
+
         # Wait for the SRST bit to be cleared. Reset takes about 2ms. Timeout if we still see the SRST bit set after 10ms.
         sleep(0.003)
         reset_read_tries = 0
@@ -764,13 +775,13 @@ class QwiicKX13XCore(object):
         """
 
         kDataReadyBitMask = 0b1 << 5
-        reg_val = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+        reg_val = self._read_register(self.KX13X_CNTL1)
         
         reg_val &= ~kDataReadyBitMask
         if (enable):
             reg_val |= kDataReadyBitMask
 
-        self._i2c.writeByte(self.address, self.KX13X_CNTL1, reg_val)
+        self._write_register(self.KX13X_CNTL1, reg_val)
     
     def enable_tap_engine(self,enable=True):
         """!
@@ -780,13 +791,13 @@ class QwiicKX13XCore(object):
         """
 
         kTapEngineBitMask = 0b1 << 2
-        reg_val = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+        reg_val = self._read_register(self.KX13X_CNTL1)
         
         reg_val &= ~kTapEngineBitMask
         if (enable):
             reg_val |= kTapEngineBitMask
 
-        self._i2c.writeByte(self.address, self.KX13X_CNTL1, reg_val)
+        self._write_register(self.KX13X_CNTL1, reg_val)
     
     def enable_direct_tap_interrupt(self, enable=True):
         """!
@@ -872,6 +883,31 @@ class QwiicKX13XCore(object):
 
         # See page 44 of reference manual, sample level is 10 bits with the two most significant bits in the second byte
         return ( (reg_val[1] & 0x03) << 8) | reg_val[0]
+
+    def _read_register(self, register):
+        """!
+        Reads a register, from its shadow if it's host owned and known.
+
+        @param register: The register to read.
+
+        @return **int** The register value.
+        """
+        return self._shadow.read(register, self._read_byte)
+
+    def _write_register(self, register, value):
+        """!
+        Writes a register, updating its shadow if it's host owned.
+
+        @param register: The register to write.
+        @param value: The value to write.
+        """
+        self._shadow.write(register, value, self._write_byte)
+
+    def _read_byte(self, register):
+        return self._i2c.readByte(self.address, register)
+
+    def _write_byte(self, register, value):
+        self._i2c.writeByte(self.address, register, value)
             
 class QwiicKX132(QwiicKX13XCore):
 
@@ -915,7 +951,7 @@ class QwiicKX132(QwiicKX13XCore):
             Converts raw acceleration data according to the range setting and
                 stores it
             """
-            accel_range = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+            accel_range = self._read_register(self.KX13X_CNTL1)
             accel_range &= 0x18
             accel_range = accel_range >> 3
 
@@ -980,7 +1016,7 @@ class QwiicKX134(QwiicKX13XCore):
         Converts raw acceleration data according to the range setting and
             stores it
         """
-        accel_range = self._i2c.readByte(self.address, self.KX13X_CNTL1)
+        accel_range = self._read_register(self.KX13X_CNTL1)
         accel_range &= 0x18
         accel_range = accel_range >> 3
 
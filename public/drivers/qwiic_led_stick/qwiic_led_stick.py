@@ -112,7 +112,7 @@ class QwiicLEDStick(object):
 
         @return **bool** True if the device is connected, false otherwise.
         """
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     # ------------------------------------------------------------------------------
     # begin()
@@ -329,6 +329,7 @@ class QwiicLEDStick(object):
         self._i2c.writeByte(self.address, self.COMMAND_CHANGE_ADDRESS, new_address)
         
         # Update address variable
+        self._i2c.invalidateScan(self.address)
         self.address = new_address
     
     # --------------------------------------------------------------------------
@@ -50,6 +50,8 @@ New to Qwiic? Take a look at the entire [SparkFun Qwiic ecosystem](https://www.s
 # The Qwiic_I2C_Py platform driver is designed to work on almost any Python
 # platform, check it out here: https://github.com/sparkfun/Qwiic_I2C_Py
 import qwiic_i2c
+import struct
+from array import array
 
 # Define the device name and I2C addresses. These are set in the class defintion
 # as class variables, making them avilable without having to create a class
@@ -62,6 +64,31 @@ _DEFAULT_NAME = "Qwiic LSM6DSO"
 # address for the device.
 _AVAILABLE_I2C_ADDRESS = [0x6B, 0x6A]
 
+class LSM6DSOFifoData(object):
+    """!
+    Reusable buffers for the samples drained from the FIFO by read_fifo().
+    Samples are stored as raw x, y, z triplets, accel[3*i:3*i+3] is the
+    i-th accelerometer sample.
+
+    @param int, optional size: The most FIFO words read in one drain
+    """
+    def __init__(self, size = 128):
+        self.size = size
+
+        self.accel = array("h", [0] * (3 * size))
+        self.accel_count = 0
+        self.gyro = array("h", [0] * (3 * size))
+        self.gyro_count = 0
+
+        # True if the FIFO overran before the last drain, so samples were lost
+        self.overrun = False
+
+        # FIFO status read before the last drain
+        self.status = 0
+
+        # The raw FIFO words, 7 bytes each
+        self._raw = bytearray(7 * size)
+
 # Define the class that encapsulates the device being created. All information
 # associated with this device is encapsulated by this class. The device class
 # should be the only value exported from this module.
@@ -187,6 +214,43 @@ class QwiicLSM6DSO(object):
     ODR_MASK      = 0x0F
     ODR_POS       = 4
 
+    # FIFO batch data rate values. Apart from the slowest, they're the same as
+    # the output data rates, ODR_12_5Hz to ODR_6660Hz. The slowest is 1.6Hz for
+    # the accelerometer and 6.5Hz for the gyroscope.
+    BDR_NOT_BATCHED = 0x00
+    BDR_XL_1_6Hz    = 0x0B # Only accelerometer
+    BDR_6_5Hz       = 0x0B # Only gyroscope
+    BDR_XL_MASK     = 0xF0
+    BDR_XL_POS      = 0
+    BDR_GY_MASK     = 0x0F
+    BDR_GY_POS      = 4
+
+    # FIFO watermark, 9 bits split between FIFO_CTRL1 and FIFO_CTRL2
+    FIFO_WTM_MAX    = 511
+    FIFO_WTM8_MASK  = 0xFE
+
+    # FIFO modes
+    FIFO_MODE_BYPASS                = 0x00
+    FIFO_MODE_FIFO                  = 0x01
+    FIFO_MODE_CONTINUOUS_TO_FIFO    = 0x03
+    FIFO_MODE_BYPASS_TO_CONTINUOUS  = 0x04
+    FIFO_MODE_CONTINUOUS            = 0x06
+    FIFO_MODE_BYPASS_TO_FIFO        = 0x07
+    FIFO_MODE_MASK                  = 0xF8
+
+    # FIFO status, FIFO_STATUS1 in the low byte and FIFO_STATUS2 in the high byte
+    FIFO_STATUS_DIFF_MASK           = 0x03FF
+    FIFO_STATUS_OVR_LATCHED         = 0x0800
+    FIFO_STATUS_COUNTER_BDR_IA      = 0x1000
+    FIFO_STATUS_FULL_IA             = 0x2000
+    FIFO_STATUS_OVR_IA              = 0x4000
+    FIFO_STATUS_WTM_IA              = 0x8000
+
+    # FIFO word tags, in the top 5 bits of FIFO_DATA_OUT_TAG
+    FIFO_TAG_GYRO   = 0x01
+    FIFO_TAG_ACCEL  = 0x02
+    FIFO_TAG_POS    = 3
+
     def __init__(self, address=None, i2c_driver=None):
         """!
         Constructor
@@ -212,6 +276,8 @@ class QwiicLSM6DSO(object):
         else:
             self._i2c = i2c_driver
 
+        self._fifo_status_buf = bytearray(2)
+
         # Initialize member variables by resetting them to their default values
         self.reset_member_variables()
 
@@ -796,6 +862,175 @@ class QwiicLSM6DSO(object):
         accZ = self.calc_accel(raw[10] | (raw[11] << 8))
         return accX, accY, accZ, gyrX, gyrY, gyrZ
 
+    def set_accel_batch_data_rate(self, rate):
+        """!
+        Sets the rate accelerometer samples are written to the FIFO. Can be
+        BDR_NOT_BATCHED, 12.5Hz to 6660Hz (ODR_12_5Hz to ODR_6660Hz), or
+        1.6Hz (BDR_XL_1_6Hz). Samples are only batched at rates up to the output
+        data rate.
+
+        @param int rate: The batch data rate to set
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        # Ensure provided rate is valid
+        if rate < self.BDR_NOT_BATCHED or rate > self.BDR_XL_1_6Hz:
+            return False
+
+        # Get current register value, set new rate, write new register value
+        reg_val = self._i2c.readByte(self.address, self.FIFO_CTRL3)
+        reg_val &= self.BDR_XL_MASK
+        reg_val |= rate << self.BDR_XL_POS
+        self._i2c.writeByte(self.address, self.FIFO_CTRL3, reg_val)
+
+        # Done!
+        return True
+
+    def set_gyro_batch_data_rate(self, rate):
+        """!
+        Sets the rate gyroscope samples are written to the FIFO. Can be
+        BDR_NOT_BATCHED, 12.5Hz to 6660Hz (ODR_12_5Hz to ODR_6660Hz), or
+        6.5Hz (BDR_6_5Hz). Samples are only batched at rates up to the output
+        data rate.
+
+        @param int rate: The batch data rate to set
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        # Ensure provided rate is valid
+        if rate < self.BDR_NOT_BATCHED or rate > self.BDR_6_5Hz:
+            return False
+
+        # Get current register value, set new rate, write new register value
+        reg_val = self._i2c.readByte(self.address, self.FIFO_CTRL3)
+        reg_val &= self.BDR_GY_MASK
+        reg_val |= rate << self.BDR_GY_POS
+        self._i2c.writeByte(self.address, self.FIFO_CTRL3, reg_val)
+
+        # Done!
+        return True
+
+    def set_fifo_watermark(self, words):
+        """!
+        Sets the FIFO watermark, the number of words at which the FIFO_STATUS_WTM_IA
+        flag is set
+
+        @param int words: The watermark, 0 to 511 words
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        # Ensure provided watermark is valid
+        if words < 0 or words > self.FIFO_WTM_MAX:
+            return False
+
+        self._i2c.writeByte(self.address, self.FIFO_CTRL1, words & 0xFF)
+
+        reg_val = self._i2c.readByte(self.address, self.FIFO_CTRL2)
+        reg_val &= self.FIFO_WTM8_MASK
+        reg_val |= words >> 8
+        self._i2c.writeByte(self.address, self.FIFO_CTRL2, reg_val)
+
+        # Done!
+        return True
+
+    def set_fifo_mode(self, mode):
+        """!
+        Sets the FIFO mode. FIFO_MODE_FIFO stops collecting when the FIFO is full,
+        FIFO_MODE_CONTINUOUS overwrites the oldest samples, and FIFO_MODE_BYPASS
+        stops and empties the FIFO.
+
+        @param int mode: The FIFO mode, one of the FIFO_MODE_* values
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        # Ensure provided mode is valid
+        if mode not in (self.FIFO_MODE_BYPASS, self.FIFO_MODE_FIFO,
+                        self.FIFO_MODE_CONTINUOUS_TO_FIFO, self.FIFO_MODE_BYPASS_TO_CONTINUOUS,
+                        self.FIFO_MODE_CONTINUOUS, self.FIFO_MODE_BYPASS_TO_FIFO):
+            return False
+
+        # Get current register value, set new mode, write new register value
+        reg_val = self._i2c.readByte(self.address, self.FIFO_CTRL4)
+        reg_val &= self.FIFO_MODE_MASK
+        reg_val |= mode
+        self._i2c.writeByte(self.address, self.FIFO_CTRL4, reg_val)
+
+        # Done!
+        return True
+
+    def get_fifo_status(self):
+        """!
+        Reads both FIFO status registers in one transaction
+
+        @return **int** FIFO_STATUS1 in the low byte and FIFO_STATUS2 in the high
+            byte. FIFO_STATUS_DIFF_MASK gives the number of unread words, and the
+            other FIFO_STATUS_* values the watermark, overrun and full flags.
+        """
+        buf = self._fifo_status_buf
+        self._i2c.readBlockInto(self.address, self.FIFO_STATUS1, buf)
+        return buf[0] | (buf[1] << 8)
+
+    def get_fifo_count(self):
+        """!
+        Returns the number of unread words in the FIFO
+
+        @return **int** The number of 7 byte words in the FIFO
+        """
+        return self.get_fifo_status() & self.FIFO_STATUS_DIFF_MASK
+
+    def read_fifo(self, data, max_words = None):
+        """!
+        Drains the FIFO into reusable buffers. After the status read, the words
+        are read in a single burst: the address rolls back from
+        FIFO_DATA_OUT_Z_H to FIFO_DATA_OUT_TAG after each word. Accelerometer
+        and gyroscope words are decoded, other words are skipped.
+
+        @param LSM6DSOFifoData data: The buffers to fill, their previous contents
+            are replaced. The sample counts and overrun flag are set too.
+        @param int, optional max_words: The most words to read. By default, as
+            many as are in the FIFO and fit in data.
+
+        @return **int** The number of words read from the FIFO
+        """
+        data.accel_count = 0
+        data.gyro_count = 0
+
+        status = self.get_fifo_status()
+        data.status = status
+        data.overrun = (status & (self.FIFO_STATUS_OVR_IA | self.FIFO_STATUS_OVR_LATCHED)) != 0
+
+        count = status & self.FIFO_STATUS_DIFF_MASK
+        if max_words is not None and max_words < count:
+            count = max_words
+        if count > data.size:
+            count = data.size
+        if count <= 0:
+            return 0
+
+        raw = data._raw
+        self._i2c.readBlockInto(self.address, self.FIFO_DATA_OUT_TAG, raw, 0, 7 * count)
+
+        accel = data.accel
+        gyro = data.gyro
+        n_accel = 0
+        n_gyro = 0
+
+        for p in range(0, 7 * count, 7):
+            tag = raw[p] >> self.FIFO_TAG_POS
+            if tag == self.FIFO_TAG_ACCEL:
+                i = 3 * n_accel
+                accel[i], accel[i + 1], accel[i + 2] = struct.unpack_from("<hhh", raw, p + 1)
+                n_accel += 1
+            elif tag == self.FIFO_TAG_GYRO:
+                i = 3 * n_gyro
+                gyro[i], gyro[i + 1], gyro[i + 2] = struct.unpack_from("<hhh", raw, p + 1)
+                n_gyro += 1
+
+        data.accel_count = n_accel
+        data.gyro_count = n_gyro
+
+        return count
+
     def read_raw_temp(self):
         """!
         Reads the raw temperature value
@@ -127,6 +127,9 @@ class QwiicMCP9600(object):
     kShutdownModeShutdown = 0x01
     kShutdownModeBurst = 0x02
 
+    # Conversion time of one sample for each thermocouple resolution, in ms
+    kConversionTimeMs = (320, 80, 20, 5)
+
     # Status bits shifts and masks
     kStatusShiftAlert1 = 0
     kStatusShiftAlert2 = 1
@@ -205,6 +208,9 @@ class QwiicMCP9600(object):
                 return
         else:
             self._i2c = i2c_driver
+
+        # Reusable buffer for the measurement registers (3 bytes max for the raw ADC)
+        self._rx_buffer = bytearray(3)
     
     def available(self):
         """!
@@ -212,7 +218,7 @@ class QwiicMCP9600(object):
 
         @return **bool** `True` if the data is ready, otherwise `False`
         """
-        status = self.read_block_retry(self.kRegisterSensorStatus, 1)
+        status = self.read_block_retry_into(self.kRegisterSensorStatus, 1)
         if status == -1:
             return False
         return (status[0] & self.kMaskDataReady) != 0
@@ -283,6 +289,31 @@ class QwiicMCP9600(object):
                 return list(value)
         
         return -1
+
+    def read_block_retry_into(self, register, num_bytes):
+        """!
+        Same as read_block_retry(), but reads into a buffer owned by this object
+        rather than allocating a new list. The returned buffer is overwritten by
+        the next call, so use the values before reading again.
+
+        @param int register: The register to read
+        @param int num_bytes: The number of bytes to read (3 max)
+
+        @return **bytearray** The buffer holding the register value, or -1 on error
+        """
+
+        for i in range(self.kRetryAttempts):
+            try:
+                # Read the register
+                self._i2c.read_block_into(self.address, register, self._rx_buffer, 0, num_bytes)
+            except:
+                # If there's an error, try again
+                continue
+            else:
+                # If no error, return the value
+                return self._rx_buffer
+        
+        return -1
     
     def write_double_register(self, register, value):
         """!
@@ -327,22 +358,22 @@ class QwiicMCP9600(object):
         @return  The temperature of the thermocouple or -1 on error
         
         """
-        raw = self.read_block_retry(self.kRegisterHotJuncTemp, 2)
+        raw = self.read_block_retry_into(self.kRegisterHotJuncTemp, 2)
         if raw == -1:
             return -1
-        
-        status = self.read_block_retry(self.kRegisterSensorStatus, 1)
-        if status == -1:
-            return -1
-        
-        # Clear the data ready bit
-        status[0] &= ~self.kMaskDataReady
-        self._i2c.write_byte(self.address, self.kRegisterSensorStatus, status[0])
 
+        # Decode before the status read reuses the buffer
         celcius = (raw[0] << 8 | raw[1])
         # convert from unsigned 16-bit value to a signed 16-bit value
         if celcius > 32767:
             celcius -= 65536
+        
+        status = self.read_block_retry_into(self.kRegisterSensorStatus, 1)
+        if status == -1:
+            return -1
+        
+        # Clear the data ready bit
+        self._i2c.write_byte(self.address, self.kRegisterSensorStatus, status[0] & ~self.kMaskDataReady)
 
         celcius *= self.kDeviceResolution
 
@@ -357,7 +388,7 @@ class QwiicMCP9600(object):
         @return  The temperature of the ambient sensor or -1 on error
         
         """
-        raw = self.read_block_retry(self.kRegisterColdJuncTemp, 2)
+        raw = self.read_block_retry_into(self.kRegisterColdJuncTemp, 2)
         if raw == -1:
             return -1
 
@@ -379,7 +410,7 @@ class QwiicMCP9600(object):
         @return  The temperature difference or -1 on error
         
         """
-        raw = self.read_block_retry(self.kRegisterDeltaJuncTemp, 2)
+        raw = self.read_block_retry_into(self.kRegisterDeltaJuncTemp, 2)
         if raw == -1:
             return -1
 
@@ -400,7 +431,7 @@ class QwiicMCP9600(object):
         
         """
 
-        raw = self.read_block_retry(self.kRegisterRawAdc, 3)
+        raw = self.read_block_retry_into(self.kRegisterRawAdc, 3)
         if raw == -1:
             return -1
         
@@ -711,6 +742,37 @@ class QwiicMCP9600(object):
         # Set the device to burst mode
         return self.set_shutdown_mode(self.kShutdownModeBurst)
 
+    async def burst_async(self, pollMillis = 10):
+        """!
+        Starts a burst and waits for all of its samples to be taken, letting
+        other asyncio tasks run during the conversions. Read the result with
+        get_thermocouple_temp() afterwards.
+
+        @param int pollMillis: How often to check whether the burst is complete, in milliseconds
+
+        @return **bool** `True` if the burst completed, `False` on error or timeout
+        """
+        config = self.read_block_retry(self.kRegisterDeviceConfig, 1)
+        if config == -1:
+            return False
+
+        # Wait up to twice the time the samples should take
+        resolution = (config[0] & self.kConfigMaskADCResolution) >> self.kConfigShiftADCResolution
+        samples = 1 << ((config[0] & self.kConfigMaskBurstModeSample) >> self.kConfigShiftBurstModeSample)
+        timeoutMillis = 2 * samples * self.kConversionTimeMs[resolution]
+
+        if not self.start_burst():
+            return False
+
+        timeWaited = 0
+        while not self.burst_available():
+            if timeWaited > timeoutMillis:
+                return False
+            await qwiic_i2c.asyncSleepMs(pollMillis)
+            timeWaited += pollMillis
+
+        return True
+
     def set_shutdown_mode(self, mode):
         """!
         Changes the shutdown "operating" mode of the MCP9600. Configurable to Normal, Shutdown, and Burst.
@@ -260,6 +260,16 @@ class QwiicNAU7802(object):
         self.begin_calibrate_afe()
         return self.wait_for_calibrate_afe(1000)
 
+    async def calibrate_afe_async(self):
+        """!
+        Same as calibrate_afe(), but lets other asyncio tasks run during the
+        calibration
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        self.begin_calibrate_afe()
+        return await self.wait_for_calibrate_afe_async(1000)
+
     def begin_calibrate_afe(self):
         """!
         Begin asycnhronous calibration of the analog front end. Poll for
@@ -304,6 +314,30 @@ class QwiicNAU7802(object):
             return True
         return False
 
+    async def wait_for_calibrate_afe_async(self, timeout_ms=0, poll_ms=10):
+        """!
+        Same as wait_for_calibrate_afe(), but lets other asyncio tasks run
+        while waiting.
+
+        @param int, optional timeout_ms: Timeout in ms, defaults to 0
+        @param int, optional poll_ms: How often to check the calibration status in ms, defaults to 10
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        time_waited = 0
+        cal_ready = self.cal_afe_status()
+
+        while cal_ready == self.NAU7802_CAL_IN_PROGRESS:
+            if timeout_ms > 0 and time_waited > timeout_ms:
+                break
+            await qwiic_i2c.asyncSleepMs(poll_ms)
+            time_waited += poll_ms
+            cal_ready = self.cal_afe_status()
+
+        if cal_ready == self.NAU7802_CAL_SUCCESS:
+            return True
+        return False
+
     def set_sample_rate(self, rate):
         """!
         Set sample rate in Hz.
@@ -453,6 +487,36 @@ class QwiicNAU7802(object):
         total /= average_amount
         return total
 
+    async def get_average_async(self, average_amount, timeout_ms=1000, poll_ms=5):
+        """!
+        Same as get_average(), but lets other asyncio tasks run between
+        readings
+
+        @param int average_amount: Number of measurements to average
+        @param int, optional timeout_ms: Timeout in milliseconds, defaults to 1000
+        @param int, optional poll_ms: How often to check for a new reading in ms, defaults to 5
+
+        @return **float** Average measurement value
+        """
+        total = 0
+        samples_acquired = 0
+        time_waited = 0
+
+        while True:
+            if self.available():
+                total += self.get_reading()
+                samples_acquired += 1
+                if samples_acquired == average_amount:
+                    break
+
+            if time_waited > timeout_ms:
+                return 0
+            await qwiic_i2c.asyncSleepMs(poll_ms)
+            time_waited += poll_ms
+
+        total /= average_amount
+        return total
+
     def calculate_zero_offset(self, average_amount):
         """!
         Calculates and stores zero offset measurement. Must only be called when
@@ -522,6 +586,25 @@ class QwiicNAU7802(object):
         """
         on_scale = self.get_average(samples_to_take)
 
+        return self._weight_from_reading(on_scale, allow_negative_weights)
+
+    async def get_weight_async(self, allow_negative_weights = False, samples_to_take = 8):
+        """!
+        Same as get_weight(), but lets other asyncio tasks run while the
+        samples are taken
+
+        @param bool, optional allow_negative_weights: Whether negative weights are allowed,
+        defaults to False
+        @param int, optional samples_to_take: Number of measurements to average, defaults to 8
+
+        @return **float** Weight on the scale
+        """
+        on_scale = await self.get_average_async(samples_to_take)
+
+        return self._weight_from_reading(on_scale, allow_negative_weights)
+
+    def _weight_from_reading(self, on_scale, allow_negative_weights):
+        # Applies the zero offset and calibration factor to an average reading
         if not allow_negative_weights and on_scale < self._zero_offset:
             on_scale = self._zero_offset
 
@@ -209,7 +209,7 @@ class QwiicOledBase(object):
 
             @return **bool** True if the device is connected, otherwise False.
             """
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
@@ -317,6 +317,11 @@ class QwiicPCA9685(object):
 		else:
 			self._i2c = i2c_driver
 
+		# Shadow of MODE1, so the AI bit isn't read back before every channel
+		# read or write. Only the host changes AI; the RESTART bit is set by the
+		# device, so get_restart_bit() still reads the register.
+		self._shadow = qwiic_i2c.ShadowRegisters((MODE1,))
+
 		# Do you want debug statements?
 		if debug == None:
 			self.debug = 0	# Debug Statements Disabled
@@ -403,6 +408,34 @@ class QwiicPCA9685(object):
 		# Returns modified byte
 		return (byte & ~(1 << bit_number)) | (value << bit_number)
 
+	#----------------------------------------------
+	# Reads the MODE1 register from the device
+	def _read_mode1(self):
+		"""!
+		Reads the MODE1 register and updates its shadow.
+
+		@return **Integer** Value of MODE1 register.
+		"""
+		mode1 = self._i2c.readByte(self.address, MODE1)
+		self._shadow.record(MODE1, mode1)
+		return mode1
+
+	#----------------------------------------------
+	# Writes the MODE1 register on the device
+	def _write_mode1(self, value):
+		"""!
+		Writes the MODE1 register and updates its shadow.
+
+		@param value: Value to write to MODE1 register.
+		"""
+		self._shadow.write(MODE1, value, self._write_byte)
+
+	def _read_byte(self, register):
+		return self._i2c.readByte(self.address, register)
+
+	def _write_byte(self, register, value):
+		self._i2c.writeByte(self.address, register, value)
+
 	#----------------------------------------------
 	# Checks I2C connection
 	def is_connected(self):
@@ -415,7 +448,7 @@ class QwiicPCA9685(object):
 					False-	Can't find device
 		"""
 
-		return qwiic_i2c.isDeviceConnected(self.address)
+		return self._i2c.isDeviceConnected(self.address)
 
 
 	#----------------------------------------------
@@ -437,7 +470,7 @@ class QwiicPCA9685(object):
 		"""
 		
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		if addr_bit == None:				# If no input for addr_bit, sets to ALLCALL
 			get_addr_bit = 0				# ALLCALL bit
@@ -473,7 +506,7 @@ class QwiicPCA9685(object):
 		"""
 		
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		# Checks for valid input
 		if addr_bit < 0 or addr_bit > 3:
@@ -494,7 +527,7 @@ class QwiicPCA9685(object):
 
 		# Writes to specified address bit in MODE1.
 		addrMode = self.__writeBit__(mode1, set_addr_bit, set_value)
-		self._i2c.writeByte(self.address, MODE1, addrMode)
+		self._write_mode1(addrMode)
 
 	
 	#----------------------------------------------
@@ -510,7 +543,7 @@ class QwiicPCA9685(object):
 		"""
 		
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		sleep_bit = 4 # Fifth bit in register
 
@@ -531,7 +564,7 @@ class QwiicPCA9685(object):
 		"""
 		
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		sleep_bit = 4 # Fifth bit in register
 
@@ -547,7 +580,7 @@ class QwiicPCA9685(object):
 		
 		# Writes 'value' to the SLEEP bit in the MODE 1 register
 		sleepMode = self.__writeBit__(mode1, sleep_bit, set_value)
-		self._i2c.writeByte(self.address, MODE1, sleepMode)
+		self._write_mode1(sleepMode)
 
 
 	#----------------------------------------------
@@ -562,8 +595,8 @@ class QwiicPCA9685(object):
 					1-	Auto-Increment Enabled
 		"""
 
-		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		# MODE1 register, from its shadow when known
+		mode1 = self._shadow.read(MODE1, self._read_byte)
 
 		ai_bit = 5 # Sixth bit in register
 
@@ -586,7 +619,7 @@ class QwiicPCA9685(object):
 		"""
 
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		ai_bit = 5 # Sixth bit in register
 
@@ -602,7 +635,7 @@ class QwiicPCA9685(object):
 
 		# Writes 'value' to the AI bit in the MODE 1 register
 		aiMode = self.__writeBit__(mode1, ai_bit, set_value)
-		self._i2c.writeByte(self.address, MODE1, aiMode)
+		self._write_mode1(aiMode)
 
 
 	#----------------------------------------------
@@ -627,7 +660,7 @@ class QwiicPCA9685(object):
 		"""
 
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		extclk_bit = 6 # Seventh bit in register
 
@@ -649,7 +682,7 @@ class QwiicPCA9685(object):
 		"""
 		
 		# Reads MODE 1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		rs_bit = 7 # Eighth bit in register
 
@@ -677,7 +710,7 @@ class QwiicPCA9685(object):
 		"""
 
 		# Reads MODE 1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		rs_bit = 7 # Eighth bit in register
 
@@ -693,7 +726,7 @@ class QwiicPCA9685(object):
 			# value = 0 # Default
 		else:
 			rsMode = self.__writeBit__(mode1, rs_bit, value)
-			self._i2c.writeByte(self.address, MODE1, rsMode)
+			self._write_mode1(rsMode)
 
 		# Returns RESTART bit value
 		return self.get_restart_bit()
@@ -1142,6 +1175,9 @@ class QwiicPCA9685(object):
 		
 		self._i2c.writeCommand(_gcAddr, _SWRST)
 
+		# MODE1 is back to its power-up value
+		self._shadow.invalidate()
+
 
 	#----------------------------------------------
 	# Restart
@@ -1151,7 +1187,7 @@ class QwiicPCA9685(object):
 		register.)
 		"""
 		
-		self._i2c.writeByte(self.address, MODE1, 0x00)
+		self._write_mode1(0x00)
 
 
 	#----------------------------------------------
@@ -1217,7 +1253,7 @@ class QwiicPCA9685(object):
 		Internal Clock:			25 MHz (Default)
 		"""
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 
 		if frequency == None:
@@ -1266,7 +1302,7 @@ class QwiicPCA9685(object):
 		self._i2c.writeByte(self.address, PRE_SCALE, pwmPreScale)	
 		
 		# Resets MODE1 register to the original value.
-		self._i2c.writeByte(self.address, MODE1, mode1)
+		self._write_mode1(mode1)
 
 		return True
 
@@ -1370,7 +1406,7 @@ class QwiicPCA9685(object):
 		"""
 
 		# Read MODE1 register
-		mode1 = self._i2c.readByte(self.address, MODE1)
+		mode1 = self._read_mode1()
 
 		sleep_bit = 4	# Fifth bit in register
 		extclk_bit = 6	# Seventh bit in register
@@ -1382,4 +1418,4 @@ class QwiicPCA9685(object):
 		# external clock can be active during the switch because the
 		# SLEEP bit is set.
 		extclk = mode1 | (1 << sleep_bit) | (1 << extclk_bit)	# Sets SLEEP and EXTCLK bits to 1
-		self._i2c.writeByte(self.address, MODE1, extclk)		# Sets SLEEP and EXTCLK bits to 1
+		self._write_mode1(extclk)		# Sets SLEEP and EXTCLK bits to 1
@@ -271,6 +271,7 @@ class QwiicRFID(object):
         
         self._i2c.writeByte(self.address, self.ADDRESS_LOCATION, new_address)
         
+        self._i2c.invalidateScan(self.address)
         self.address = new_address
 
     # ------------------------------------------------
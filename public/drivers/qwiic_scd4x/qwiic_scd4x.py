@@ -198,6 +198,17 @@ class QwiicSCD4x(object):
         self.send_command(self.kComStopPeriodicMeasurement)
         self._doingPeriodicMeasurement = False
         time.sleep(delayMillis / 1000)
+
+    async def stop_periodic_measurement_async(self, delayMillis = 500):
+        """!
+        Same as stop_periodic_measurement(), but lets other asyncio tasks run
+        while the sensor stops.
+
+        @param int delayMillis: The delay in milliseconds to wait after stopping the measurement
+        """
+        self.send_command(self.kComStopPeriodicMeasurement)
+        self._doingPeriodicMeasurement = False
+        await qwiic_i2c.asyncSleepMs(delayMillis)
     
     def read_measurement(self):
         """!
@@ -220,6 +231,31 @@ class QwiicSCD4x(object):
 
         time.sleep(0.001) # specified by datasheet
 
+        return self._read_measurement_response()
+
+    async def read_measurement_async(self, timeoutMillis = 5000, pollMillis = 100):
+        """!
+        Same as read_measurement(), but waits for the data to be ready rather
+        than returning `False` straight away, letting other asyncio tasks run
+        while the sensor converts. With periodic measurements there's new data
+        every 5 seconds, 30 seconds in low power mode.
+
+        @param int timeoutMillis: How long to wait for data, in milliseconds
+        @param int pollMillis: How often to check whether data is ready, in milliseconds
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        if not await self.wait_for_data_ready_async(timeoutMillis, pollMillis):
+            return False
+
+        self.send_command(self.kComReadMeasurement)
+
+        await qwiic_i2c.asyncSleepMs(1) # specified by datasheet
+
+        return self._read_measurement_response()
+
+    def _read_measurement_response(self):
+        # Reads and converts the response to the read measurement command
         bytes_read = self._i2c.readBlock(self.address, None, 9) # By passing "None" we perform a general read. Requires new version of qwiic_i2c
         co2_bytes = bytes_read[0:3]
         temperature_bytes = bytes_read[3:6]
@@ -426,6 +462,38 @@ class QwiicSCD4x(object):
         # If the least significant 11 bits of word[0] are 0 → data not ready
         # else → data ready for read-out
         return (response & 0x07FF) != 0
+
+    async def get_data_ready_status_async(self):
+        """!
+        Same as get_data_ready_status(), but lets other asyncio tasks run
+        during the command execution time.
+
+        @return **bool** `True` if data is ready, otherwise `False`
+        """
+        response = await self.read_register_async(self.kComGetDataReadyStatus)
+        if response is None:
+            return False
+
+        return (response & 0x07FF) != 0
+
+    async def wait_for_data_ready_async(self, timeoutMillis = 5000, pollMillis = 100):
+        """!
+        Waits until a measurement is ready to be read, letting other asyncio
+        tasks run in the meantime.
+
+        @param int timeoutMillis: How long to wait, in milliseconds
+        @param int pollMillis: How often to check whether data is ready, in milliseconds
+
+        @return **bool** `True` if data is ready, `False` on timeout
+        """
+        timeWaited = 0
+        while not await self.get_data_ready_status_async():
+            if timeWaited >= timeoutMillis:
+                return False
+            await qwiic_i2c.asyncSleepMs(pollMillis)
+            timeWaited += pollMillis
+
+        return True
     
     def persist_settings(self, delayMillis = 800):
         """!
@@ -581,6 +649,24 @@ class QwiicSCD4x(object):
         self.send_command(self.kComMeasureSingleShot)
 
         return True
+
+    async def measure_single_shot_async(self, pollMillis = 100):
+        """!
+        SCD41 only. Takes a single low-power measurement and reads it, letting
+        other asyncio tasks run during the 5 second conversion. The values are
+        then available from get_co2(), get_temperature() and get_humidity().
+
+        @param int pollMillis: How often to check whether data is ready, once
+            the conversion should be done, in milliseconds
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        if not self.measure_single_shot():
+            return False
+
+        await qwiic_i2c.asyncSleepMs(5000) # execution time of kComMeasureSingleShot
+
+        return await self.read_measurement_async(1000, pollMillis)
     
     def measure_single_shot_rht_only(self):
         """!
@@ -601,6 +687,24 @@ class QwiicSCD4x(object):
 
         return True
 
+    async def measure_single_shot_rht_only_async(self, pollMillis = 10):
+        """!
+        SCD41 only. Takes a single humidity and temperature measurement and
+        reads it, letting other asyncio tasks run during the 50ms conversion.
+        CO2 output is returned as 0 ppm.
+
+        @param int pollMillis: How often to check whether data is ready, once
+            the conversion should be done, in milliseconds
+
+        @return **bool** `True` if successful, otherwise `False`
+        """
+        if not self.measure_single_shot_rht_only():
+            return False
+
+        await qwiic_i2c.asyncSleepMs(50) # execution time of kComMeasureSingleShotRhtOnly
+
+        return await self.read_measurement_async(1000, pollMillis)
+
     def get_sensor_type(self):
         """!
         Get the sensor type. Allowable versions are kTypeSCD40, kTypeSCD41, and kTypeSDC4xInvalid
@@ -731,6 +835,26 @@ class QwiicSCD4x(object):
         
         time.sleep(delayMillis / 1000)
 
+        return self._read_register_response()
+
+    async def read_register_async(self, registerAddress, delayMillis = 1):
+        """!
+        Same as read_register(), but lets other asyncio tasks run during the
+        command execution time.
+
+        @param int registerAddress: The address of the register to read
+        @param int delayMillis: The delay in milliseconds to wait after reading the register
+
+        @return **int** The value of the register if successful, otherwise `None`
+        """
+        self.send_command(registerAddress)
+
+        await qwiic_i2c.asyncSleepMs(delayMillis)
+
+        return self._read_register_response()
+
+    def _read_register_response(self):
+        # Reads a register value written by the sensor, checking its CRC
         bytes_read = self._i2c.readBlock(self.address, None, 3) # By passing "None" we perform a general read. Requires new version of qwiic_i2c
         
         if self.compute_crc8(bytes_read[0:2]) != bytes_read[2]:
@@ -278,7 +278,7 @@ class QwiicScmd(object):
 
             @return **bool** True if the device is connected, otherwise False.
             """
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
@@ -190,7 +190,7 @@ class QwiicSerlcd(object):
         @return **bool** True if the device is connected, otherwise False.
         """
         # Another possible comment could be @retval bool True: Device is connected. above
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
@@ -222,6 +222,37 @@ class QwiicSGP40(object):
 
         @return **int** 0 if CRC checks out, -1 otherwise
         """
+        self.__start_measure_raw(__relative_humidity, __temperature_c)
+
+        time.sleep(self.DURATION_READ_RAW_VOC)
+        
+        return self.__read_measure_raw()
+
+    # --------------------------------------------------------------------
+    # measure_raw_async(__relative_humidity, __temperature_c)
+    #
+    # Same as measure_raw(), for use with asyncio.
+    async def measure_raw_async(self, __relative_humidity = 50, __temperature_c = 25):
+        """!
+        Returns the raw data, letting other asyncio tasks run while the sensor
+        measures. See measure_raw().
+
+        @param __relative_humidity: float relative humidity between 0 and 100%.
+        @param __temperature_c: float temperature in celcius between -45 and 130 degrees.
+
+        @return **int** The raw measurement if CRC checks out, -1 otherwise
+        """
+        self.__start_measure_raw(__relative_humidity, __temperature_c)
+
+        await qwiic_i2c.asyncSleepMs(int(self.DURATION_READ_RAW_VOC * 1000))
+
+        return self.__read_measure_raw()
+
+    # --------------------------------------------------------------------
+    # __start_measure_raw(__relative_humidity, __temperature_c)
+    #
+    # Sends the measure raw command with the compensation parameters
+    def __start_measure_raw(self, __relative_humidity, __temperature_c):
         # Check boundaries of relative humidity and temperature
         if __relative_humidity < 0:
             __relative_humidity = 0
@@ -250,8 +281,11 @@ class QwiicSGP40(object):
         
         self._i2c.writeBlock(self.address, temp0, write_bytes)
 
-        time.sleep(self.DURATION_READ_RAW_VOC)
-        
+    # --------------------------------------------------------------------
+    # __read_measure_raw()
+    #
+    # Reads back the result of the measure raw command
+    def __read_measure_raw(self):
         # Data is read back in 3 bytes: data (MSB) / data (LSB) / Cecksum
         result = self._i2c.readBlock(self.address, 0, 3)
         
@@ -324,4 +358,25 @@ class QwiicSGP40(object):
             return -1
         else:
             voc_index = self.__my_vocalgorithm.vocalgorithm_process(raw)
-            return voc_index 
\ No newline at end of file
+            return voc_index 
+
+    # --------------------------------------------------------------------
+    # get_VOC_index_async(self.__relative_humidity, self.__tempertature_c)
+    #
+    # Same as get_VOC_index(), for use with asyncio.
+    async def get_VOC_index_async(self, __relative_humidity = 50, __temperature_c = 25):
+        """!
+        Get VOC index, letting other asyncio tasks run while the sensor measures
+
+        @param __relative_humidity: float relative humidity between 0 and 100%.
+        @param __temperature_c: float temperature in celcius between -45 and 130 degrees.
+
+        @return **int** VOC index
+        """
+        raw = await self.measure_raw_async(__relative_humidity, __temperature_c)
+
+        if raw < 0:
+            return -1
+        else:
+            voc_index = self.__my_vocalgorithm.vocalgorithm_process(raw)
+            return voc_index
@@ -177,6 +177,7 @@ class QwiicSoilMoistureSensor(object):
         
         self._i2c.writeByte(self.address, COMMAND_CHANGE_ADDRESS, newAddress)
         
+        self._i2c.invalidateScan(self.address)
         self.address = newAddress
 
 
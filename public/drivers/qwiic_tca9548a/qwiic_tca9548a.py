@@ -139,6 +139,9 @@ class QwiicTCA9548A(object):
 		else:
 			self.debug = debug	# Debug Statements Enabled (1)
 
+		# Shadow of the control register, None until it's been read or written
+		self._control = None
+
 
     #--------------------------------------------------------------------------
 	def is_connected(self):
@@ -147,7 +150,7 @@ class QwiicTCA9548A(object):
 
 			@return **bool** True if the device is connected, otherwise False.
 			"""
-		return qwiic_i2c.isDeviceConnected(self.address)
+		return self._i2c.isDeviceConnected(self.address)
 
 	connected = property(is_connected)
 
@@ -159,7 +162,23 @@ class QwiicTCA9548A(object):
 		"""
 
 		# Return enabled channels
-		return self._i2c.readByte(self.address, None) # Note, passing "None" will simply read from device rather than targetting a specific register
+		self._control = self._i2c.readByte(self.address, None) # Note, passing "None" will simply read from device rather than targetting a specific register
+		return self._control
+
+	def _get_control(self):
+		# The control register, read from the device only if it isn't known yet
+		if self._control is None:
+			return self.get_enabled_channels()
+		return self._control
+
+	def _set_control(self, command):
+		try:
+			self._i2c.writeCommand(self.address, command)
+		except:
+			# The write may or may not have reached the device
+			self._control = None
+			raise
+		self._control = command
 
 	def enable_channels(self, enable):
 		"""!
@@ -172,7 +191,7 @@ class QwiicTCA9548A(object):
 							an individual integer into a list.
 							Range- 0 to 7
 		"""
-		command = self.get_enabled_channels()
+		command = self._get_control()
 		# If entry is an integer and not a list; turn it into a list of (1)
 		if type(enable) is not list: enable = [ enable ]
 
@@ -186,7 +205,7 @@ class QwiicTCA9548A(object):
 				# Set bit to 1
 				command = command | (1<<entry)
 
-		self._i2c.writeCommand(self.address, command)
+		self._set_control(command)
 
 	def disable_channels(self, disable):
 		"""!
@@ -199,7 +218,7 @@ class QwiicTCA9548A(object):
 							convert an individual integer into a list.
 							Range- 0 to 7
 		"""
-		command = self.get_enabled_channels()
+		command = self._get_control()
 
 		# If entry is an integer and not a list; turn it into a list of (1)
 		if type(disable) is not list: disable = [ disable ]
@@ -214,7 +233,7 @@ class QwiicTCA9548A(object):
 				# Clear bit to 0
 				command = command & ~(1 << entry)
 
-		self._i2c.writeCommand(self.address, command)
+		self._set_control(command)
 
 	def enable_all(self):
 		"""!
@@ -223,7 +242,7 @@ class QwiicTCA9548A(object):
 		"""
 
 		# Enable all channels
-		self._i2c.writeCommand(self.address, 0xFF)
+		self._set_control(0xFF)
 
 	def disable_all(self):
 		"""!
@@ -232,7 +251,33 @@ class QwiicTCA9548A(object):
 		"""
 
 		# Disable all channels
-		self._i2c.writeCommand(self.address, 0x00)
+		self._set_control(0x00)
+
+	def select_channel(self, channel):
+		"""!
+		This method connects a single channel of the Qwiic Mux and
+		disconnects all the others. Nothing is written if that channel is
+		already the only one connected.
+
+		@param channel: Channel to connect on the Qwiic Mux.
+							Range- 0 to 7
+		"""
+		command = 1 << channel
+		if command != self._control:
+			self._set_control(command)
+
+	def get_channel_driver(self, channel):
+		"""!
+		This method returns an I2C driver for the devices on one channel of
+		the Qwiic Mux. Pass it as the 'i2c_driver' of a device driver. The
+		channel is then selected automatically before each transaction.
+
+		@param channel: Channel the device is on.
+							Range- 0 to 7
+
+		@return **MuxedI2C** I2C driver for the channel
+		"""
+		return MuxedI2C(self, channel)
 
 	def list_channels(self):
 		"""!
@@ -249,3 +294,198 @@ class QwiicTCA9548A(object):
 				print("Channel %d: Enabled" % x)
 			else:
 				print("Channel %d: ??? (check configuration)" % x)
+
+
+class MuxedI2C(qwiic_i2c.I2CDriver):
+	"""!
+	I2C driver for the devices on one channel of a Qwiic Mux.
+
+	Every transaction first selects the channel on the mux. The mux keeps a
+	shadow of its control register, so it is only written when the channel
+	actually changes. That way, several identical sensors at the same
+	address can be polled in turn with one mux write per switch.
+
+	@param mux: The QwiicTCA9548A the devices are behind.
+	@param channel: Channel the devices are on.
+						Range- 0 to 7
+
+	@example
+		>>> mux = qwiic_tca9548a.QwiicTCA9548A()
+		>>> tofs = [qwiic_vl53l1x.QwiicVL53L1X(i2c_driver = mux.get_channel_driver(ch)) for ch in range(4)]
+	"""
+
+	name = "Qwiic Mux channel"
+
+	def __init__(self, mux, channel):
+		if channel not in mux.available_channels:
+			raise ValueError("Channel must be in range of available channels (0-7).")
+
+		qwiic_i2c.I2CDriver.__init__(self)
+
+		self._mux = mux
+		self._i2c = mux._i2c
+		self.channel = channel
+		self.maxWriteSize = self._i2c.maxWriteSize
+
+	@classmethod
+	def isPlatform(cls):
+		# Never picked by qwiic_i2c.getI2CDriver(), it's created from a mux
+		return False
+
+	@classmethod
+	def is_platform(cls):
+		return cls.isPlatform()
+
+	def _select(self):
+		self._mux.select_channel(self.channel)
+
+	#--------------------------------------------------------------------------
+	# Bus clock, shared with the bus the mux is on
+
+	def getFreq(self):
+		return self._i2c.getFreq()
+
+	def get_freq(self):
+		return self.getFreq()
+
+	def setFreq(self, freq):
+		self._i2c.setFreq(freq)
+
+	def set_freq(self, freq):
+		return self.setFreq(freq)
+
+	#--------------------------------------------------------------------------
+	# read commands
+
+	def readWord(self, address, commandCode):
+		self._select()
+		return self._i2c.readWord(address, commandCode)
+
+	def read_word(self, address, commandCode):
+		return self.readWord(address, commandCode)
+
+	def readByte(self, address, commandCode = None):
+		self._select()
+		return self._i2c.readByte(address, commandCode)
+
+	def read_byte(self, address, commandCode = None):
+		return self.readByte(address, commandCode)
+
+	def readBlock(self, address, commandCode, nBytes):
+		self._select()
+		return self._i2c.readBlock(address, commandCode, nBytes)
+
+	def read_block(self, address, commandCode, nBytes):
+		return self.readBlock(address, commandCode, nBytes)
+
+	def readBlockInto(self, address, commandCode, buf, offset = 0, nBytes = None):
+		self._select()
+		return self._i2c.readBlockInto(address, commandCode, buf, offset, nBytes)
+
+	def read_block_into(self, address, commandCode, buf, offset = 0, nBytes = None):
+		return self.readBlockInto(address, commandCode, buf, offset, nBytes)
+
+	def readReg16(self, address, register, nBytes):
+		self._select()
+		return self._i2c.readReg16(address, register, nBytes)
+
+	def read_reg16(self, address, register, nBytes):
+		return self.readReg16(address, register, nBytes)
+
+	def readReg16Into(self, address, register, buf, offset = 0, nBytes = None):
+		self._select()
+		return self._i2c.readReg16Into(address, register, buf, offset, nBytes)
+
+	def read_reg16_into(self, address, register, buf, offset = 0, nBytes = None):
+		return self.readReg16Into(address, register, buf, offset, nBytes)
+
+	#--------------------------------------------------------------------------
+	# write commands
+
+	def writeCommand(self, address, commandCode):
+		self._select()
+		return self._i2c.writeCommand(address, commandCode)
+
+	def write_command(self, address, commandCode):
+		return self.writeCommand(address, commandCode)
+
+	def writeWord(self, address, commandCode, value):
+		self._select()
+		return self._i2c.writeWord(address, commandCode, value)
+
+	def write_word(self, address, commandCode, value):
+		return self.writeWord(address, commandCode, value)
+
+	def writeByte(self, address, commandCode, value):
+		self._select()
+		return self._i2c.writeByte(address, commandCode, value)
+
+	def write_byte(self, address, commandCode, value):
+		return self.writeByte(address, commandCode, value)
+
+	def writeBlock(self, address, commandCode, value):
+		self._select()
+		return self._i2c.writeBlock(address, commandCode, value)
+
+	def write_block(self, address, commandCode, value):
+		return self.writeBlock(address, commandCode, value)
+
+	def writeBlockFrom(self, address, commandCode, buf):
+		self._select()
+		return self._i2c.writeBlockFrom(address, commandCode, buf)
+
+	def write_block_from(self, address, commandCode, buf):
+		return self.writeBlockFrom(address, commandCode, buf)
+
+	def writeReg16(self, address, register, data):
+		self._select()
+		return self._i2c.writeReg16(address, register, data)
+
+	def write_reg16(self, address, register, data):
+		return self.writeReg16(address, register, data)
+
+	def writeReadBlock(self, address, writeBytes, readNBytes):
+		self._select()
+		return self._i2c.writeReadBlock(address, writeBytes, readNBytes)
+
+	def write_read_block(self, address, writeBytes, readNBytes):
+		return self.writeReadBlock(address, writeBytes, readNBytes)
+
+	#--------------------------------------------------------------------------
+	# Devices on the channel. These have their own scan cache, the same
+	# address can answer on one channel and not on another.
+
+	def isDeviceConnected(self, devAddress):
+		isConnected = self.scanCache.lookup(devAddress)
+		if isConnected is not None:
+			return isConnected
+
+		self._select()
+		isConnected = False
+		try:
+			# Try to write nothing to the device
+			self._i2c.writeBlockFrom(devAddress, None, b"")
+			isConnected = True
+		except:
+			pass
+
+		self.scanCache.record(devAddress, isConnected)
+		return isConnected
+
+	def is_device_connected(self, devAddress):
+		return self.isDeviceConnected(devAddress)
+
+	def ping(self, devAddress):
+		return self.isDeviceConnected(devAddress)
+
+	def scan(self):
+		"""!
+		Returns the addresses that answer with this channel selected. The
+		devices on the bus the mux is on, including the mux, are listed too.
+		"""
+		self._select()
+		addresses = self._i2c.scan()
+		# The underlying driver just recorded this channel's devices as its own
+		self._i2c.invalidateScan()
+		self.scanCache.recordScan(addresses)
+		return addresses
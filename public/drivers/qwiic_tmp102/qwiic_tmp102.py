@@ -79,7 +79,7 @@ class QwiicTmp102Sensor(object):
 
         @return **bool** True if the device is connected, otherwise False.
         """        
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
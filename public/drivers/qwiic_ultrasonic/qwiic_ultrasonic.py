@@ -158,6 +158,7 @@ class QwiicUltrasonic(object):
         self._i2c.writeCommand(self.address, address)
 
         # Update the address of this object
+        self._i2c.invalidateScan(self.address)
         self.address = address
 
         # Done!
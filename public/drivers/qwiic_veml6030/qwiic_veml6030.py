@@ -151,6 +151,13 @@ class QwiicVEML6030(object):
         else:
             self.address = self.available_addresses[0]
 
+        # Only the host writes the configuration registers, so they don't need
+        # to be read back, e.g. for the gain and integration time of every reading
+        self._shadow = qwiic_i2c.ShadowRegisters((self.VEML6030_SETTING_REG,
+                                                  self.VEML6030_H_THRESH_REG,
+                                                  self.VEML6030_L_THRESH_REG,
+                                                  self.VEML6030_POWER_SAVE_REG))
+
         # Load the I2C driver if one isn't provided
         if i2c_driver is None:
             self._i2c = qwiic_i2c.getI2CDriver()
@@ -180,6 +187,9 @@ class QwiicVEML6030(object):
         # Confirm device is connected before doing anything
         if not self.is_connected():
             return False
+
+        # The device may have been power cycled since the registers were shadowed
+        self._shadow.invalidate()
         
         # VEML6030 is powered down by default, so power it on!
         self.power_on()
@@ -663,7 +673,7 @@ class QwiicVEML6030(object):
         i2c_write |= bits << start_position
 
         # Write new value back to register
-        self._i2c.writeWord(self.address, w_reg, i2c_write)
+        self._shadow.write(w_reg, i2c_write, self._write_word)
 
     def _read_register(self, reg):
         """!
@@ -673,4 +683,10 @@ class QwiicVEML6030(object):
 
         @return **int** Register value
         """
+        return self._shadow.read(reg, self._read_word)
+
+    def _read_word(self, reg):
         return self._i2c.readWord(self.address, reg)
+
+    def _write_word(self, reg, value):
+        self._i2c.writeWord(self.address, reg, value)
@@ -106,6 +106,20 @@
 import time							# Time access and conversion package
 import math							# Basic math package
 import qwiic_i2c					# I2C bus driver package
+from array import array
+
+try:
+	from time import ticks_ms, ticks_diff, ticks_add
+except ImportError:
+	# Not MicroPython
+	def ticks_ms():
+		return int(time.monotonic() * 1000)
+
+	def ticks_diff(end, start):
+		return end - start
+
+	def ticks_add(ticks, delta):
+		return ticks + delta
 
 # From vL53l1x_class.h Header File
 SOFT_RESET =															0x0000
@@ -150,6 +164,30 @@ VL53L1_FIRMWARE__SYSTEM_STATUS =										0x00E5
 VL53L1_IDENTIFICATION__MODEL_ID =										0x010F
 VL53L1_ROI_CONFIG__MODE_ROI_CENTRE_SPAD =								0x013E
 
+# The RESULT__ block read by read_result(), from the range status to the
+# end of the signal rate, and the offsets of its fields
+_RESULT_BLOCK_SIZE = 0x0099 - VL53L1_RESULT__RANGE_STATUS + 1
+_RESULT_SPADS = VL53L1_RESULT__DSS_ACTUAL_EFFECTIVE_SPADS_SD0 - VL53L1_RESULT__RANGE_STATUS
+_RESULT_AMBIENT = RESULT__AMBIENT_COUNT_RATE_MCPS_SD - VL53L1_RESULT__RANGE_STATUS
+_RESULT_DISTANCE = VL53L1_RESULT__FINAL_CROSSTALK_CORRECTED_RANGE_MM_SD0 - VL53L1_RESULT__RANGE_STATUS
+_RESULT_SIGNAL = VL53L1_RESULT__PEAK_SIGNAL_COUNT_RATE_CROSSTALK_CORRECTED_MCPS_SD0 - VL53L1_RESULT__RANGE_STATUS
+
+# Raw range status from the device -> range status reported by the driver
+_RANGE_STATUS = {
+	9:0,
+	6:1,
+	4:2,
+	8:3,
+	5:4,
+	3:5,
+	19:6,
+	7:7,
+	12:9,
+	18:10,
+	22:11,
+	23:12,
+	13:13}
+
 _VL53L1X_DEFAULT_DEVICE_ADDRESS =										0x52
 
 _DEFAULT_NAME = "Qwiic 4m Distance Sensor (ToF)"
@@ -478,6 +516,12 @@ class QwiicVL53L1X(object):
 		else:
 			self.debug = debug	# Debug Statements Enabled (1)
 
+		# Interrupt polarity, read from the device the first time it's needed
+		self._interrupt_polarity = None
+
+		# Reused by read_result()
+		self._result_buffer = bytearray(_RESULT_BLOCK_SIZE)
+
 
 	def _begin(self):
 		"""!
@@ -516,6 +560,34 @@ class QwiicVL53L1X(object):
 		return distance
 
 
+	def read_result(self, result = None):
+		"""!
+		This function reads the whole ranging result in a single I2C
+		transaction, instead of one transaction per get_*() function.
+
+		@param result: Optional list of 5 to fill in, to avoid allocating
+							a new one for every measurement
+
+		@return **List** [range status, distance in mm, signal rate in kcps,
+							ambient rate in kcps, number of enabled SPADs].
+							The range status is the same as get_range_status().
+		"""
+		self.status = 0
+		buf = self._result_buffer
+		self._i2c.readReg16Into(self.address, VL53L1_RESULT__RANGE_STATUS, buf)
+
+		if result is None:
+			result = [0] * 5
+
+		result[0] = _RANGE_STATUS.get(buf[0] & 0x1F, 255)
+		result[1] = (buf[_RESULT_DISTANCE] << 8) | buf[_RESULT_DISTANCE + 1]
+		result[2] = ((buf[_RESULT_SIGNAL] << 8) | buf[_RESULT_SIGNAL + 1]) * 8
+		result[3] = ((buf[_RESULT_AMBIENT] << 8) | buf[_RESULT_AMBIENT + 1]) * 8
+		result[4] = buf[_RESULT_SPADS]
+
+		return result
+
+
 	def init_sensor(self, address):
 		"""!
 		Initialize the sensor with default values
@@ -582,6 +654,7 @@ class QwiicVL53L1X(object):
 		self.status = 0
 
 		self.status = self.__i2cWrite(self.address, VL53L1_I2C_SLAVE__DEVICE_ADDRESS, new_address, 1)
+		self._i2c.invalidateScan(self.address)
 		self.address = new_address
 		
 		return self.status
@@ -598,6 +671,9 @@ class QwiicVL53L1X(object):
 		tmp = 0
 		timeout = 0
 
+		# The default configuration sets the interrupt polarity
+		self._interrupt_polarity = None
+
 		for Addr in range(0x2D, 0x87 + 1):
 			self.status = self.__i2cWrite(self.address, Addr, VL51L1X_DEFAULT_CONFIGURATION[Addr - 0x2D], 1)
 		
@@ -638,23 +714,28 @@ class QwiicVL53L1X(object):
 		Temp = self.__i2cRead(self.address, GPIO_HV_MUX__CTRL, 1)
 
 		Temp = Temp & 0xEF
+		self._interrupt_polarity = None
 		self.status = self.__i2cWrite(self.address, GPIO_HV_MUX__CTRL, Temp | (not (NewPolarity & 1)) << 4, 1)
+		self._interrupt_polarity = NewPolarity & 1
 
 		return self.status
 
 
 	def get_interrupt_polarity(self):
 		"""!
-		This function returns the current interrupt polarity
+		This function returns the current interrupt polarity. The device is
+		only read the first time, after that the polarity is cached until
+		set_interrupt_polarity() or sensor_init() changes it.
 
 		@return **Integer** 1 = active high (**default**), 0 = active low
 		"""
 		self.status = 0
-		Temp = self.__i2cRead(self.address, GPIO_HV_MUX__CTRL, 1)
-		Temp = Temp & 0x10
-		pInterruptPolarity = not (Temp >> 4)
+		if self._interrupt_polarity is None:
+			Temp = self.__i2cRead(self.address, GPIO_HV_MUX__CTRL, 1)
+			Temp = Temp & 0x10
+			self._interrupt_polarity = int(not (Temp >> 4))
 
-		return pInterruptPolarity
+		return self._interrupt_polarity
 
 
 	def start_ranging(self):
@@ -1003,24 +1084,7 @@ class QwiicVL53L1X(object):
 		RgSt = self.__i2cRead(self.address, VL53L1_RESULT__RANGE_STATUS, 1)
 		RgSt = RgSt&0x1F
 
-		def get_range_status_switch(var):
-			switcher = {
-				9:0,
-				6:1,
-				4:2,
-				8:3,
-				5:4,
-				3:5,
-				19:6,
-				7:7,
-				12:9,
-				18:10,
-				22:11,
-				23:12,
-				13:13}
-			return switcher.get(var,255)
-		
-		rangeStatus = get_range_status_switch(RgSt)
+		rangeStatus = _RANGE_STATUS.get(RgSt, 255)
 
 		return rangeStatus
 
@@ -1491,10 +1555,7 @@ class QwiicVL53L1X(object):
 		@return **Boolean** status- (*self*) Indicator for I2C transaction success???
 		"""
 		
-		registerMSB = register >> 8
-		registerLSB = register & 0xFF
-
-		buffer = [registerLSB]
+		buffer = []
 
 		if nbytes == 4:
 			buffer.append( (data >> 24) & 0xFF )
@@ -1512,7 +1573,7 @@ class QwiicVL53L1X(object):
 			
 			return
 		
-		self.status = self._i2c.writeBlock(address, registerMSB, buffer)
+		self.status = self._i2c.writeReg16(address, register, buffer)
 
 		return self.status
 	
@@ -1530,22 +1591,14 @@ class QwiicVL53L1X(object):
 		"""
 		
 		data = 0
-		registerMSB = register >> 8
-		registerLSB = register & 0xFF
 
 		if nbytes not in [1, 2, 4]:
 			if self.debug == 1:
 				print("in __i2cWriteBlock, nbytes entered invalid")
 			return
 
-		# Setup for read/write transactions on smbus 2
-		# write = self.i2c_custom.write(address, [registerMSB, registerLSB])	# Write part of transaction
-		# read = self.i2c_custom.read(address, nbytes)						# Read part of transaction
-
-		# self._i2c.i2c_rdwr(write, read)
-		# read_data = self._i2c.__i2c_rdwr__(address, [registerMSB, registerLSB], nbytes)
-		read_data = self._i2c.write_read_block(address, [registerMSB, registerLSB], nbytes)
-		buffer = list(read_data)
+		# 16-bit register address, repeated start and read in one transaction
+		buffer = self._i2c.read_reg16(address, register, nbytes)
 
 		for i in range(0, nbytes):
 			data = ( buffer[ (nbytes - 1) - i ] << (i*8) ) + data
@@ -1554,3 +1607,213 @@ class QwiicVL53L1X(object):
 		#	data = ( val << (i*8) ) + data
 
 		return data
+
+
+class QwiicVL53L1XArray(object):
+	"""!
+	A group of VL53L1X sensors on one bus, e.g. a bumper ring.
+
+	begin() brings the sensors out of shutdown one at a time with their
+	XSHUT pins and moves each one to its own address. start_ranging()
+	starts them a fraction of the measurement period apart, so they don't
+	see each other's laser pulses. update() then reads every sensor that
+	has a new result, and doesn't ask the ones that can't have one yet.
+
+	The last result of each sensor is kept in distances, range_status and
+	timestamps (ticks_ms() when it was read). Sensors that didn't boot are
+	left out, their bit in booted is clear and their range_status stays 255.
+
+	@param sensors: The QwiicVL53L1X objects, all at the default address
+						until begin() is called
+	@param xshut_pins: Pin objects driving the XSHUT input of each sensor,
+						in the same order. None if the sensors are already at
+						their addresses, or each is on its own mux channel.
+	@param addresses: Address to give each sensor. By default, addresses
+						no known qwiic device uses and nothing answers at.
+						Either way, they're registered with qwiic_i2c as
+						VL53L1X addresses, for picking the bus clock.
+
+	@example
+		>>> pins = [machine.Pin(n, machine.Pin.OUT) for n in (2, 3, 4, 5)]
+		>>> tofs = qwiic_vl53l1x.QwiicVL53L1XArray([qwiic_vl53l1x.QwiicVL53L1X() for p in pins], pins)
+		>>> tofs.begin()
+		>>> tofs.start_ranging()
+		>>> while True:
+		...     if tofs.update():
+		...         print(tofs.distances)
+	"""
+
+	def __init__(self, sensors, xshut_pins = None, addresses = None):
+		self.sensors = list(sensors)
+		count = len(self.sensors)
+
+		if xshut_pins is not None and len(xshut_pins) != count:
+			raise ValueError("One XSHUT pin is needed per sensor.")
+		if addresses is not None and len(addresses) != count:
+			raise ValueError("One address is needed per sensor.")
+
+		self._xshut_pins = xshut_pins
+		self._addresses = addresses
+
+		self.distances = array("H", [0] * count)
+		self.range_status = bytearray([255] * count)
+		self.timestamps = array("l", [0] * count)
+
+		# Bit mask of the sensors that are up, all of them until begin() finds
+		# otherwise
+		self.booted = (1 << count) - 1
+
+		# Time from which each sensor can have a new result, and the
+		# measurement period the sensors were started with
+		self._check_after = array("l", [0] * count)
+		self._period_ms = 0
+
+		self._result = [0] * 5
+
+	def _free_addresses(self, count):
+		"""!
+		Finds addresses for the sensors that no qwiic driver lists and no
+		device answers at.
+		"""
+		i2c = self.sensors[0]._i2c
+		addresses = []
+		address = _AVAILABLE_I2C_ADDRESS[0] + 1
+		while len(addresses) < count:
+			if address > 0x77:
+				raise ValueError("Not enough free I2C addresses for the sensors.")
+			if not qwiic_i2c.driverNames(address) and not i2c.isDeviceConnected(address):
+				addresses.append(address)
+			address += 1
+		return addresses
+
+	def begin(self, timeout_ms = 100):
+		"""!
+		Brings up the sensors one at a time, gives each its address and
+		loads the default configuration.
+
+		@param timeout_ms: How long to wait for each sensor to boot
+
+		@return **Bool** True if every sensor booted
+		"""
+		pins = self._xshut_pins
+		addresses = self._addresses
+
+		if pins is not None:
+			# Hold every sensor in shutdown, they all start at the same address
+			for pin in pins:
+				pin.value(0)
+			time.sleep(0.002)
+
+			if addresses is None:
+				# Keep them, so begin() can be called again
+				addresses = self._free_addresses(len(self.sensors))
+				self._addresses = addresses
+
+		if addresses is not None:
+			qwiic_i2c.registerDevice("QwiicVL53L1X", addresses, qwiic_i2c.kFastModePlus)
+
+		self.booted = 0
+		for i, sensor in enumerate(self.sensors):
+			self.range_status[i] = 255
+			if pins is not None:
+				pins[i].value(1)
+
+			start = ticks_ms()
+			booted = False
+			while not booted:
+				try:
+					booted = sensor.boot_state()
+				except OSError:
+					# Not answering while it's coming out of shutdown
+					pass
+				if not booted:
+					if ticks_diff(ticks_ms(), start) > timeout_ms:
+						break
+					time.sleep(0.002)
+
+			if not booted:
+				# Put it back in shutdown, so it can't answer at the default
+				# address the next sensor comes up at
+				if pins is not None:
+					pins[i].value(0)
+				continue
+
+			if addresses is not None and sensor.address != addresses[i]:
+				sensor.set_i2c_address(addresses[i])
+
+			sensor.sensor_init()
+			self.booted |= 1 << i
+
+		return self.booted == (1 << len(self.sensors)) - 1
+
+	def start_ranging(self, period_ms = None):
+		"""!
+		Starts the sensors that booted, spread evenly over one measurement
+		period.
+
+		@param period_ms: The inter-measurement period the sensors are set
+							to. If not provided, it's read from the first
+							sensor that booted.
+		"""
+		running = [i for i in range(len(self.sensors)) if self.booted & (1 << i)]
+		if not running:
+			return
+
+		if period_ms is None:
+			period_ms = self.sensors[running[0]].get_inter_measurement_in_ms()
+		# update() works in whole milliseconds
+		period_ms = int(period_ms)
+		self._period_ms = period_ms
+
+		stagger = period_ms / len(running)
+		for n, i in enumerate(running):
+			sensor = self.sensors[i]
+			if n:
+				time.sleep(stagger / 1000)
+			sensor.clear_interrupt()
+			sensor.start_ranging()
+			self._check_after[i] = ticks_ms()
+			self.range_status[i] = 255
+
+	def stop_ranging(self):
+		"""!
+		Stops the sensors that booted.
+		"""
+		for i, sensor in enumerate(self.sensors):
+			if self.booted & (1 << i):
+				sensor.stop_ranging()
+		self._period_ms = 0
+
+	def update(self):
+		"""!
+		Reads the sensors with a new result. Sensors read less than a
+		measurement period ago aren't polled.
+
+		@return **Integer** Bit mask of the sensors that were read, 0 if none
+		"""
+		period = self._period_ms
+		# Results can come a little early on the sensor's own clock
+		early = (period >> 3) + 1
+		result = self._result
+		booted = self.booted
+		updated = 0
+
+		for i, sensor in enumerate(self.sensors):
+			if not booted & (1 << i):
+				continue
+			now = ticks_ms()
+			if ticks_diff(now, self._check_after[i]) < 0:
+				continue
+			if not sensor.check_for_data_ready():
+				continue
+
+			sensor.read_result(result)
+			sensor.clear_interrupt()
+
+			self.range_status[i] = result[0]
+			self.distances[i] = result[1]
+			self.timestamps[i] = now
+			self._check_after[i] = ticks_add(now, period - early) if period > early else now
+			updated |= 1 << i
+
+		return updated
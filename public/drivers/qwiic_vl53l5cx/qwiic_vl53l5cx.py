@@ -50,6 +50,22 @@ New to Qwiic? Take a look at the entire [SparkFun Qwiic ecosystem](https://www.s
 import qwiic_i2c
 import time
 import os
+import math
+import struct
+from array import array
+
+try:
+    from time import ticks_us, ticks_diff, sleep_us
+except ImportError:
+    # Not MicroPython
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+    def sleep_us(us):
+        time.sleep(us / 1000000)
 
 # Define the device name and I2C addresses. These are set in the class defintion
 # as class variables, making them avilable without having to create a class
@@ -74,6 +90,10 @@ class RangingDataResults(object):
     If user wants more than 1 target per zone, the results can be split into 2 sub-groups:
     - Per zone results. These results are common to all targets (ambient_per_spad, nb_target_detected, and nb_spads_enabled).
     - Per target results: These results are different relative to the detected target (signal_per_spad, range_sigma_mm, distance_mm, reflectance, target_status).
+
+    The results are arrays, so one object can be passed to get_ranging_data() for
+    every frame without allocating new lists. In 4x4 mode only the first 16 zones
+    are updated.
     """
     # TODO: these constants are also contained in the main class below, might be better to
     # abandon this class completely and just pull all the variables into the main class
@@ -81,15 +101,16 @@ class RangingDataResults(object):
     kNbTartgetPerZone = 1
 
     def __init__(self):
-        self.ambient_per_spad = [0] * 64
-        self.ambient_per_spad = [0] * self.kResolution8x8
-        self.nb_target_detected = [0] * self.kResolution8x8  # Number of valid target detected for 1 zone
-        self.nb_spads_enabled = [0] * self.kResolution8x8  # Number of spads enabled for this ranging
-        self.signal_per_spad = [0] * (self.kResolution8x8 * self.kNbTartgetPerZone)  # Signal returned to the sensor in kcps/spads
-        self.range_sigma_mm = [0] * (self.kResolution8x8 * self.kNbTartgetPerZone)  # Sigma of the current distance in mm
-        self.distance_mm = [0] * (self.kResolution8x8 * self.kNbTartgetPerZone)  # Measured distance in mm
-        self.reflectance = [0] * (self.kResolution8x8 * self.kNbTartgetPerZone)  # Estimated reflectance in percent
-        self.target_status = [0] * (self.kResolution8x8 * self.kNbTartgetPerZone)  # Status indicating the measurement validity (5 & 9 means ranging OK)
+        zones = self.kResolution8x8
+        targets = self.kResolution8x8 * self.kNbTartgetPerZone
+        self.ambient_per_spad = array("I", bytes(4 * zones))
+        self.nb_target_detected = array("B", bytes(zones))  # Number of valid target detected for 1 zone
+        self.nb_spads_enabled = array("I", bytes(4 * zones))  # Number of spads enabled for this ranging
+        self.signal_per_spad = array("I", bytes(4 * targets))  # Signal returned to the sensor in kcps/spads
+        self.range_sigma_mm = array("H", bytes(2 * targets))  # Sigma of the current distance in mm
+        self.distance_mm = array("h", bytes(2 * targets))  # Measured distance in mm
+        self.reflectance = array("B", bytes(targets))  # Estimated reflectance in percent
+        self.target_status = array("B", bytes(targets))  # Status indicating the measurement validity (5 & 9 means ranging OK)
 
         # Motion Indicator Vars
         self.global_indicator_1 = 0
@@ -98,7 +119,107 @@ class RangingDataResults(object):
         self.nb_of_detected_aggregates = 0
         self.nb_of_aggregates = 0
         self.spare = 0
-        self.motion = [0] * 32
+        self.motion = array("I", bytes(4 * 32))
+
+        # Stream count of the frame, and the number of frames missed just before
+        # it (only counted by stream_frames())
+        self.stream_count = 0
+        self.frames_dropped = 0
+
+        # Number of zones in the frame (16 or 64), from the distance block
+        self.zones = 0
+
+class PointCloud(object):
+    """!
+    Class PointCloud projects the zone distances of a ranging frame to XYZ points.
+
+    Each zone looks along a fixed direction, so the directions are computed once
+    per resolution, as 14 bit fixed point unit vectors, and a frame only costs
+    three multiplies per zone. The table is rebuilt when a frame with a different
+    number of zones comes in, i.e. after set_resolution().
+
+    Points are in mm. z is along the sensor's axis, x grows with the zone column
+    and y grows towards the first row, in the zone order of the results. The
+    sensor's image is mirrored, flip x if the points are seen from behind it.
+    Distances are taken along each zone's direction.
+
+    @param float fov_deg: The sensor's field of view, horizontal and vertical
+    @param tuple valid_status: The target_status values of valid zones
+    """
+    kFovDeg = 45.0
+
+    def __init__(self, fov_deg = kFovDeg, valid_status = (5, 9)):
+        self.fov_deg = fov_deg
+        self.valid_status = valid_status
+
+        self._zones = 0
+        self._directions = array("h")
+
+        # x, y, z of each point, for the largest resolution
+        self.points = array("h", bytes(2 * 3 * 64))
+
+    def _build(self, zones):
+        width = 4 if zones == 16 else 8
+        step = math.radians(self.fov_deg) / width
+        center = (width - 1) / 2
+
+        directions = array("h", bytes(2 * 3 * zones))
+        for zone in range(zones):
+            tx = math.tan((zone % width - center) * step)
+            ty = math.tan((center - zone // width) * step)
+            norm = 16384 / math.sqrt(tx * tx + ty * ty + 1)
+            directions[3 * zone] = int(round(tx * norm))
+            directions[3 * zone + 1] = int(round(ty * norm))
+            directions[3 * zone + 2] = int(round(norm))
+
+        self._directions = directions
+        self._zones = zones
+
+    def project(self, data, out = None):
+        """!
+        Projects the zones with a valid target to points.
+
+        @param RangingDataResults data: The ranging frame, with distance_mm and target_status
+        @param array out: array('h') to write x, y, z of each point to, at least 3 values
+            per zone. If not provided, the points are written to self.points.
+
+        @return **int** The number of points. They're the first 3 * n values of the array.
+        """
+        if out is None:
+            out = self.points
+
+        zones = data.zones
+        if zones != self._zones:
+            self._build(zones)
+
+        directions = self._directions
+        distance = data.distance_mm
+        status = data.target_status
+        valid = self.valid_status
+
+        n = 0
+        for zone in range(zones):
+            if status[zone] not in valid:
+                continue
+            d = distance[zone]
+            i = 3 * zone
+            out[n] = (d * directions[i]) >> 14
+            out[n + 1] = (d * directions[i + 1]) >> 14
+            out[n + 2] = (d * directions[i + 2]) >> 14
+            n += 3
+
+        return n // 3
+
+# struct formats for the big endian arrays in a ranging frame, by element count
+_kFrameFormats = {}
+
+def _frame_format(count, code):
+    key = (count, code)
+    fmt = _kFrameFormats.get(key)
+    if fmt is None:
+        fmt = ">%d%s" % (count, code)
+        _kFrameFormats[key] = fmt
+    return fmt
 
 
 # Define the class that encapsulates the device being created. All information
@@ -188,6 +309,19 @@ class QwiicVL53L5CX(object):
     kTargetOrderClosest = 1
     kTargetOrderStrongest = 2
 
+    # Output blocks that can be enabled with set_outputs(). Only the enabled
+    # blocks are transferred and decoded, so fewer outputs make smaller frames.
+    kOutputAmbientPerSpad = 8
+    kOutputNbSpadsEnabled = 16
+    kOutputNbTargetDetected = 32
+    kOutputSignalPerSpad = 64
+    kOutputRangeSigmaMm = 128
+    kOutputDistanceMm = 256
+    kOutputReflectancePercent = 512
+    kOutputTargetStatus = 1024
+    kOutputMotionIndicator = 2048
+    kOutputAll = 0xFF8
+
     kNvmDataSize = 492
     kConfigurationSize = 972
     kOffsetBufferSize = 488
@@ -228,9 +362,23 @@ class QwiicVL53L5CX(object):
         self.xtalk_data = [0] * self.kXTalkDataSize
         self.temp_buffer = [0] * self.kTempBufferSize
 
+        # Preallocated receive buffer for the hot read paths (data ready checks and
+        # ranging frames) so they don't allocate on every call
+        self._rx_buffer = bytearray(self.kTempBufferSize)
+
         self.data_read_size = 0
         self.stream_count = 0
 
+        # Output blocks enabled by start_ranging()
+        self._outputs = self.kOutputAll
+
+        # Time between frames set with set_ranging_frequency_hz(), used to time
+        # the polling in stream_frames()
+        self._frame_period_us = None
+
+        # Frames missed by stream_frames() since start_ranging()
+        self.frames_dropped = 0
+
     def _check_if_exists(self, filename):
         """!
         Checks if a file or directory exists. Works on MicroPython and CircuitPython
@@ -301,10 +449,14 @@ class QwiicVL53L5CX(object):
         
         return True
 
-    def begin(self):
+    def begin(self, warm_boot = True):
         """!
         Initializes this device with default parameters
 
+        @param bool warm_boot: If the sensor is still running the firmware from an
+            earlier begin(), e.g. after the host was reset but the sensor wasn't power
+            cycled, skip the firmware upload and only restore the default configuration.
+
         @return **bool** Returns `True` if successful, otherwise `False`
         """
         # Confirm device is connected before doing anything
@@ -319,9 +471,47 @@ class QwiicVL53L5CX(object):
             return False
         
         # Contents of the "vl53l5cx_init" function in the cpp lib
-        pipe_ctrl = [self.kNbTargetPerZone, 0x00, 0x01, 0x00]
-        single_range = 0x01
+        status = self.kStatusOK
+
+        if not (warm_boot and self.is_firmware_loaded()):
+            status |= self._boot_firmware()
+
+        status |= self._load_default_configuration()
+        
+        return (status == self.kStatusOK)
+
+    def is_firmware_loaded(self, timeout_ms = 100):
+        """!
+        Checks if the sensor is still running the firmware uploaded by an earlier
+        begin(). A ranging session left running is stopped.
+
+        The check reads back the pipe control settings begin() writes. It only
+        gets an answer from the firmware, so it can't mistake a sensor that was
+        power cycled for a warm one.
+
+        @param int timeout_ms: How long to wait for the firmware to answer
+
+        @return **bool** `True` if the firmware is running, otherwise `False`
+        """
+        # The firmware doesn't take commands while it streams frames
+        buf = self._rx_buffer
+        self.rd_multi_into(self.address, 0x0, buf, 4)
+        if (buf[1] == 5) and (buf[2] & 0x5 == 0x5) and (buf[3] & 0x10 == 0x10):
+            if self.stop_ranging() != self.kStatusOK:
+                return False
+
+        pipe_ctrl = [0, 0, 0, 0]
+        if self.dci_read_data(pipe_ctrl, self.kDciPipeControl, 4, timeout_ms) != self.kStatusOK:
+            return False
+
+        return pipe_ctrl == [self.kNbTargetPerZone, 0x00, 0x01, 0x00]
 
+    def _boot_firmware(self):
+        """!
+        Reboots the sensor, uploads the firmware and waits for the MCU to boot it
+
+        @return **int** status: 0 if the firmware booted
+        """
         # Sw reboot sequence
         self.wr_byte(self.address, 0x7fff, 0x00)
         self.wr_byte(self.address, 0x0009, 0x04)
@@ -416,6 +606,20 @@ class QwiicVL53L5CX(object):
         status |= self.poll_for_answer(1, 0, 0x06, 0xff, 0x00)
         self.wr_byte(self.address, 0x7fff, 0x02)
 
+        return status
+
+    def _load_default_configuration(self):
+        """!
+        Reads the offset calibration from NVM and sends the default offset, xtalk and
+        configuration to the running firmware
+
+        @return **int** status: 0 if the configuration was accepted
+        """
+        pipe_ctrl = [self.kNbTargetPerZone, 0x00, 0x01, 0x00]
+        single_range = 0x01
+
+        status = self.kStatusOK
+
         # Get offset NVM data and store them into the offset buffer
         self.write_out_large_file(0x2fd8, 'get_nvm_cmd.bin', 0, self.kNvmCmdSize)
         status |= self.poll_for_answer(4, 0, self.kUiCmdStatus, 0xff, 0x02)
@@ -439,7 +643,7 @@ class QwiicVL53L5CX(object):
         
         status |= self.dci_write_data(self.uint32_list_to_byte_list([single_range]), self.kDciSingleRange, 4)
         
-        return (status == self.kStatusOK)
+        return status
     
 
     def swap_buffer(self, buffer, size):
@@ -453,7 +657,7 @@ class QwiicVL53L5CX(object):
             buffer[i], buffer[i+1], buffer[i+2], buffer[i+3] = buffer[i+3], buffer[i+2], buffer[i+1], buffer[i]
 
 
-    def poll_for_answer(self, size, pos, addr, mask, expected_value):
+    def poll_for_answer(self, size, pos, addr, mask, expected_value, timeout_ms = 2000):
         """!
         This function is used to wait for an answer from the VL53L5CX sensor.
 
@@ -462,6 +666,7 @@ class QwiicVL53L5CX(object):
         @param int address: The address to read from
         @param int mask: The mask to apply to the value read (at pos) before comparing to expected_value
         @param int expected_value: The value to compare against the value read (at pos)
+        @param int timeout_ms: How long to wait for the answer
 
         @return **int** kStatusOk on success, other on failure
         """
@@ -474,12 +679,14 @@ class QwiicVL53L5CX(object):
             self.temp_buffer[:size] = data
 
             time.sleep(0.010)
-            if timeout > 200: # 2s timeout
+            if timeout > timeout_ms // 10: # Polled every 10ms
                 status |= self.temp_buffer[2]
                 return status # TODO: cpp lib doesn't have this, but probably should so that we break out on timeout
             else:
                 if (size >= 4) and (self.temp_buffer[2] >= 0x7F):
+                    # The cpp lib breaks out here too, the answer won't come
                     status |= self.kMCUError
+                    return status
                 else:
                     timeout += 1
 
@@ -647,7 +854,7 @@ class QwiicVL53L5CX(object):
         
         return status
     
-    def dci_read_data(self, data, index, data_size):
+    def dci_read_data(self, data, index, data_size, timeout_ms = 2000):
         """!
             This function can be used to read 'extra data' from DCI. Using a known
             index, the function fills the casted structure passed in argument.
@@ -657,6 +864,7 @@ class QwiicVL53L5CX(object):
             only have a size of 32, 64, 96, 128, bits ....
             @param int index: Index of required value.
             @param int data_size: This field must be the structure or array size
+            @param int timeout_ms: How long to wait for the firmware to answer
 
             @return **int** status: 0 if OK
             """
@@ -678,7 +886,7 @@ class QwiicVL53L5CX(object):
 
             # Request data reading from FW
             self.wr_multi(self.address, self.kUiCmdEnd - 11, cmd)
-            status |= self.poll_for_answer(4, 1, self.kUiCmdStatus, 0xff, 0x03)
+            status |= self.poll_for_answer(4, 1, self.kUiCmdStatus, 0xff, 0x03, timeout_ms)
 
             # Read new data sent (4 bytes header + data_size + 8 bytes footer)
             self.temp_buffer[:rd_size] = self.rd_multi(self.address, self.kUiCmdStart, rd_size)
@@ -738,6 +946,7 @@ class QwiicVL53L5CX(object):
 
         self.wr_byte(self.address, 0x7fff, 0x00)
         self.wr_byte(self.address, 0x4, i2c_address)
+        self._i2c.invalidateScan(self.address)
         self.address = i2c_address
         self.wr_byte(self.address, 0x7fff, 0x02)
         return True
@@ -767,6 +976,9 @@ class QwiicVL53L5CX(object):
         status = self.kStatusOK
         status |= self.dci_replace_data(self.temp_buffer, self.kDciFreqHz, 4, [frequency_hz], 1, 0x01)
 
+        if status == self.kStatusOK and frequency_hz > 0:
+            self._frame_period_us = 1000000 // frequency_hz
+
         return status == self.kStatusOK
 
     def get_ranging_frequency_hz(self):
@@ -990,6 +1202,7 @@ class QwiicVL53L5CX(object):
         resolution = self.get_resolution()
         self.data_read_size = 0
         self.stream_count = 255
+        self.frames_dropped = 0
 
         output_bh_enable = [
             0x00000007,
@@ -1014,16 +1227,8 @@ class QwiicVL53L5CX(object):
             self.kMotionDetectBh
         ]
 
-        # Enable selected outputs
-        output_bh_enable[0] += 8    # VL53L5CX_ENABLE_AMBIENT_PER_SPAD
-        output_bh_enable[0] += 16   # VL53L5CX_ENABLE_NB_SPADS_ENABLED
-        output_bh_enable[0] += 32   # VL53L5CX_ENABLE_NB_TARGET_DETECTED
-        output_bh_enable[0] += 64   # VL53L5CX_ENABLE_SIGNAL_PER_SPAD
-        output_bh_enable[0] += 128  # VL53L5CX_ENABLE_RANGE_SIGMA_MM
-        output_bh_enable[0] += 256  # VL53L5CX_ENABLE_DISTANCE_MM
-        output_bh_enable[0] += 512  # VL53L5CX_ENABLE_REFLECTANCE_PERCENT
-        output_bh_enable[0] += 1024 # VL53L5CX_ENABLE_TARGET_STATUS
-        output_bh_enable[0] += 2048 # VL53L5CX_ENABLE_MOTION_INDICATOR
+        # Enable selected outputs, see set_outputs()
+        output_bh_enable[0] |= self._outputs
 
         # Send output addresses
         for i in range(len(output)):
@@ -1123,97 +1328,234 @@ class QwiicVL53L5CX(object):
         """
         
         # Check if new data is ready
-        self.temp_buffer[0:4] = self.rd_multi(self.address, 0x0, 4)
-
-        
-        if  (    (self.temp_buffer[0] != self.stream_count) 
-            and (self.temp_buffer[0] != 255) 
-            and (self.temp_buffer[1] == 5)
-            and (self.temp_buffer[2] & 0x5 == 0x5)
-            and (self.temp_buffer[3] & 0x10 == 0x10)
+        buf = self._rx_buffer
+        self.rd_multi_into(self.address, 0x0, buf, 4)
+
+        if  (    (buf[0] != self.stream_count) 
+            and (buf[0] != 255) 
+            and (buf[1] == 5)
+            and (buf[2] & 0x5 == 0x5)
+            and (buf[3] & 0x10 == 0x10)
         ): 
-            self.stream_count = self.temp_buffer[0]
+            self.stream_count = buf[0]
             return True
         
         else:
             return False
 
-    def get_ranging_data(self):
+    def get_ranging_data(self, data = None):
         """!
         This function gets the ranging data, using the selected output and the
         resolution.
 
+        The frame is decoded straight from the receive buffer. The sensor sends
+        it as big endian 32 bit words, so values are unpacked big endian and
+        bytes and 16 bit values are picked from their place in the word, and
+        every value is scaled as it's stored.
+
+        @param RangingDataResults data: Results object to fill in. Pass the same
+            object for every frame to avoid allocating one. If not provided, a new
+            one is created.
+
         @return **RangingDataResults** The ranging data
         """
-        status = self.kStatusOK
-        data = RangingDataResults()
+        if data is None:
+            data = RangingDataResults()
 
         # Get the data
-        self.temp_buffer[0:self.data_read_size] = self.rd_multi(self.address, 0x0, self.data_read_size)
-        self.stream_count = self.temp_buffer[0]
-        self.swap_buffer(self.temp_buffer, self.data_read_size)
+        buf = self._rx_buffer
+        size = self.data_read_size
+        self.rd_multi_into(self.address, 0x0, buf, size)
+        self.stream_count = buf[0]
+        data.stream_count = buf[0]
+
+        unpack_from = struct.unpack_from
         
         # Start conversion at position 16 to avoid headers
-        for i in range(16, self.data_read_size, 4):
-            block_header = self.byte_list_to_uint32(self.temp_buffer[i:i+4])
-            bh_ptr_type = (block_header & self.kBlockHeaderTypeMask) >> self.kBlockHeaderTypeShift
-            bh_ptr_size = (block_header & self.kBlockHeaderSizeMask) >> self.kBlockHeaderSizeShift
-            bh_ptr_idx = (block_header & self.kBlockHeaderIdxMask) >> self.kBlockHeaderIdxShift
+        i = 16
+        while i < size:
+            # Block header fields, from the big endian word
+            bh_ptr_type = buf[i + 3] & 0x0F
+            bh_ptr_size = (buf[i + 2] << 4) | (buf[i + 3] >> 4)
+            bh_ptr_idx = (buf[i] << 8) | buf[i + 1]
 
             if (bh_ptr_type > 0x01) and (bh_ptr_type < 0x0d):
                 msize = bh_ptr_type * bh_ptr_size
             else:
                 msize = bh_ptr_size
-            
-            # TODO: could optionally check the return of each of these functions to make sure they're successful
-            if bh_ptr_idx == self.kAmbientRateIdx:
-                self.byte_list_to_uint32_list(self.temp_buffer[i + 4:i + 4 + msize], data.ambient_per_spad)
-            elif bh_ptr_idx == self.kSpadCountIdx:
-                self.byte_list_to_uint32_list(self.temp_buffer[i + 4:i + 4 + msize], data.nb_spads_enabled)
+
+            # Per zone blocks have bh_ptr_size values. Byte values are reversed in
+            # their word (k ^ 3), and so are 16 bit values (k ^ 1).
+            n = bh_ptr_size
+            pos = i + 4
+            if bh_ptr_idx == self.kDistanceIdx:
+                data.zones = n // self.kNbTargetPerZone
+                values = unpack_from(_frame_format(n, "h"), buf, pos)
+                out = data.distance_mm
+                for k in range(n):
+                    value = values[k ^ 1]
+                    out[k] = value if value > 0 else 0
+            elif bh_ptr_idx == self.kTargetStatusIdx:
+                out = data.target_status
+                if self._outputs & self.kOutputNbTargetDetected:
+                    # nb_target_detected comes earlier in the frame
+                    detected = data.nb_target_detected
+                    for k in range(n):
+                        out[k] = buf[pos + (k ^ 3)] if detected[k // self.kNbTargetPerZone] else 255
+                else:
+                    for k in range(n):
+                        out[k] = buf[pos + (k ^ 3)]
             elif bh_ptr_idx == self.kNbTargetDetectedIdx:
-                data.nb_target_detected[0:msize] = self.temp_buffer[i + 4:i + 4 + msize]
+                out = data.nb_target_detected
+                for k in range(n):
+                    out[k] = buf[pos + (k ^ 3)]
+            elif bh_ptr_idx == self.kAmbientRateIdx:
+                values = unpack_from(_frame_format(n, "I"), buf, pos)
+                out = data.ambient_per_spad
+                for k in range(n):
+                    out[k] = values[k] >> 11
             elif bh_ptr_idx == self.kSignalRateIdx:
-                self.byte_list_to_uint32_list(self.temp_buffer[i + 4:i + 4 + msize], data.signal_per_spad)
+                values = unpack_from(_frame_format(n, "I"), buf, pos)
+                out = data.signal_per_spad
+                for k in range(n):
+                    out[k] = values[k] >> 11
             elif bh_ptr_idx == self.kRangeSigmaMmIdx:
-                self.byte_list_to_uint16_list(self.temp_buffer[i + 4:i + 4 + msize], data.range_sigma_mm)
-            elif bh_ptr_idx == self.kDistanceIdx:
-                self.byte_list_to_int16_list(self.temp_buffer[i + 4:i + 4 + msize], data.distance_mm)
+                values = unpack_from(_frame_format(n, "H"), buf, pos)
+                out = data.range_sigma_mm
+                for k in range(n):
+                    out[k] = values[k ^ 1] >> 7
+            elif bh_ptr_idx == self.kSpadCountIdx:
+                values = unpack_from(_frame_format(n, "I"), buf, pos)
+                out = data.nb_spads_enabled
+                for k in range(n):
+                    out[k] = values[k]
             elif bh_ptr_idx == self.kReflectanceEstPcIdx:
-                data.reflectance[0:msize] = self.temp_buffer[i + 4:i + 4 + msize]
-            elif bh_ptr_idx == self.kTargetStatusIdx:
-                data.target_status[0:msize] = self.temp_buffer[i + 4:i + 4 + msize]
+                out = data.reflectance
+                for k in range(n):
+                    out[k] = buf[pos + (k ^ 3)]
             elif bh_ptr_idx == self.kMotionDetectIdx:
                 # TODO: check endianness and packing here...
-                data.global_indicator_1 = self.byte_list_to_uint32(self.temp_buffer[i + 4:i + 4 + 4])
-                data.global_indicator_2 = self.byte_list_to_uint32(self.temp_buffer[i + 8:i + 8 + 4])
-                data.status = self.temp_buffer[i + 12]
-                data.nb_of_detected_aggregates = self.temp_buffer[i + 13]
-                data.nb_of_aggregates = self.temp_buffer[i + 14]
-                data.spare = self.temp_buffer[i + 15]
-                self.byte_list_to_uint32_list(self.temp_buffer[i + 16:i + 16 + 128], data.motion)
-
-            i += msize
-
-        # Convert data into their real format 
-        for i in range (self.kResolution8x8):
-            data.ambient_per_spad[i] = data.ambient_per_spad[i] // 2048
-        
-        for i in range (self.kResolution8x8 * self.kNbTargetPerZone):
-            if data.distance_mm[i] < 0:
-                data.distance_mm[i] = 0
-            data.range_sigma_mm[i] = data.range_sigma_mm[i] // 128
-            data.signal_per_spad[i] = data.signal_per_spad[i] // 2048
-        
-        for i in range (self.kResolution8x8):
-            if data.nb_target_detected[i] == 0:
-                for j in range (self.kNbTargetPerZone):
-                    data.target_status[i * self.kNbTargetPerZone + j] = 255
-
-        for i in range(32):
-            data.motion[i] = data.motion[i] // 65535
+                data.global_indicator_1, data.global_indicator_2 = unpack_from(">II", buf, pos)
+                data.status = buf[i + 15]
+                data.nb_of_detected_aggregates = buf[i + 14]
+                data.nb_of_aggregates = buf[i + 13]
+                data.spare = buf[i + 12]
+                values = unpack_from(_frame_format(32, "I"), buf, i + 16)
+                out = data.motion
+                for k in range(32):
+                    out[k] = values[k] // 65535
+
+            i += 4 + msize
 
         return data
     
+    def stream_frames(self, count = None, int_pin = None, pool_size = 2, timeout_ms = 2000):
+        """!
+        Generator yielding ranging frames as the sensor produces them. Call
+        start_ranging() first.
+
+        With an interrupt pin, the frame is read when the sensor pulls INT low,
+        so the bus is quiet between frames. Otherwise the sensor is polled around
+        the time the next frame is due, from the frequency set with
+        set_ranging_frequency_hz() and then the measured time between frames.
+
+        Frames are read into a pool of pool_size results objects, used in turn,
+        so the pool_size latest frames are valid together. A frame stays valid
+        while pool_size - 1 more frames are yielded, and is overwritten when the
+        generator resumes after that. Each frame is only yielded once, and its
+        frames_dropped is the number of frames the sensor produced since the
+        previous one that weren't read.
+
+        @param int count: Number of frames to yield, or None for no limit
+        @param Pin int_pin: machine.Pin connected to the sensor's INT pin, or None to poll
+        @param int pool_size: Number of results objects to use in turn
+        @param int timeout_ms: Stop if no frame arrives for this long
+
+        @return **RangingDataResults** Yields the frames
+        """
+        pool = [RangingDataResults() for _ in range(pool_size)]
+        timeout_us = timeout_ms * 1000
+
+        # Set by the interrupt handler
+        interrupted = [False]
+        if int_pin is not None:
+            def on_int(pin):
+                interrupted[0] = True
+            int_pin.irq(handler = on_int, trigger = int_pin.IRQ_FALLING)
+
+        period = self._frame_period_us
+        last_count = None
+        last_time = None
+        n = 0
+
+        try:
+            while count is None or n < count:
+                start = ticks_us()
+
+                if int_pin is not None:
+                    while not interrupted[0]:
+                        if ticks_diff(ticks_us(), start) > timeout_us:
+                            return
+                        sleep_us(500)
+                    interrupted[0] = False
+                else:
+                    # Sleep through most of the frame period, then poll
+                    if period is not None and last_time is not None:
+                        wait = period - period // 8 - ticks_diff(start, last_time)
+                        if wait > 0:
+                            sleep_us(wait)
+                    poll_us = max(period // 16, 1000) if period is not None else 2000
+                    while not self.check_data_ready():
+                        if ticks_diff(ticks_us(), start) > timeout_us:
+                            return
+                        sleep_us(poll_us)
+
+                now = ticks_us()
+                data = self.get_ranging_data(pool[n % pool_size])
+
+                # 255 means the sensor isn't ranging
+                if data.stream_count == last_count or data.stream_count == 255:
+                    continue
+
+                # The stream count wraps at 255
+                dropped = 0 if last_count is None else (data.stream_count - last_count - 1) % 255
+                data.frames_dropped = dropped
+                self.frames_dropped += dropped
+
+                # Follow the sensor's actual frame period
+                if last_time is not None:
+                    interval = ticks_diff(now, last_time) // (dropped + 1)
+                    period = interval if period is None else period + (interval - period) // 8
+
+                last_count = data.stream_count
+                last_time = now
+                n += 1
+                yield data
+        finally:
+            if int_pin is not None:
+                int_pin.irq(handler = None)
+
+    def stream_frames_to(self, callback, count = None, int_pin = None, pool_size = 2, timeout_ms = 2000):
+        """!
+        Calls a function with each ranging frame as the sensor produces them, see
+        stream_frames(). Call start_ranging() first.
+
+        @param function callback: Called with each RangingDataResults. Returning False stops the stream.
+        @param int count: Number of frames, or None for no limit
+        @param Pin int_pin: machine.Pin connected to the sensor's INT pin, or None to poll
+        @param int pool_size: Number of results objects to use in turn
+        @param int timeout_ms: Stop if no frame arrives for this long
+
+        @return **int** The number of frames handled
+        """
+        handled = 0
+        for data in self.stream_frames(count, int_pin, pool_size, timeout_ms):
+            handled += 1
+            if callback(data) is False:
+                break
+
+        return handled
+
     def get_power_mode(self):
         """!
             This function is used to get the current sensor power mode.
@@ -1366,6 +1708,38 @@ class QwiicVL53L5CX(object):
             status = self.kStatusInvalidParam
 
         return status
+
+    def set_outputs(self, outputs):
+        """!
+            This function selects the output blocks sent in each ranging frame. Only
+            the selected results are transferred and decoded, the others are left
+            unchanged in the RangingDataResults. Fewer outputs mean a shorter I2C read
+            per frame, e.g. distance and target status only are about a fifth of the
+            full 8x8 frame. It takes effect at the next start_ranging().
+
+            Zones without a target only get a target_status of 255 if
+            kOutputNbTargetDetected is selected.
+
+            @param int outputs: The outputs to enable, OR'd together from kOutputAmbientPerSpad,
+                kOutputNbSpadsEnabled, kOutputNbTargetDetected, kOutputSignalPerSpad,
+                kOutputRangeSigmaMm, kOutputDistanceMm, kOutputReflectancePercent,
+                kOutputTargetStatus and kOutputMotionIndicator. kOutputAll enables all of them.
+
+            @return **int** status: 0 if the outputs are OK, or 127 if unknown outputs are given.
+            """
+        if outputs & ~self.kOutputAll:
+            return self.kStatusInvalidParam
+
+        self._outputs = outputs
+        return self.kStatusOK
+
+    def get_outputs(self):
+        """!
+            This function gets the output blocks selected for the ranging frames.
+
+            @return **int** The selected outputs, see set_outputs().
+            """
+        return self._outputs
     
 
     def wr_multi(self, addr, reg, values, chunkSize = 30): # chunkSize of 30 lines up with 2 register bytes and the 32 byte limit from Arduino
@@ -1376,10 +1750,8 @@ class QwiicVL53L5CX(object):
             @param list values: The values to write to the register.
             """
         for i in range(0, len(values), chunkSize):
-            currentReg = reg + i
-            regToWrite = [(currentReg >> 8) & 0xff, currentReg & 0xff]
             endByte = min(i + chunkSize, len(values))
-            self._i2c.write_block(addr, regToWrite[0], regToWrite[1:] + values[i:endByte])
+            self._i2c.write_reg16(addr, reg + i, values[i:endByte])
 
     def rd_multi(self, addr, reg, numBytes, chunkSize = 32):
         """!
@@ -1387,22 +1759,24 @@ class QwiicVL53L5CX(object):
 
             @param int reg: The 16-bit register to read from.
             @param int numBytes: The number of bytes to read from the register.
-            @param int chunkSize: The max size of the chunks to read at a time.
+            @param int chunkSize: Unused, the read is always a single transaction. Kept for compatibility.
 
             @return **list** The values read from the register.
             """
 
-        bytesToWrite = [(reg >> 8) & 0xff, reg & 0xff]
-        self._i2c.write_byte(addr, bytesToWrite[0], bytesToWrite[1])
+        return list(self._i2c.read_reg16(addr, reg, numBytes))
+
+    def rd_multi_into(self, addr, reg, buf, numBytes):
+        """!
+            This function reads multiple bytes from a register straight into a preallocated
+            buffer in a single transaction. Enables 16 bit register address reads.
 
-        numRead = 0
-        data = [0] * numBytes
-        while numRead < numBytes:
-            tryRead = min(chunkSize, numBytes - numRead)
-            data[numRead:numRead + tryRead] = list(self._i2c.read_block(addr, None, tryRead))
-            numRead += tryRead
+            @param int reg: The 16-bit register to read from.
+            @param bytearray buf: The buffer to read into, starting at index 0.
+            @param int numBytes: The number of bytes to read from the register.
+            """
 
-        return data
+        self._i2c.read_reg16_into(addr, reg, buf, 0, numBytes)
 
     def wr_byte(self, addr, reg, value):
         """!
@@ -1411,8 +1785,7 @@ class QwiicVL53L5CX(object):
             @param int reg: The 16-bit register to write to.
             @param int value: The value to write to the register.
             """
-        bytesToWrite = [(reg >> 8) & 0xff, reg & 0xff, value]
-        self._i2c.write_block(addr, bytesToWrite[0], bytesToWrite[1:])
+        self._i2c.write_reg16(addr, reg, [value])
 
     def rd_byte(self, addr, reg):
         """!
@@ -1422,10 +1795,7 @@ class QwiicVL53L5CX(object):
 
             @return **int** The value read from the register.
             """
-        bytesToWrite = [(reg >> 8) & 0xff, reg & 0xff]
-        self._i2c.write_byte(addr, bytesToWrite[0], bytesToWrite[1])
-        # self._i2c.write_block(addr, bytes_to_write[0], bytes_to_write[1])
-        return self._i2c.read_byte(addr, None)
+        return self._i2c.read_reg16(addr, reg, 1)[0]
     
     def get_buffer_from_open_file(self, f, startByte = 0, endByte = None):
         """!
@@ -1477,27 +1847,42 @@ class QwiicVL53L5CX(object):
         with open(fName, 'rb') as f:
             return self.get_buffer_from_open_file(f, startByte, endByte)
     
-    # TODO: This could still use some optimization...
-    def write_out_large_file(self, reg, fileName, startByte = 0, size = 0, writeChunkSize = 31, readChunkSize = 4096):
+    def write_out_large_file(self, reg, fileName, startByte = 0, size = 0, writeChunkSize = None, readChunkSize = None):
         """!
             This function writes out a large buffer file to i2c bus. 
-            The function will write out the file in chunks of chunkSize bytes.
+            The file is read straight into the receive buffer and written out from
+            it in chunks of writeChunkSize bytes, so no lists are built.
 
             @param str fileName: The name of the file to write from
             fileName should be relative to the dataPath set in the constructor.
             @param int startByte: The start byte to write from the file.
             @param int size: How many bytes of the file to write.
-            @param int chunkSize: The size of the chunks to write out.
+            @param int writeChunkSize: The size of the chunks to write out. Defaults to
+                the largest write the I2C driver allows, up to the receive buffer size.
+            @param int readChunkSize: Unused, kept for compatibility.
             """
+        buf = memoryview(self._rx_buffer)
+        if writeChunkSize is None:
+            maxWriteSize = self._i2c.maxWriteSize
+            # Two bytes of each write are the register
+            writeChunkSize = len(buf) if maxWriteSize is None else maxWriteSize - 2
+        writeChunkSize = min(writeChunkSize, len(buf))
+        chunk = buf[:writeChunkSize]
+
         currentReg = reg
+        remaining = size
         
-        # Read files out in readChunkSize and write them out over i2c in writeChunkSize
         with open(self.get_absolute_data_path(fileName), 'rb') as f:
-            for readStart in range(startByte, startByte + size, readChunkSize):
-                endByte = min(readStart + readChunkSize, startByte + size)
-                data = self.get_buffer_from_open_file(f, readStart, endByte)
-                for writeStart in range(0, len(data), writeChunkSize):
-                    regToWrite = [(currentReg >> 8) & 0xff, currentReg & 0xff]
-                    endByte = min(writeStart + writeChunkSize, len(data))
-                    self._i2c.write_block(self.address, regToWrite[0], regToWrite[1:] + data[writeStart:endByte])
-                    currentReg += len(data[writeStart:endByte])
+            f.seek(startByte)
+            while remaining > 0:
+                if remaining < writeChunkSize:
+                    # Last chunk
+                    chunk = buf[:remaining]
+                nRead = f.readinto(chunk)
+                if not nRead:
+                    break
+                if nRead < len(chunk):
+                    chunk = chunk[:nRead]
+                self._i2c.write_reg16(self.address, currentReg, chunk)
+                currentReg += nRead
+                remaining -= nRead
@@ -1,6 +1,6 @@
 import { CommandToXRPMgr } from '@/managers/commandstoxrpmgr';
 import { Constants } from '@/utils/constants';
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import DialogFooter from './dialog-footer';
 import AppMgr, { EventType } from '@/managers/appmgr';
 import PluginMgr, { Plugin, PluginConfig } from '@/managers/pluginmgr';
@@ -17,6 +17,31 @@ interface Driver {
     hasInstalled?: boolean;
 }
 
+// records the version of each driver package installed on the XRP
+const DRIVER_VERSIONS_PATH = Constants.LIBDIR + 'driver_versions.json';
+
+/**
+ * isOlderVersion - Compare two dotted version strings
+ * @param installed - version on the XRP, undefined if it wasn't recorded
+ * @param available - version in the driver list
+ * @returns true if the installed version is older than the available one
+ */
+function isOlderVersion(installed: string | undefined, available: string): boolean {
+    // drivers installed before versions were recorded are treated as outdated
+    if (installed === undefined) {
+        return true;
+    }
+    const a = installed.split('.').map(Number);
+    const b = available.split('.').map(Number);
+    for (let i = 0; i < Math.max(a.length, b.length); i++) {
+        const diff = (a[i] ?? 0) - (b[i] ?? 0);
+        if (diff !== 0) {
+            return diff < 0;
+        }
+    }
+    return false;
+}
+
 interface XRPDriverInstallsProps {
     toggleDialog: () => void;
 }
@@ -30,6 +55,7 @@ interface XRPDriverInstallsProps {
 function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
     const { t } = useTranslation();
     const [drivers, setDrivers] = useState<Driver[]>([]);    
+    const installedVersions = useRef<Record<string, string>>({});
 
     useEffect(() => {
         // fetch the driver list from the public/drivers folder
@@ -40,6 +66,17 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
                     return;;
                 }
 
+                if (installedDrivers.includes(DRIVER_VERSIONS_PATH.substring(Constants.LIBDIR.length))) {
+                    await CommandToXRPMgr.getInstance().getFileContents(DRIVER_VERSIONS_PATH).then((content) => {
+                        const fileData: string = new TextDecoder().decode(new Uint8Array(content));
+                        try {
+                            installedVersions.current = JSON.parse(fileData);
+                        } catch (error) {
+                            console.error('Failed to read installed driver versions:', error);
+                        }
+                    });
+                }
+
                 try {
                     const response = await fetch('drivers/drivers.json');
                     if (!response.ok) {
@@ -89,17 +126,30 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
     }
 
 
+    /**
+     * recordVersion - Record the version of an installed driver package on the XRP
+     * @param name - driver name, as in the driver list
+     * @param version
+     */
+    const recordVersion = async (name: string, version: string) => {
+        installedVersions.current[name] = version;
+        await CommandToXRPMgr.getInstance().uploadFile(DRIVER_VERSIONS_PATH, JSON.stringify(installedVersions.current), false);
+    }
+
     /**
      * installDriver - Install a single driver by fetching its package.json and processing it
+     * @param name - driver name, as in the driver list
      * @param package
      */
-    const installDriver = async (packageStr: string) => {
+    const installDriver = async (name: string, packageStr: string) => {
         const packageData = JSON.parse(packageStr);
         console.log('Installing driver package:', packageData);
         // Here you would add the logic to install the driver using the package data
 
         if (packageData.urls) {
             AppMgr.getInstance().emit(EventType.EVENT_SHOWPROGRESS, Constants.SHOW_PROGRESS);                   
+            // the version is only recorded if every file made it to the XRP
+            let allUploaded = true;
             for (const url in packageData.urls) {
                 const fileUrl = packageData.urls[url];
                 await fetch(fileUrl[1])
@@ -113,6 +163,10 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
                         // upload the file to the XRP Robot
                         const path = Constants.LIBDIR + fileUrl[0];
                         AppMgr.getInstance().emit(EventType.EVENT_PROGRESS_ITEM, path);
+                        // uploadFile returns without uploading while the XRP is busy
+                        if (CommandToXRPMgr.getInstance().BUSY) {
+                            throw new Error('XRP is busy');
+                        }
                         await CommandToXRPMgr.getInstance().uploadFile(path, code, true).then(async () => {
                             const found = drivers.find(d => d.name === fileUrl[0]);
                             if (found) {
@@ -124,9 +178,13 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
                         });
                     })
                     .catch((error) => {
+                        allUploaded = false;
                         console.error('Failed to download driver file:', error);
                     });
             }
+            if (packageData.version && allUploaded) {
+                await recordVersion(name, packageData.version);
+            }
             toggleDialog();
         }
 
@@ -134,8 +192,10 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
         if (packageData.deps) {
             for (const dep in packageData.deps) {
                 const depUrl = packageData.deps[dep];
-                // check if the dependency is already installed
-                if (drivers.find(d => d.name === depUrl[0] && d.hasInstalled))
+                // check if the dependency is already installed and up to date, a
+                // driver can rely on features only in the latest version of it
+                const installed = drivers.find(d => d.name === depUrl[0] && d.hasInstalled);
+                if (installed && !isOlderVersion(installedVersions.current[installed.name], installed.version))
                     continue;
                 else {
                     if (depUrl[0].includes('.py') === false) {
@@ -152,7 +212,7 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
                         return response.text();
                     })
                     .then(async (json) => {
-                        await installDriver(json);
+                        await installDriver(depUrl[0], json);
                     })
                     .catch((error) => {
                         console.error('Failed to download dependency:', error);
@@ -191,7 +251,7 @@ function XRPDriverInstallDlg({toggleDialog}: XRPDriverInstallsProps) {
                         return response.text();
                     })
                     .then((json) => {
-                        installDriver(json);
+                        installDriver(driver.name, json);
                     })
                     .catch((error) => {
                         console.error('Failed to download driver:', error);